@@ -2,6 +2,9 @@
 ASGI config for backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP istekleri Django'ya, WebSocket bağlantıları görev olayları akışına
+(tasks.realtime) yönlendirilir. Görev okuma uçlarının async görünümleri
+(tasks.async_views) etkinleştirilir.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -12,5 +15,16 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# Sık okunan uçlar ASGI altında async görünümlerle karşılanır
+os.environ.setdefault('ASYNC_READS', 'true')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Uygulamalar yüklendikten sonra içe aktarılmalıdır
+from tasks.realtime import websocket_application  # noqa: E402
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'websocket':
+        return await websocket_application(scope, receive, send)
+    return await django_application(scope, receive, send)
@@ -1,70 +1,218 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
 from firebase_admin import auth
 from rest_framework import authentication
 from rest_framework import exceptions
 from django.contrib.auth import get_user_model
 from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .token_verifiers import get_verifier
 
 User = get_user_model()
 
+DEFAULT_FIREBASE_AUTH_SETTINGS = {
+    'TOKEN_CACHE_SIZE': 4096,  # Önbellekte tutulacak doğrulanmış token sayısı
+    'USER_CACHE_SIZE': 4096,
+    'USER_CACHE_TTL': 60,  # Saniye; diğer süreçlerdeki güncellemeler için üst sınır
+}
+
+
+def get_firebase_auth_settings():
+    """Varsayılan değerlerle birleştirilmiş FIREBASE_AUTH ayarlarını döndürür."""
+    config = dict(DEFAULT_FIREBASE_AUTH_SETTINGS)
+    config.update(getattr(settings, 'FIREBASE_AUTH', {}))
+    return config
+
+
+class ExpiringLRUCache:
+    """
+    Her kaydın kendi son kullanma zamanı olan, boyutu sınırlı LRU önbellek.
+    İş parçacıkları arasında güvenle paylaşılabilir.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at):
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_config = get_firebase_auth_settings()
+# Token özeti -> doğrulanmış token içeriği (token'ın 'exp' zamanına kadar)
+token_cache = ExpiringLRUCache(_config['TOKEN_CACHE_SIZE'])
+# Firebase UID -> User
+user_cache = ExpiringLRUCache(_config['USER_CACHE_SIZE'])
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def _invalidate_cached_user(sender, instance, **kwargs):
+    """Kullanıcı güncellendiğinde veya silindiğinde önbellekten çıkarır."""
+    if instance.firebase_uid:
+        user_cache.delete(instance.firebase_uid)
+
+
 class FirebaseAuthentication(authentication.BaseAuthentication):
     """
     Firebase Authentication için özel bir Django REST framework authentication sınıfı.
     Bu sınıf, gelen Firebase ID token'larını doğrular ve ilgili kullanıcıyı döndürür.
+
+    Doğrulanmış token'lar süreleri dolana kadar, kullanıcılar ise
+    USER_CACHE_TTL süresince bellekte tutulur; önbellek isabetinde
+    kimlik doğrulama bir sözlük aramasına iner.
     """
-    
+
     def authenticate(self, request):
         """
         Firebase ID token'ı doğrular ve ilgili kullanıcıyı döndürür.
         Token geçerli değilse veya kullanıcı bulunamazsa None döndürür.
         """
-        auth_header = request.META.get('HTTP_AUTHORIZATION')
-        if not auth_header:
+        id_token = self.get_token(request)
+        if not id_token:
             return None
-            
-        # "Bearer " prefix'ini kaldır
-        id_token = auth_header.split(' ').pop()
+
+        try:
+            # Firebase token'ını doğrula (önbellekte yoksa)
+            decoded_token = self.verify_token(id_token)
+            firebase_uid = self.get_uid(decoded_token)
+            user = user_cache.get(firebase_uid)
+            if user is None:
+                user = self.get_or_create_user(firebase_uid, decoded_token)
+                self.cache_user(firebase_uid, user)
+            # Önbellekteki nesne istekler arasında paylaşılmasın
+            return (copy.copy(user), None)
+        except Exception as e:
+            raise self.authentication_error(e)
+
+    async def aauthenticate(self, request):
+        """
+        authenticate'in async görünümler için sürümü. Token ve kullanıcı
+        önbellekteyse iş parçacığına geçilmeden döner; doğrulayıcı senkron
+        olduğundan token doğrulaması yalnızca ıskada iş parçacığında çalışır.
+        """
+        id_token = self.get_token(request)
         if not id_token:
             return None
-            
+
         try:
-            # Firebase token'ını doğrula
-            decoded_token = auth.verify_id_token(id_token)
-            
-            # Firebase UID'yi al
-            firebase_uid = decoded_token.get('uid')
-            if not firebase_uid:
-                raise exceptions.AuthenticationFailed('Firebase UID bulunamadı.')
-                
-            # Kullanıcıyı bul veya oluştur
-            try:
-                user = User.objects.get(firebase_uid=firebase_uid)
-            except User.DoesNotExist:
-                # Yeni kullanıcı oluştur
-                email = decoded_token.get('email', '')
-                display_name = decoded_token.get('name', '')
-                
-                user = User.objects.create(
-                    email=email,
-                    firebase_uid=firebase_uid,
-                    is_active=True
-                )
-                
-                if display_name:
-                    names = display_name.split(' ', 1)
-                    user.first_name = names[0]
-                    if len(names) > 1:
-                        user.last_name = names[1]
-                    user.save()
-                    
-            return (user, None)
-            
-        except auth.InvalidIdTokenError:
-            raise exceptions.AuthenticationFailed('Geçersiz ID token.')
-        except auth.ExpiredIdTokenError:
-            raise exceptions.AuthenticationFailed('Süresi dolmuş ID token.')
-        except auth.RevokedIdTokenError:
-            raise exceptions.AuthenticationFailed('İptal edilmiş ID token.')
-        except auth.CertificateFetchError:
-            raise exceptions.AuthenticationFailed('Firebase sertifikası alınamadı.')
+            decoded_token = token_cache.get(self.token_key(id_token))
+            if decoded_token is None:
+                decoded_token = await sync_to_async(self.verify_token)(id_token)
+            firebase_uid = self.get_uid(decoded_token)
+            user = user_cache.get(firebase_uid)
+            if user is None:
+                user = await self.aget_or_create_user(firebase_uid, decoded_token)
+                self.cache_user(firebase_uid, user)
+            return (copy.copy(user), None)
         except Exception as e:
-            raise exceptions.AuthenticationFailed(f'Kimlik doğrulama hatası: {str(e)}') 
\ No newline at end of file
+            raise self.authentication_error(e)
+
+    def get_token(self, request):
+        """Authorization başlığındaki token ("Bearer " öneki atılarak)."""
+        auth_header = request.META.get('HTTP_AUTHORIZATION')
+        if not auth_header:
+            return None
+        return auth_header.split(' ').pop()
+
+    def get_uid(self, decoded_token):
+        firebase_uid = decoded_token.get('uid')
+        if not firebase_uid:
+            raise exceptions.AuthenticationFailed('Firebase UID bulunamadı.')
+        return firebase_uid
+
+    def cache_user(self, firebase_uid, user):
+        user_cache.set(
+            firebase_uid,
+            user,
+            time.time() + get_firebase_auth_settings()['USER_CACHE_TTL']
+        )
+
+    def authentication_error(self, error):
+        """Doğrulama sırasında oluşan hatayı AuthenticationFailed'e çevirir."""
+        if isinstance(error, exceptions.AuthenticationFailed):
+            return error
+        if isinstance(error, auth.InvalidIdTokenError):
+            return exceptions.AuthenticationFailed('Geçersiz ID token.')
+        if isinstance(error, auth.ExpiredIdTokenError):
+            return exceptions.AuthenticationFailed('Süresi dolmuş ID token.')
+        if isinstance(error, auth.RevokedIdTokenError):
+            return exceptions.AuthenticationFailed('İptal edilmiş ID token.')
+        if isinstance(error, auth.CertificateFetchError):
+            return exceptions.AuthenticationFailed('Firebase sertifikası alınamadı.')
+        return exceptions.AuthenticationFailed(f'Kimlik doğrulama hatası: {str(error)}')
+
+    def token_key(self, id_token):
+        return hashlib.sha256(id_token.encode('utf-8')).digest()
+
+    def verify_token(self, id_token):
+        """
+        Token'ı doğrular; sonuç token'ın 'exp' zamanına kadar önbellekte tutulur.
+        """
+        key = self.token_key(id_token)
+        decoded_token = token_cache.get(key)
+        if decoded_token is None:
+            decoded_token = get_verifier().verify(id_token)
+            token_cache.set(key, decoded_token, decoded_token.get('exp', 0))
+        return decoded_token
+
+    async def aget_or_create_user(self, firebase_uid, decoded_token):
+        try:
+            return await User.objects.aget(firebase_uid=firebase_uid)
+        except User.DoesNotExist:
+            return await sync_to_async(self.get_or_create_user)(firebase_uid, decoded_token)
+
+    def get_or_create_user(self, firebase_uid, decoded_token):
+        """Firebase UID'ye ait kullanıcıyı bulur veya oluşturur."""
+        try:
+            return User.objects.get(firebase_uid=firebase_uid)
+        except User.DoesNotExist:
+            # Yeni kullanıcı oluştur
+            email = decoded_token.get('email', '')
+            display_name = decoded_token.get('name', '')
+
+            user = User.objects.create(
+                email=email,
+                firebase_uid=firebase_uid,
+                is_active=True
+            )
+
+            if display_name:
+                names = display_name.split(' ', 1)
+                user.first_name = names[0]
+                if len(names) > 1:
+                    user.last_name = names[1]
+                user.save()
+            return user
@@ -53,9 +53,11 @@ INSTALLED_APPS = [
     # Third party apps
     'rest_framework',
     'corsheaders',
+    'django_filters',
     
     # Local apps
     'users.apps.UsersConfig',
+    'tasks.apps.TasksConfig',
 ]
 
 MIDDLEWARE = [
@@ -173,5 +175,116 @@ FIREBASE_CONFIG = {
     'measurementId': 'your-measurement-id',
 }
 
+# Önbellekler; birden çok süreçle çalışırken yanıt önbelleği için
+# django.core.cache.backends.filebased.FileBasedCache veya Redis kullanılmalıdır
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'responses': {
+        'BACKEND': os.environ.get('RESPONSE_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('RESPONSE_CACHE_LOCATION', 'responses'),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
+# Kullanıcı başına okuma yanıtı önbelleği (bkz. tasks.response_cache)
+RESPONSE_CACHE = {
+    'ENABLED': True,
+    'CACHE': 'responses',
+    'TIMEOUT': 300,  # Saniye; geçersiz kılma sürüm belirteciyle yapılır
+}
+
+# Delta senkronizasyonu (/api/tasks/sync/)
+SYNC = {
+    'PAGE_SIZE': 500,  # Yanıt başına en fazla değişiklik kaydı
+    'RETENTION_DAYS': 90,  # prune_change_log bu süreden eski kayıtları siler
+}
+
+# Hatırlatma ve bitiş tarihi zamanlayıcısı (python manage.py run_reminders)
+REMINDERS = {
+    # Varsayılan gönderici hatırlatmaları standart çıktıya yazar
+    'SENDER': os.environ.get('REMINDER_SENDER', 'tasks.reminders.ConsoleSender'),
+    'LOOKAHEAD': 600,  # Saniye; belleğe alınan gelecek penceresi
+    'POLL_INTERVAL': 5,  # Saniye; görev düzenlemelerinin en geç fark edilme süresi
+    'GRACE': 3600,  # Saniye; yeniden başlatmada bu kadar geriye kadar kaçırılanlar gönderilir
+    'BATCH_SIZE': 500,
+}
+
+# Görev durum bildirimleri (python manage.py dispatch_notifications)
+NOTIFICATIONS = {
+    # 'tasks.notifications.FCMSender' Firebase Cloud Messaging ile gönderir
+    'SENDER': os.environ.get('NOTIFICATION_SENDER', 'tasks.notifications.ConsoleSender'),
+    'COALESCE_WINDOW': 30,  # Saniye; bu süredeki değişiklikler tek bildirimde birleşir
+    'BATCH_SIZE': 500,
+    'MAX_ATTEMPTS': 5,
+    'BACKOFF': 30,  # Saniye; her başarısız denemede iki katına çıkar
+    'MAX_BACKOFF': 3600,  # Saniye
+    'POLL_INTERVAL': 2,  # Saniye
+}
+
+# Verimlilik analizi (GET /api/tasks/analytics/). Günlük özetler
+# rollup_productivity komutuyla saatlik/gecelik yeniden hesaplanır
+ANALYTICS = {
+    'DEFAULT_DAYS': 30,  # Aralık verilmezse bugünle biten gün sayısı
+    'MAX_DAYS': 1830,  # Tek sorguda istenebilecek en fazla gün (~5 yıl)
+    'ROLLUP_CHUNK_DAYS': 31,
+}
+
+# Görevlerin AI alanlarını dolduran zenginleştirme hattı (python manage.py run_enrichment)
+ENRICHMENT = {
+    # Varsayılan yerel istemci ağa çıkmaz; üretimde 'tasks.enrichment.GeminiClient'
+    'CLIENT': os.environ.get('ENRICHMENT_CLIENT', 'tasks.enrichment.StubClient'),
+    'MODEL': os.environ.get('GEMINI_MODEL', 'gemini-1.5-flash'),
+    'API_KEY': os.environ.get('GEMINI_API_KEY', ''),
+    'BATCH_SIZE': 20,  # Tek istekteki en fazla görev
+    'MAX_PROMPT_CHARS': 12000,
+    'CONCURRENCY': 4,  # Aynı anda gönderilen istek
+    'TIMEOUT': 60,  # Saniye
+    'POLL_INTERVAL': 10,  # Saniye; düzenlenen görevlerin en geç işlenme süresi
+}
+
+# Anlık görev olayları: WebSocket (/ws/tasks/) ve SSE (/api/tasks/events/)
+REALTIME = {
+    # Varsayılan yayıncı yalnızca aynı süreçteki bağlantılara iletir
+    'BROKER': os.environ.get('REALTIME_BROKER', 'tasks.realtime.InProcessBroker'),
+    'QUEUE_SIZE': 100,  # Bağlantı başına bekleyen en fazla olay; aşılırsa istemci sync yapar
+    'HEARTBEAT': 25,  # Saniye
+    'WEBSOCKET_PATH': '/ws/tasks/',
+}
+
+# Görev listesi/detayı, my_tasks ve kategori listesinin async görünümleri
+# (bkz. tasks.async_views). backend/asgi.py ASYNC_READS'i varsayılan olarak açar;
+# WSGI altında her async görünüm ayrı bir olay döngüsünde çalışacağından kapalıdır
+ASYNC_READS = {
+    'ENABLED': os.environ.get('ASYNC_READS', 'false').lower() in ('1', 'true', 'yes'),
+}
+
+# Firebase ID token doğrulama önbelleği
+FIREBASE_AUTH = {
+    'TOKEN_CACHE_SIZE': 4096,  # Süresi dolana kadar tutulan doğrulanmış token sayısı
+    'USER_CACHE_SIZE': 4096,  # Firebase UID -> kullanıcı eşlemesi
+    'USER_CACHE_TTL': 60,  # Saniye
+    # Token doğrulayıcı: Firebase Admin SDK veya yerel anahtarlarla süreç içi RS256 doğrulaması
+    'VERIFIER': os.environ.get('FIREBASE_TOKEN_VERIFIER', 'backend.token_verifiers.FirebaseAdminVerifier'),
+    # 'backend.token_verifiers.LocalKeyVerifier' için:
+    'PROJECT_ID': os.environ.get('FIREBASE_PROJECT_ID', FIREBASE_CONFIG['projectId']),
+    'JWKS_URL': 'https://www.googleapis.com/service_accounts/v1/jwk/securetoken@system.gserviceaccount.com',
+    'JWKS_FILE': os.environ.get('FIREBASE_JWKS_FILE'),  # Verilirse anahtarlar bu dosyadan okunur
+}
+
 # Custom user model
 AUTH_USER_MODEL = 'users.User'
+
+# Ses tanıma (Whisper) ayarları
+TRANSCRIPTION = {
+    'MODEL': os.environ.get('WHISPER_MODEL', 'small'),  # tiny, base, small, medium, large
+    'POOL_SIZE': int(os.environ.get('WHISPER_POOL_SIZE', 1)),  # Modeli bellekte tutan işçi süreç sayısı
+    'JOB_TIMEOUT': int(os.environ.get('WHISPER_JOB_TIMEOUT', 300)),  # Saniye
+    'JOB_WORKERS': int(os.environ.get('TRANSCRIPTION_JOB_WORKERS', 2)),  # Asenkron işleri çalıştıran iş parçacığı sayısı
+    'JOB_STALE_SECONDS': 900,  # Bu süreden uzun bekleyen/çalışan işler requeue_transcription_jobs ile yeniden çalıştırılır
+    'CACHE_DIR': os.path.join(BASE_DIR, 'transcript_cache'),  # Ses özetine göre saklanan transkriptler
+    'CACHE_MAX_BYTES': 50 * 1024 * 1024,  # Önbellek boyut bütçesi (LRU ile silinir)
+    'STREAM_SEGMENT_SECONDS': 30,  # Akış modunda bölüt uzunluğu
+    'MAX_IN_MEMORY_BYTES': 25 * 1024 * 1024,  # Bu boyutun üstündeki sesler geçici dosyaya yazılır
+}
@@ -0,0 +1,236 @@
+"""
+Firebase ID token doğrulayıcıları.
+
+FirebaseAdminVerifier, doğrulamayı Firebase Admin SDK'ya bırakır.
+LocalKeyVerifier ise RS256 imzalarını yerel olarak tutulan açık anahtarlarla
+süreç içinde doğrular; anahtarlar bir dosyadan veya önbelleğe alınmış bir
+JWKS adresinden yüklenir ve arka planda yenilenir.
+"""
+import json
+import re
+import threading
+import time
+
+import jwt
+import requests
+from cryptography.x509 import load_pem_x509_certificate
+from django.conf import settings
+from django.utils.module_loading import import_string
+from firebase_admin import auth
+
+GOOGLE_JWKS_URL = (
+    'https://www.googleapis.com/service_accounts/v1/jwk/'
+    'securetoken@system.gserviceaccount.com'
+)
+
+
+class FirebaseAdminVerifier:
+    """Token'ları Firebase Admin SDK ile doğrular (varsayılan)."""
+
+    @classmethod
+    def from_settings(cls, config):
+        return cls()
+
+    def verify(self, id_token):
+        return auth.verify_id_token(id_token)
+
+
+def _parse_keys(data):
+    """
+    JWKS ({"keys": [...]}) veya Google'ın {kid: PEM sertifika} biçimindeki
+    anahtar kümesini {kid: açık anahtar} sözlüğüne çevirir.
+    """
+    if 'keys' in data:
+        return {
+            jwk['kid']: jwt.PyJWK.from_dict(jwk, algorithm='RS256').key
+            for jwk in data['keys']
+            if jwk.get('kty') == 'RSA' and 'kid' in jwk
+        }
+    return {
+        kid: load_pem_x509_certificate(cert.encode('utf-8')).public_key()
+        for kid, cert in data.items()
+    }
+
+
+def _max_age(cache_control):
+    match = re.search(r'max-age=(\d+)', cache_control or '')
+    return int(match.group(1)) if match else None
+
+
+class KeyStore:
+    """
+    İmza anahtarlarını bellekte tutan ve süresi yaklaşınca arka planda
+    yenileyen anahtar deposu.
+
+    Kaynak bir dosya yolu ya da JWKS adresi olabilir. Adresten alınan
+    anahtarların ömrü Cache-Control max-age başlığına göre belirlenir.
+    Yenileme sürerken veya başarısız olursa eski (stale) anahtarlarla
+    hizmet verilmeye devam edilir.
+    """
+
+    def __init__(self, url=None, path=None, default_max_age=3600,
+                 refresh_margin=300, retry_interval=30, timeout=10):
+        if not url and not path:
+            raise ValueError('Anahtar kaynağı (url veya path) belirtilmelidir.')
+        self.url = url
+        self.path = path
+        self.default_max_age = default_max_age
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self.timeout = timeout
+        self._keys = {}
+        self._next_attempt = 0
+        # Bilinmeyen kid ile zorla yenilemenin en erken zamanı
+        self._next_forced_attempt = 0
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def _fetch(self):
+        """Anahtarları kaynaktan okur; (anahtarlar, geçerlilik süresi) döndürür."""
+        if self.path:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return _parse_keys(json.load(f)), self.default_max_age
+        response = requests.get(self.url, timeout=self.timeout)
+        response.raise_for_status()
+        max_age = _max_age(response.headers.get('Cache-Control'))
+        return _parse_keys(response.json()), max_age or self.default_max_age
+
+    def refresh(self):
+        """Anahtarları eşzamanlı olarak yeniler; hata olursa eski anahtarlar korunur."""
+        try:
+            keys, max_age = self._fetch()
+        except Exception:
+            with self._lock:
+                self._next_attempt = time.time() + self.retry_interval
+                self._next_forced_attempt = self._next_attempt
+            raise
+        with self._lock:
+            self._keys = keys
+            self._next_attempt = time.time() + max(max_age - self.refresh_margin, 0)
+            self._next_forced_attempt = time.time() + self.retry_interval
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            except Exception:
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=run, name='firebase-key-refresh', daemon=True).start()
+
+    def _refresh_for_unknown_kid(self):
+        """
+        Anahtar değişiminden (rotation) sonra yeni kid ile gelen token'lar
+        için anahtarları bir kez eşzamanlı yeniler. Geçersiz kid'li
+        token'ların kaynağa istek yağdırmaması için en fazla retry_interval'da
+        bir denenir; hata olursa eski anahtarlar korunur.
+        """
+        with self._lock:
+            now = time.time()
+            if now < self._next_forced_attempt:
+                return
+            self._next_forced_attempt = now + self.retry_interval
+        try:
+            self.refresh()
+        except Exception:
+            pass
+
+    def get_key(self, kid):
+        """
+        kid'e ait açık anahtarı döndürür. Hiç anahtar yoksa veya kid
+        bilinmiyorsa eşzamanlı, yenileme zamanı geldiyse arka planda yeniler.
+        """
+        if not self._keys:
+            if time.time() < self._next_attempt:
+                raise auth.CertificateFetchError('İmza anahtarları alınamadı.', cause=None)
+            try:
+                self.refresh()
+            except Exception as e:
+                raise auth.CertificateFetchError(
+                    f'İmza anahtarları alınamadı: {e}', cause=e
+                )
+        elif time.time() >= self._next_attempt:
+            # Yenileme sürerken eski anahtarlarla hizmet verilmeye devam edilir
+            self._refresh_in_background()
+        if kid not in self._keys:
+            self._refresh_for_unknown_kid()
+        return self._keys.get(kid)
+
+
+class LocalKeyVerifier:
+    """
+    Firebase ID token'larını RS256 imzası ve Firebase kurallarıyla
+    (aud, iss, sub, exp, iat) tamamen süreç içinde doğrular.
+    """
+
+    def __init__(self, project_id, key_store, leeway=0):
+        self.project_id = project_id
+        self.key_store = key_store
+        self.leeway = leeway
+
+    @classmethod
+    def from_settings(cls, config):
+        key_store = KeyStore(
+            url=None if config.get('JWKS_FILE') else config.get('JWKS_URL', GOOGLE_JWKS_URL),
+            path=config.get('JWKS_FILE'),
+        )
+        return cls(config['PROJECT_ID'], key_store)
+
+    def verify(self, id_token):
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except jwt.PyJWTError as e:
+            raise auth.InvalidIdTokenError(f'Token başlığı okunamadı: {e}', cause=e)
+        if header.get('alg') != 'RS256':
+            raise auth.InvalidIdTokenError('Token RS256 ile imzalanmamış.')
+
+        key = self.key_store.get_key(header.get('kid'))
+        if key is None:
+            raise auth.InvalidIdTokenError('Token imza anahtarı (kid) bulunamadı.')
+
+        try:
+            claims = jwt.decode(
+                id_token,
+                key,
+                algorithms=['RS256'],
+                audience=self.project_id,
+                issuer=f'https://securetoken.google.com/{self.project_id}',
+                leeway=self.leeway,
+                options={'require': ['exp', 'iat', 'sub']},
+            )
+        except jwt.ExpiredSignatureError as e:
+            raise auth.ExpiredIdTokenError('Token süresi dolmuş.', cause=e)
+        except jwt.PyJWTError as e:
+            raise auth.InvalidIdTokenError(f'Geçersiz token: {e}', cause=e)
+
+        if not claims['sub'] or len(claims['sub']) > 128:
+            raise auth.InvalidIdTokenError('Token "sub" alanı geçersiz.')
+        if claims.get('auth_time', 0) > time.time() + self.leeway:
+            raise auth.InvalidIdTokenError('Token "auth_time" alanı gelecekte.')
+        claims['uid'] = claims['sub']
+        return claims
+
+
+_verifier = None
+_verifier_lock = threading.Lock()
+
+
+def get_verifier():
+    """FIREBASE_AUTH['VERIFIER'] ayarındaki doğrulayıcıyı (tek örnek) döndürür."""
+    global _verifier
+    with _verifier_lock:
+        if _verifier is None:
+            config = getattr(settings, 'FIREBASE_AUTH', {})
+            verifier_class = import_string(
+                config.get('VERIFIER', 'backend.token_verifiers.FirebaseAdminVerifier')
+            )
+            _verifier = verifier_class.from_settings(config)
+        return _verifier
@@ -34,6 +34,11 @@ def welcome(request):
                 'profile': '/api/users/me/',
                 'email_verification': '/api/users/verify_email/',
                 'password_reset': '/api/users/reset_password/',
+                'tasks': '/api/tasks/',
+                'task_events': '/api/tasks/events/',
+                'categories': '/api/categories/',
+                'tags': '/api/tags/',
+                'voice_to_text': '/api/voice-to-text/',
             }
         }
     })
@@ -42,4 +47,5 @@ urlpatterns = [
     path('', welcome, name='welcome'),  # Ana sayfa
     path('admin/', admin.site.urls),
     path('api/users/', include('users.urls')),
+    path('api/', include('tasks.urls')),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tasks'
+
+    def ready(self):
+        # Arama dizinini güncel tutan sinyal alıcıları
+        from . import search  # noqa: F401
+        # Senkronizasyon günlüğünü yazan ve yanıt önbelleğini geçersiz kılan
+        # sinyal alıcıları
+        from . import changes  # noqa: F401
@@ -0,0 +1,205 @@
+"""
+Sık okunan uçların async görünümleri.
+
+Görev listesi, görev detayı, my_tasks ve kategori listesi GET istekleri
+Django'nun async ORM'iyle (acount, aget, aiterator) yanıtlanır; ASGI altında
+istek veritabanını beklerken bir iş parçacığını tutmaz. Sorgular,
+filtreler, seyrek alanlar, sayfalama, ETag/Last-Modified ve yanıt önbelleği
+aynı ViewSet'ten gelir; yanıtlar senkron görünümlerle birebir aynıdır ve
+önbelleği onlarla paylaşır.
+
+ViewSet'in izin ve sınırlama (throttle) sınıfları senkron görünümdeki gibi
+denetlenir; hata yanıtları (403, 404, 429) burada üretilir. Yazma istekleri,
+doğrulaması veritabanı sorgusu gerektiren filtreler (category, tags), JSON
+dışı gösterimler, kimliği doğrulanamayan istekler ve veritabanı sorgulayan
+izin/sınırlama sınıfları router'ın senkron görünümüne devredilir; sınırlama
+uygulandıktan sonra devredilen istek ikinci kez sayılmaz (ThrottleOnceMixin).
+Uçlar ASYNC_READS ayarıyla etkinleşir; backend/asgi.py bunu varsayılan olarak açar.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import (
+    ObjectDoesNotExist, SynchronousOnlyOperation, ValidationError as DjangoValidationError
+)
+from django.core.paginator import InvalidPage
+from django.http import Http404, HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from .conditional import atask_validators
+from .models import Task
+from .response_cache import acache_response
+from .views import CategoryViewSet, TaskViewSet
+
+DEFAULT_ASYNC_READ_SETTINGS = {
+    'ENABLED': False,
+}
+
+# Doğrulaması veritabanı sorgusu gerektiren veya DRF'e özgü parametreler
+FALLBACK_PARAMS = ('category', 'tags', 'format')
+
+
+def get_async_read_settings():
+    """Varsayılan değerlerle birleştirilmiş ASYNC_READS ayarlarını döndürür."""
+    config = dict(DEFAULT_ASYNC_READ_SETTINGS)
+    config.update(getattr(settings, 'ASYNC_READS', {}))
+    return config
+
+
+class Fallback(Exception):
+    """İstek senkron görünüme devredilmelidir."""
+
+
+async def aauthenticate(request):
+    """
+    İsteği REST framework'ün kimlik doğrulama sınıflarıyla doğrular.
+    aauthenticate tanımlayan sınıflar (FirebaseAuthentication) doğrudan,
+    oturum kimliği request.auser() ile, diğerleri iş parçacığında çalışır.
+    Kullanıcıyı veya None döndürür.
+    """
+    for authenticator in (cls() for cls in api_settings.DEFAULT_AUTHENTICATION_CLASSES):
+        if hasattr(authenticator, 'aauthenticate'):
+            result = await authenticator.aauthenticate(request)
+        elif isinstance(authenticator, SessionAuthentication):
+            # Yalnızca GET istekleri karşılandığından CSRF denetimi gerekmez
+            user = await request.auser()
+            result = (user, None) if user.is_active else None
+        else:
+            result = await sync_to_async(authenticator.authenticate)(Request(request))
+        if result is not None:
+            return result[0]
+    return None
+
+
+def _render(view, request, data):
+    renderer = request.accepted_renderer
+    response = HttpResponse(
+        renderer.render(data, request.accepted_media_type, {'view': view, 'request': request}),
+        content_type=request.accepted_media_type,
+    )
+    for name, value in view.default_response_headers.items():
+        if name == 'Vary':
+            patch_vary_headers(response, [value])
+        else:
+            response[name] = value
+    return response
+
+
+async def _serve(request, kwargs, viewset_class, action, build, validators=None):
+    if request.method != 'GET' or any(name in request.GET for name in FALLBACK_PARAMS):
+        raise Fallback()
+    user = await aauthenticate(request)
+    if user is None:
+        raise Fallback()
+
+    view = viewset_class(action_map={'get': action}, args=(), kwargs=kwargs, format_kwarg=None)
+    drf_request = view.initialize_request(request, **kwargs)
+    drf_request.user = user
+    view.request = drf_request
+    view.headers = view.default_response_headers
+    renderer, media_type = view.perform_content_negotiation(drf_request)
+    if not isinstance(renderer, JSONRenderer):
+        raise Fallback()
+    drf_request.accepted_renderer, drf_request.accepted_media_type = renderer, media_type
+    try:
+        # APIView.initial() ile aynı denetimler
+        view.check_permissions(drf_request)
+        view.check_throttles(drf_request)
+        # Bundan sonra senkron görünüme devredilen istek yeniden sayılmaz
+        request.throttles_checked = True
+
+        return await acache_response(
+            drf_request,
+            build=lambda: build(view, drf_request),
+            render=lambda data: _render(view, drf_request, data),
+            validators=validators and (lambda variant: validators(view, variant)),
+        )
+    except (APIException, Http404) as exc:
+        # Hata yanıtı senkron görünümdeki gibi burada üretilir
+        return view.finalize_response(drf_request, view.handle_exception(exc)).render()
+
+
+def async_read(viewset_class, action, build, validators=None):
+    """
+    build(view, request) ile yanıt verisini üreten async görünüm; sync_view
+    devredilecek router görünümüdür.
+    """
+    def factory(sync_view):
+        @csrf_exempt
+        async def view(request, **kwargs):
+            try:
+                return await _serve(request, kwargs, viewset_class, action, build, validators)
+            except (Fallback, APIException, DjangoValidationError, ObjectDoesNotExist, SynchronousOnlyOperation):
+                # Kimlik doğrulama hataları, desteklenmeyen istekler ve
+                # veritabanı sorgulayan izin/sınırlama sınıfları senkron
+                # görünümle birebir aynı biçimde işlenir
+                return await sync_to_async(sync_view)(request, **kwargs)
+        return view
+    return factory
+
+
+async def _task_validators(view, variant):
+    try:
+        tasks, total = view.get_validator_querysets()
+    except DjangoValidationError:
+        return None, None
+    return await atask_validators(tasks, variant, total)
+
+
+async def _task_page(view, request, tasks):
+    tasks = view.filter_queryset(tasks.with_details(view.get_requested_fields()))
+    page = await view.paginator.apaginate_queryset(tasks, request, view=view)
+    return view.get_paginated_response(view.get_serializer(page, many=True).data).data
+
+
+async def _task_list(view, request):
+    return await _task_page(view, request, Task.objects.visible_to(request.user))
+
+
+async def _my_tasks(view, request):
+    return await _task_page(view, request, Task.objects.filter(assigned_to=request.user))
+
+
+async def _task_detail(view, request):
+    # GenericAPIView.get_object ile aynı 404 yanıtları
+    try:
+        task = await view.filter_queryset(view.get_queryset()).aget(pk=view.kwargs['pk'])
+    except (TypeError, ValueError, DjangoValidationError):
+        raise Http404
+    except Task.DoesNotExist:
+        raise Http404(f'No {Task._meta.object_name} matches the given query.')
+    view.check_object_permissions(request, task)
+    return view.get_serializer(task).data
+
+
+async def _apaginate_page_number(paginator, queryset, request, view):
+    """PageNumberPagination.paginate_queryset'in async ORM'le çalışan karşılığı."""
+    page_size = paginator.get_page_size(request)
+    django_paginator = paginator.django_paginator_class(queryset, page_size)
+    django_paginator.count = await queryset.acount()
+    page_number = paginator.get_page_number(request, django_paginator)
+    try:
+        page = django_paginator.page(page_number)
+    except InvalidPage as exc:
+        raise NotFound(paginator.invalid_page_message.format(page_number=page_number, message=str(exc)))
+    page.object_list = [item async for item in page.object_list]
+    paginator.page = page
+    paginator.request = request
+    return list(page)
+
+
+async def _category_list(view, request):
+    categories = view.filter_queryset(view.get_queryset())
+    page = await _apaginate_page_number(view.paginator, categories, request, view)
+    return view.get_paginated_response(view.get_serializer(page, many=True).data).data
+
+
+task_list = async_read(TaskViewSet, 'list', _task_list, _task_validators)
+my_tasks = async_read(TaskViewSet, 'my_tasks', _my_tasks, _task_validators)
+task_detail = async_read(TaskViewSet, 'retrieve', _task_detail, _task_validators)
+category_list = async_read(CategoryViewSet, 'list', _category_list)
@@ -0,0 +1,225 @@
+"""
+Ses çözümleme ve bölütleme yardımcıları.
+
+Whisper 16 kHz, tek kanallı float32 PCM bekler. Yüklenen ses, eşik altındaysa
+diske hiç yazılmadan ffmpeg'e boru (pipe) ile verilip bellekte çözülür. Uzun
+kayıtlar, kelimeleri ortadan bölmemek için hedef sınırın yakınındaki en
+sessiz noktadan kesilerek bölütlere (segment) ayrılır. Akış modunda ses
+ffmpeg çıktısı geldikçe parça parça okunur (stream_upload) ve her bölüt kesim
+noktası belli olur olmaz üretilir (split_stream).
+"""
+import os
+import tempfile
+import threading
+
+import ffmpeg
+import numpy as np
+from django.core.files.uploadhandler import MemoryFileUploadHandler
+
+SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.02
+
+
+def load_audio(path):
+    """Ses dosyasını ffmpeg ile 16 kHz mono float32 PCM dizisine çözer."""
+    try:
+        out, _ = (
+            ffmpeg.input(path, threads=0)
+            .output('-', format='s16le', acodec='pcm_s16le', ac=1, ar=SAMPLE_RATE)
+            .run(cmd='ffmpeg', capture_stdout=True, capture_stderr=True)
+        )
+    except ffmpeg.Error as e:
+        raise RuntimeError(f'Ses çözümlenemedi: {e.stderr.decode(errors="ignore")}') from e
+    return pcm16_to_float(out)
+
+
+def decode_audio_bytes(data):
+    """Bellekteki ses baytlarını ffmpeg'e boru ile verip PCM dizisine çözer."""
+    try:
+        out, _ = (
+            ffmpeg.input('pipe:', threads=0)
+            .output('-', format='s16le', acodec='pcm_s16le', ac=1, ar=SAMPLE_RATE)
+            .run(cmd='ffmpeg', input=data, capture_stdout=True, capture_stderr=True)
+        )
+    except ffmpeg.Error as e:
+        raise RuntimeError(f'Ses çözümlenemedi: {e.stderr.decode(errors="ignore")}') from e
+    return pcm16_to_float(out)
+
+
+def _start_decoder(source, pipe_stdin):
+    return (
+        ffmpeg.input(source, threads=0)
+        .output('-', format='s16le', acodec='pcm_s16le', ac=1, ar=SAMPLE_RATE)
+        .run_async(cmd='ffmpeg', pipe_stdin=pipe_stdin, pipe_stdout=True, pipe_stderr=True)
+    )
+
+
+def _feed(stream, chunks):
+    try:
+        for chunk in chunks:
+            stream.write(chunk)
+        stream.close()
+    except (BrokenPipeError, ValueError):
+        # ffmpeg erken çıktı; hata çıkış koduyla bildirilir
+        pass
+
+
+def stream_pcm(source, chunks=None, chunk_seconds=1):
+    """
+    Ses dosyasını (veya chunks verilirse boruya yazılan baytları) ffmpeg ile
+    çözer ve PCM'i ffmpeg ürettikçe yaklaşık chunk_seconds uzunluğunda
+    parçalar halinde döndürür. Borular tıkanmasın diye girdi ve hata çıktısı
+    ayrı iş parçacıklarında işlenir; üreteç erken kapatılırsa ffmpeg
+    sonlandırılır.
+    """
+    process = _start_decoder(source, pipe_stdin=chunks is not None)
+    stderr = []
+    threads = [threading.Thread(target=lambda: stderr.append(process.stderr.read()), daemon=True)]
+    if chunks is not None:
+        threads.append(threading.Thread(target=_feed, args=(process.stdin, chunks), daemon=True))
+    for thread in threads:
+        thread.start()
+    chunk_bytes = int(chunk_seconds * SAMPLE_RATE) * 2
+    try:
+        while True:
+            data = process.stdout.read(chunk_bytes)
+            if not data:
+                break
+            yield pcm16_to_float(data)
+        process.wait()
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        for thread in threads:
+            thread.join()
+        process.stdout.close()
+        process.stderr.close()
+    if process.returncode != 0:
+        raise RuntimeError(f'Ses çözümlenemedi: {b"".join(stderr).decode(errors="ignore")}')
+
+
+def _write_temp_file(uploaded_file):
+    suffix = os.path.splitext(uploaded_file.name or '')[1] or '.wav'
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+        for chunk in uploaded_file.chunks():
+            temp_file.write(chunk)
+        return temp_file.name
+
+
+def _decode_via_temp_file(uploaded_file):
+    temp_file_path = _write_temp_file(uploaded_file)
+    try:
+        return load_audio(temp_file_path)
+    finally:
+        os.unlink(temp_file_path)
+
+
+def decode_upload(uploaded_file, max_in_memory_bytes):
+    """
+    Yüklenen dosyayı PCM dizisine çözer.
+
+    Django dosyayı zaten diske aldıysa o yol kullanılır. Eşik altındaki
+    dosyalar bellekte çözülür; boru üzerinden çözülemeyen biçimler (ör.
+    moov atomu sonda olan m4a) ve eşik üstündeki dosyalar için geçici
+    dosyaya düşülür.
+    """
+    if hasattr(uploaded_file, 'temporary_file_path'):
+        return load_audio(uploaded_file.temporary_file_path())
+    if uploaded_file.size <= max_in_memory_bytes:
+        buffer = bytearray()
+        for chunk in uploaded_file.chunks():
+            buffer += chunk
+        try:
+            return decode_audio_bytes(buffer)
+        except RuntimeError:
+            pass
+    return _decode_via_temp_file(uploaded_file)
+
+
+def stream_upload(uploaded_file, max_in_memory_bytes):
+    """
+    decode_upload'un akış sürümü: PCM parçalarını ffmpeg ürettikçe döndürür.
+    Boru üzerinden çözülemeyen biçimler, henüz çıktı üretilmediyse geçici
+    dosyadan yeniden çözülür.
+    """
+    if hasattr(uploaded_file, 'temporary_file_path'):
+        yield from stream_pcm(uploaded_file.temporary_file_path())
+        return
+    if uploaded_file.size <= max_in_memory_bytes:
+        started = False
+        try:
+            for chunk in stream_pcm('pipe:', uploaded_file.chunks()):
+                started = True
+                yield chunk
+            return
+        except RuntimeError:
+            if started:
+                raise
+    temp_file_path = _write_temp_file(uploaded_file)
+    try:
+        yield from stream_pcm(temp_file_path)
+    finally:
+        os.unlink(temp_file_path)
+
+
+class InMemoryAudioUploadHandler(MemoryFileUploadHandler):
+    """
+    Belirtilen boyuta kadar olan yüklemeleri bellekte tutan upload handler.
+    Django'nun genel FILE_UPLOAD_MAX_MEMORY_SIZE değerini değiştirmeden
+    yalnızca ses uç noktalarında eşiği yükseltir.
+    """
+
+    def __init__(self, max_in_memory_bytes, request=None):
+        super().__init__(request)
+        self.max_in_memory_bytes = max_in_memory_bytes
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        self.activated = content_length <= self.max_in_memory_bytes
+
+
+def pcm16_to_float(data):
+    """16 bit işaretli PCM baytlarını [-1, 1] aralığında float32 diziye çevirir."""
+    return np.frombuffer(data, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def _quietest_frame(audio, start, end):
+    """[start, end) aralığındaki en düşük enerjili çerçevenin başlangıcını döndürür."""
+    frame = int(SAMPLE_RATE * FRAME_SECONDS)
+    window = audio[start:end]
+    count = len(window) // frame
+    if count == 0:
+        return start
+    energy = np.square(window[:count * frame].reshape(count, frame)).mean(axis=1)
+    return start + int(np.argmin(energy)) * frame
+
+
+def split_segments(audio, segment_seconds=30, search_seconds=2):
+    """
+    PCM dizisini yaklaşık segment_seconds uzunluğunda bölütlere ayırır.
+
+    Her kesim, hedef sınırın search_seconds öncesindeki en sessiz çerçeveye
+    kaydırılır (basit enerji tabanlı VAD). (başlangıç_sn, bitiş_sn, dizi)
+    üçlülerini sırayla üretir.
+    """
+    return split_stream([audio], segment_seconds, search_seconds)
+
+
+def split_stream(chunks, segment_seconds=30, search_seconds=2):
+    """
+    split_segments'in parça parça gelen PCM için karşılığı. Bir bölüt,
+    sesin tamamı beklenmeden kesim noktası belli olur olmaz (hedef sınırın
+    ötesinde ses geldiğinde) üretilir; sonuç split_segments ile aynıdır.
+    """
+    segment = int(segment_seconds * SAMPLE_RATE)
+    search = min(int(search_seconds * SAMPLE_RATE), segment // 2)
+    buffer = np.zeros(0, dtype=np.float32)
+    offset = 0
+    for chunk in chunks:
+        buffer = np.concatenate((buffer, chunk)) if len(buffer) else chunk
+        while len(buffer) > segment:
+            end = _quietest_frame(buffer, segment - search, segment)
+            yield offset / SAMPLE_RATE, (offset + end) / SAMPLE_RATE, buffer[:end]
+            buffer, offset = buffer[end:], offset + end
+    if len(buffer):
+        yield offset / SAMPLE_RATE, (offset + len(buffer)) / SAMPLE_RATE, buffer
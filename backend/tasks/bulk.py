@@ -0,0 +1,231 @@
+"""
+Toplu görev işlemleri.
+
+İşlemler önce toplu olarak doğrulanır (ilişkili kategori, etiket ve
+kullanıcılar model başına tek sorguda yüklenir), ardından geçerli olanlar tek
+transaction içinde bulk_create / bulk_update / tek DELETE ile uygulanır.
+Geçersiz işlemler atlanır ve sonuçta hatalarıyla raporlanır.
+"""
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+from .models import Task
+from .changes import tasks_saved
+from .search import INDEXED_FIELDS, index_tasks
+from .serializers import TaskSerializer
+
+OPERATIONS = ('create', 'update', 'status', 'delete')
+
+
+class CachedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    İlişkili nesneyi serializer bağlamındaki 'related_objects' önbelleğinden
+    çözer; önbellek yoksa normal PrimaryKeyRelatedField gibi davranır.
+    """
+
+    def to_internal_value(self, data):
+        cache = self.context.get('related_objects', {}).get(self.get_queryset().model)
+        if cache is None:
+            return super().to_internal_value(data)
+        try:
+            obj = cache.get(self.get_queryset().model._meta.pk.to_python(data))
+        except (DjangoValidationError, TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if obj is None:
+            self.fail('does_not_exist', pk_value=data)
+        return obj
+
+
+class BulkTaskSerializer(TaskSerializer):
+    """Toplu işlemlerde ilişkileri önbellekten çözen görev serializer'ı."""
+    serializer_related_field = CachedPrimaryKeyRelatedField
+
+
+class BulkOperationSerializer(serializers.Serializer):
+    """Tek bir toplu işlemin biçimi."""
+    op = serializers.ChoiceField(choices=OPERATIONS)
+    id = serializers.UUIDField(required=False)
+    data = serializers.DictField(required=False, default=dict)
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+
+    def validate(self, attrs):
+        if attrs['op'] != 'create' and not attrs.get('id'):
+            raise serializers.ValidationError({'id': _('Bu işlem için görev id gereklidir.')})
+        if attrs['op'] == 'status' and not attrs.get('status'):
+            raise serializers.ValidationError({'status': _('Yeni durum belirtilmelidir.')})
+        return attrs
+
+
+def _related_fields(serializer):
+    """Serializer'daki önbelleğe alınabilen ilişki alanları: {ad: alan}."""
+    related = {}
+    for name, field in serializer.fields.items():
+        if field.read_only:
+            continue
+        child = getattr(field, 'child_relation', field)
+        if isinstance(child, CachedPrimaryKeyRelatedField):
+            related[name] = child
+    return related
+
+
+def load_related_objects(operations, context):
+    """İşlemlerde geçen ilişkili nesneleri model başına tek sorguda yükler."""
+    fields = _related_fields(BulkTaskSerializer(context=context))
+    wanted = {}
+    for operation in operations:
+        for name, field in fields.items():
+            value = operation['data'].get(name)
+            if value in (None, ''):
+                continue
+            values = value if isinstance(value, list) else [value]
+            pk_field = field.get_queryset().model._meta.pk
+            for item in values:
+                try:
+                    wanted.setdefault(field, set()).add(pk_field.to_python(item))
+                except (DjangoValidationError, TypeError, ValueError):
+                    pass  # Hata doğrulama sırasında ilgili işleme yazılır
+
+    related_objects = {}
+    for field, pks in wanted.items():
+        queryset = field.get_queryset()
+        related_objects.setdefault(queryset.model, {}).update(
+            (obj.pk, obj) for obj in queryset.filter(pk__in=pks)
+        )
+    # Hiç değer geçmeyen modeller için de boş önbellek: ek sorgu yapılmaz
+    for field in fields.values():
+        related_objects.setdefault(field.get_queryset().model, {})
+    return related_objects
+
+
+class BulkTaskProcessor:
+    """
+    Bir kullanıcının toplu işlem listesini doğrular ve uygular.
+
+    Sonuçlar istek sırasıyla döner: {'index', 'op', 'id', 'success'} ve
+    başarısız işlemler için 'errors'.
+    """
+
+    def __init__(self, user, request=None):
+        self.user = user
+        self.context = {'request': request}
+
+    def run(self, operations):
+        results = [None] * len(operations)
+        parsed = []
+        for index, raw in enumerate(operations):
+            operation = BulkOperationSerializer(data=raw)
+            if operation.is_valid():
+                parsed.append((index, operation.validated_data))
+            else:
+                results[index] = self._error(index, raw, operation.errors)
+
+        self.context['related_objects'] = load_related_objects(
+            [operation for _, operation in parsed], self.context
+        )
+        ids = {operation['id'] for _, operation in parsed if operation.get('id')}
+        tasks = {task.pk: task for task in Task.objects.visible_to(self.user).filter(pk__in=ids)}
+
+        created, changed, tag_changes, deleted = [], {}, {}, set()
+        now = timezone.now()
+        for index, operation in parsed:
+            op = operation['op']
+            task = tasks.get(operation.get('id'))
+            if op != 'create' and (task is None or task.pk in deleted):
+                results[index] = self._error(
+                    index, operation, {'id': [_('Görev bulunamadı.')]}
+                )
+                continue
+
+            if op == 'delete':
+                deleted.add(task.pk)
+                changed.pop(task.pk, None)
+                tag_changes.pop(task.pk, None)
+            elif op == 'status':
+                if task.status == operation['status']:
+                    # Görev zaten hedef durumda; tamamlanma zamanı ve
+                    # updated_at değişmez (bkz. mark_complete)
+                    results[index] = {'index': index, 'op': op, 'id': str(task.pk), 'success': True}
+                    continue
+                task.status = operation['status']
+                fields = {'status', 'updated_at'}
+                if task.status == 'done':
+                    task.completed_at = now
+                    fields.add('completed_at')
+                task.updated_at = now
+                changed.setdefault(task.pk, (task, set()))[1].update(fields)
+            else:
+                serializer = BulkTaskSerializer(
+                    task, data=operation['data'], partial=op == 'update', context=self.context
+                )
+                if not serializer.is_valid():
+                    results[index] = self._error(index, operation, serializer.errors)
+                    continue
+                data = dict(serializer.validated_data)
+                tags = data.pop('tags', None)
+                if op == 'create':
+                    task = Task(created_by=self.user, **data)
+                    created.append(task)
+                else:
+                    for name, value in data.items():
+                        setattr(task, name, value)
+                    task.updated_at = now
+                    changed.setdefault(task.pk, (task, set()))[1].update(
+                        {*data, 'updated_at'}
+                    )
+                if tags is not None:
+                    tag_changes[task.pk] = tags
+
+            results[index] = {'index': index, 'op': op, 'id': str(task.pk), 'success': True}
+
+        self._apply(created, list(changed.values()), tag_changes, deleted)
+        return results
+
+    def _apply(self, created, changed, tag_changes, deleted):
+        """Biriken değişiklikleri tek transaction'da uygular."""
+        with transaction.atomic():
+            if created:
+                Task.objects.bulk_create(created)
+            # Yalnızca değişen alanlar yazılır; aynı alan kümesine sahip
+            # görevler (ör. sürüklenen kartlar) tek UPDATE ile güncellenir
+            groups = {}
+            for task, fields in changed:
+                groups.setdefault(frozenset(fields), []).append(task)
+            for fields, tasks in groups.items():
+                Task.objects.bulk_update(tasks, sorted(fields))
+            if tag_changes:
+                through = Task.tags.through
+                through.objects.filter(task_id__in=tag_changes).delete()
+                through.objects.bulk_create(
+                    through(task_id=task_id, tag_id=tag.pk)
+                    for task_id, tags in tag_changes.items()
+                    for tag in tags
+                )
+            if deleted:
+                Task.objects.filter(pk__in=deleted).delete()
+
+            # bulk_* işlemleri post_save göndermez; arama dizini burada güncellenir
+            reindex = created + [
+                task for task, fields in changed if fields & set(INDEXED_FIELDS)
+            ]
+            if reindex:
+                index_tasks(reindex)
+            # Silinen görevler post_delete ile, diğerleri burada senkronizasyon
+            # günlüğüne yazılır ve önbellekten düşürülür
+            if created:
+                tasks_saved(created, created=True)
+            if changed:
+                tasks_saved([task for task, fields in changed])
+
+    def _error(self, index, operation, errors):
+        op = operation.get('op') if isinstance(operation, dict) else None
+        task_id = operation.get('id') if isinstance(operation, dict) else None
+        return {
+            'index': index,
+            'op': op,
+            'id': str(task_id) if task_id else None,
+            'success': False,
+            'errors': errors,
+        }
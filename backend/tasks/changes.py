@@ -0,0 +1,363 @@
+"""
+Görev, alt görev ve yorum değişikliklerinin yayılması.
+
+Her değişiklikte nesneyi gören kullanıcılar bir kez hesaplanır; bu
+kullanıcılar için senkronizasyon günlüğüne (ChangeLogEntry) satır eklenir ve
+yanıt önbellekleri geçersiz kılınır. Nesneyi artık göremeyen eski sahipler
+(ör. görev başkasına atandığında) silme kaydı (tombstone) alır. Model
+sinyalleri kaydetme/silme yollarını karşılar; sinyal göndermeyen toplu ve
+koşullu güncellemeler tasks_saved / task_updated ile bildirilir.
+
+Görev durum değişiklikleri, yeni yorumlar ve tamamlanan alt görevler ayrıca
+bağlı istemcilere anlık olarak yayınlanır (bkz. tasks.realtime). Durum
+değişiklikleri bildirim kuyruğuna da aynı transaction'da yazılır (bkz.
+tasks.notifications); kullanıcıların pano sayaçları eski ve yeni katkının
+farkı kadar güncellenir (bkz. tasks.stats).
+
+Not: cursor otomatik artan id'dir. Eşzamanlı yazan transaction'ların
+id'leri commit sırasıyla artmayabilir (PostgreSQL); SQLite yazmaları
+sıraya koyduğundan bu durum oluşmaz.
+"""
+import threading
+from collections import namedtuple
+
+from django.conf import settings
+from django.db.models import Max
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Category, ChangeLogEntry, Subtask, Tag, Task, TaskComment
+from .notifications import enqueue_status_changes
+from .realtime import publish
+from .response_cache import invalidate_users
+from .stats import STATS_FIELDS, StatsDelta, loaded_task_values, remove_category, task_values
+
+DEFAULT_SYNC_SETTINGS = {
+    'PAGE_SIZE': 500,
+    'RETENTION_DAYS': 90,
+}
+
+ChangeFeed = namedtuple('ChangeFeed', ['cursor', 'has_more', 'objects'])
+
+
+def get_sync_settings():
+    """Varsayılan değerlerle birleştirilmiş SYNC ayarlarını döndürür."""
+    config = dict(DEFAULT_SYNC_SETTINGS)
+    config.update(getattr(settings, 'SYNC', {}))
+    return config
+
+
+class ChangeSet:
+    """
+    Birlikte yazılacak günlük satırları, geçersiz kılınacak kullanıcılar,
+    yayınlanacak anlık olaylar, kuyruğa yazılacak durum bildirimleri ve
+    pano sayacı farkları.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.user_ids = set()
+        self.events = []
+        self.status_changes = []
+        self.stats = StatsDelta()
+
+    def add(self, model, object_id, action, visible, previous=()):
+        visible = {user_id for user_id in visible if user_id is not None}
+        for user_id in visible:
+            self.entries[(user_id, model, object_id)] = action
+        for user_id in set(previous) - visible:
+            if user_id is not None:
+                self.entries[(user_id, model, object_id)] = 'delete'
+        self.user_ids |= visible
+        self.user_ids.update(previous)
+
+    def add_tasks(self, rows):
+        """Gösterimi değişen görevler: (id, oluşturan, atanan) satırları."""
+        for task_id, created_by_id, assigned_to_id in rows:
+            self.add('task', task_id, 'update', (created_by_id, assigned_to_id))
+
+    def notify(self, user_ids, event):
+        self.events.append((user_ids, event))
+
+    def status_changed(self, user_ids, task_id, status):
+        self.notify(user_ids, {'type': 'task.status', 'task': str(task_id), 'status': status})
+        self.status_changes.append((user_ids, task_id, status))
+
+    def commit(self):
+        # Silinmekte olan kullanıcılara, görevleriyle birlikte silinirken
+        # yeni satır yazılmaz
+        deleting = _deleting_users()
+        entries = [
+            ChangeLogEntry(user_id=user_id, model=model, object_id=object_id, action=action)
+            for (user_id, model, object_id), action in self.entries.items()
+            if user_id not in deleting
+        ]
+        if entries:
+            ChangeLogEntry.objects.bulk_create(entries)
+        if self.status_changes:
+            enqueue_status_changes(
+                (set(user_ids) - deleting, task_id, status)
+                for user_ids, task_id, status in self.status_changes
+            )
+        self.stats.apply(exclude=deleting)
+        invalidate_users(self.user_ids)
+        for user_ids, event in self.events:
+            publish(user_ids, event)
+
+
+_deleting = threading.local()
+
+
+def _deleting_users():
+    return getattr(_deleting, 'user_ids', frozenset())
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def _user_deleting(sender, instance, **kwargs):
+    _deleting.user_ids = _deleting_users() | {instance.pk}
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def _user_deleted(sender, instance, **kwargs):
+    _deleting.user_ids = _deleting_users() - {instance.pk}
+
+
+def _task_owner_rows(tasks):
+    return tasks.order_by().values_list('pk', 'created_by_id', 'assigned_to_id')
+
+
+def _add_tasks(changes, tasks, action):
+    category_ids = set()
+    for task in tasks:
+        loaded = getattr(task, '_loaded_values', {})
+        owners = (task.created_by_id, task.assigned_to_id)
+        previous_owners = (loaded.get('created_by_id'), loaded.get('assigned_to_id'))
+        changes.add('task', task.pk, action, owners, previous_owners)
+        previous = loaded_task_values(task)
+        if action == 'create':
+            changes.stats.add(owners, task_values(task))
+        elif action == 'delete':
+            changes.stats.add(previous_owners if previous else owners, previous or task_values(task), -1)
+        elif previous is not None:
+            # Yüklenmeden kaydedilen görevin eski katkısı bilinmez; sayaçlar
+            # rebuild_task_stats ile düzeltilir
+            changes.stats.change(previous_owners, previous, owners, task_values(task))
+        if action == 'update' and loaded.get('status') not in (None, task.status):
+            changes.status_changed(owners, task.pk, task.status)
+        # Kategorilerin görev sayıları yalnızca ekleme, silme veya kategori
+        # değişikliğinde değişir
+        if action != 'update' or task.category_id != loaded.get('category_id'):
+            category_ids.update((task.category_id, loaded.get('category_id')))
+        task.remember_loaded_values()
+    category_ids.discard(None)
+    if category_ids:
+        # Görev sayısı kategorinin sahibinin ve kategorideki tüm görevlerin
+        # (category_detail.task_count) gösterimlerinde yer alır
+        categories = Category.objects.filter(pk__in=category_ids).order_by()
+        in_category = Task.objects.filter(category__in=category_ids).order_by()
+        changes.user_ids.update(categories.values_list('created_by_id', flat=True).union(
+            in_category.values_list('created_by_id', flat=True),
+            in_category.values_list('assigned_to_id', flat=True),
+        ))
+
+
+def tasks_saved(tasks, created=False):
+    """Sinyal göndermeyen toplu oluşturma/güncellemeler sonrası çağrılır."""
+    changes = ChangeSet()
+    _add_tasks(changes, tasks, 'create' if created else 'update')
+    changes.commit()
+
+
+def task_updated(task_id, owner_ids=None, updates=None, previous=None):
+    """
+    Koşullu UPDATE ile değişen tek görev; updates yazılan alanlardır.
+    Sahipler (owner_ids) verilmezse sorgulanır; durum değiştiyse yeni durum
+    yayınlanır. previous görevin güncelleme öncesi STATS_FIELDS değerleridir;
+    pano sayaçlarını etkileyen güncellemelerde verilmelidir.
+    """
+    updates = updates or {}
+    if owner_ids is None:
+        owner_ids = _parent_owners(task_id)
+    changes = ChangeSet()
+    changes.add('task', task_id, 'update', owner_ids)
+    if 'status' in updates:
+        changes.status_changed(owner_ids, task_id, updates['status'])
+    if previous is not None:
+        current = {**previous, **{field: updates[field] for field in STATS_FIELDS if field in updates}}
+        changes.stats.change(owner_ids, previous, owner_ids, current)
+    changes.commit()
+
+
+def _deleted_with_task(origin):
+    # Görevle birlikte silinen alt kayıtlar için görevin sahipleri görevin
+    # kendi silme kaydıyla bilgilendirilir
+    return isinstance(origin, Task) or getattr(origin, 'model', None) is Task
+
+
+def _parent_owners(task_id):
+    return Task.objects.filter(pk=task_id).values_list('created_by_id', 'assigned_to_id').first() or (None, None)
+
+
+@receiver(post_save, sender=Task)
+def _task_saved(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        tasks_saved([instance], created)
+
+
+@receiver(post_delete, sender=Task)
+def _task_deleted(sender, instance, **kwargs):
+    changes = ChangeSet()
+    _add_tasks(changes, [instance], 'delete')
+    changes.commit()
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def _task_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    changes = ChangeSet()
+    if not reverse:
+        changes.add('task', instance.pk, 'update', (instance.created_by_id, instance.assigned_to_id))
+    elif pk_set:
+        changes.add_tasks(_task_owner_rows(Task.objects.filter(pk__in=pk_set)))
+    elif action == 'pre_clear':
+        changes.add_tasks(_task_owner_rows(instance.tasks.all()))
+    changes.commit()
+
+
+def _subtask_changed(instance, action, origin=None):
+    loaded = getattr(instance, '_loaded_values', {})
+    visible = [instance.created_by_id, instance.assigned_to_id]
+    changes = ChangeSet()
+    if not _deleted_with_task(origin):
+        creator, assignee = _parent_owners(instance.parent_task_id)
+        visible.append(creator)
+        # Ana görevin atananı alt görevi görev yanıtının içinde görür
+        changes.user_ids.add(assignee)
+        if action == 'update' and instance.is_completed and not loaded.get('is_completed'):
+            changes.notify([*visible, assignee], {
+                'type': 'subtask.completed',
+                'task': str(instance.parent_task_id),
+                'subtask': str(instance.pk),
+            })
+    changes.add(
+        'subtask', instance.pk, action, visible,
+        (loaded.get('created_by_id'), loaded.get('assigned_to_id'))
+    )
+    changes.commit()
+    instance.remember_loaded_values()
+
+
+@receiver(post_save, sender=Subtask)
+def _subtask_saved(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        _subtask_changed(instance, 'create' if created else 'update')
+
+
+@receiver(post_delete, sender=Subtask)
+def _subtask_deleted(sender, instance, origin=None, **kwargs):
+    _subtask_changed(instance, 'delete', origin)
+
+
+def _comment_changed(instance, action, origin=None):
+    visible = [instance.user_id]
+    if not _deleted_with_task(origin):
+        visible.extend(_parent_owners(instance.task_id))
+    changes = ChangeSet()
+    changes.add('comment', instance.pk, action, visible)
+    if action == 'create':
+        changes.notify(visible, {
+            'type': 'comment.created',
+            'task': str(instance.task_id),
+            'comment': str(instance.pk),
+            'user': str(instance.user_id),
+            'content': instance.content,
+            'created_at': instance.created_at,
+        })
+    changes.commit()
+
+
+@receiver(post_save, sender=TaskComment)
+def _comment_saved(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        _comment_changed(instance, 'create' if created else 'update')
+
+
+@receiver(post_delete, sender=TaskComment)
+def _comment_deleted(sender, instance, origin=None, **kwargs):
+    _comment_changed(instance, 'delete', origin)
+
+
+def _label_changed(instance, created=False, deleted=False):
+    # Kategori ve etiketler görev yanıtlarında gösterilir; bağlı görevler
+    # güncellenmiş sayılır
+    changes = ChangeSet()
+    changes.user_ids.add(instance.created_by_id)
+    if not created:
+        rows = list(_task_owner_rows(instance.tasks.all()))
+        changes.add_tasks(rows)
+        if deleted and isinstance(instance, Category) and rows:
+            # Görevlerin kategorisi sinyal göndermeyen SET_NULL ile boşaltılır
+            remove_category(instance.pk, {user_id for _, *user_ids in rows for user_id in user_ids})
+    changes.commit()
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Tag)
+def _label_saved(sender, instance, created=False, raw=False, **kwargs):
+    if not raw:
+        _label_changed(instance, created)
+
+
+@receiver(pre_delete, sender=Category)
+@receiver(pre_delete, sender=Tag)
+def _label_deleted(sender, instance, **kwargs):
+    # Görevlerin kategorisi SET_NULL ile boşaltılmadan önce bakılır
+    _label_changed(instance, deleted=True)
+
+
+def current_cursor():
+    return ChangeLogEntry.objects.aggregate(cursor=Max('id'))['cursor'] or 0
+
+
+def is_expired(since):
+    """
+    since'ten sonraki kayıtların bir kısmı budanmışsa True; istemci tam
+    senkronizasyon yapmalıdır.
+    """
+    oldest = ChangeLogEntry.objects.order_by('id').values_list('id', flat=True).first()
+    return oldest is not None and since < oldest - 1
+
+
+def changes_since(user, since, limit):
+    """
+    Kullanıcının since'ten sonraki değişiklikleri; nesne başına tek sonuç
+    ('created', 'updated' veya 'deleted') olarak {tür: {id: sonuç}}.
+    """
+    entries = list(
+        ChangeLogEntry.objects.filter(user=user, id__gt=since)
+        .order_by('id')
+        .values_list('id', 'model', 'object_id', 'action')[:limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    actions = {}
+    for _, model, object_id, action in entries:
+        first, _ = actions.get((model, object_id), (action, action))
+        actions[(model, object_id)] = (first, action)
+
+    objects = {model: {} for model, _ in ChangeLogEntry.MODEL_CHOICES}
+    for (model, object_id), (first, last) in actions.items():
+        if last == 'delete':
+            result = 'deleted'
+        elif first == 'create':
+            result = 'created'
+        else:
+            result = 'updated'
+        objects[model][object_id] = result
+
+    # Kullanıcının yeni kaydı yoksa cursor en son kayda ilerletilir; böylece
+    # budama sonrasında boşta kalan istemcinin cursor'ı geçersiz sayılmaz
+    cursor = entries[-1][0] if entries else max(since, current_cursor())
+    return ChangeFeed(cursor, has_more, objects)
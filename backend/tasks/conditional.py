@@ -0,0 +1,104 @@
+"""
+Görev yanıtları için koşullu GET doğrulayıcıları (ETag / Last-Modified).
+
+Doğrulayıcılar okunan görevlerin (detayda tek görev, listede yalnızca
+istenen sayfa) kimlikleri ve updated_at değerleri ile alt görevlerinin,
+yorumlarının, kategori ve etiketlerinin updated_at en büyük değerleri ve
+kayıt sayılarından tek bir UNION ALL sorgusuyla hesaplanır; serializer
+çalıştırılmaz. Sayılar, en büyük zamanı değiştirmeyen silmeleri de yakalar.
+Görevlerin kategorilerindeki görev sayıları (category_detail.task_count)
+ve yanıt toplam sayıyı içeriyorsa filtrelenmiş kümenin sayısı da eklenir.
+"""
+import hashlib
+import json
+
+from django.db.models import CharField, Count, DateTimeField, Max, Value
+from django.db.models.functions import Cast
+
+from .models import Subtask, Task, TaskComment
+
+
+def _summary(queryset, kind, key=None, **aggregates):
+    # UNION için her parça aynı sütunlara sahiptir; key verilmezse parça tek
+    # satırlık bir gruptur
+    return queryset.order_by().annotate(
+        kind=Value(kind, output_field=CharField()),
+        key=Value('', output_field=CharField()) if key is None else key,
+    ).values('kind', 'key').annotate(**aggregates).values_list('kind', 'key', 'count', 'updated', 'related')
+
+
+def _validator_rows(tasks, total=None):
+    ids = tasks.values('pk')
+    parts = [
+        _summary(
+            Task.objects.filter(pk__in=ids, tags__isnull=False), 'tag',
+            count=Count('tags'),
+            updated=Max('tags__updated_at'),
+            related=Value(None, output_field=DateTimeField()),
+        ),
+        _summary(
+            Subtask.objects.filter(parent_task__in=ids), 'subtask',
+            count=Count('pk'),
+            updated=Max('updated_at'),
+            related=Value(None, output_field=DateTimeField()),
+        ),
+        _summary(
+            TaskComment.objects.filter(task__in=ids), 'comment',
+            count=Count('pk'),
+            updated=Max('updated_at'),
+            related=Value(None, output_field=DateTimeField()),
+        ),
+    ]
+    # Kategori başına görev sayısı; başka bir görevin eklenmesi, silinmesi
+    # veya kategorisinin değişmesi de gösterimi değiştirir
+    parts.append(_summary(
+        Task.objects.filter(category__in=Task.objects.filter(pk__in=ids).values('category')), 'category',
+        key=Cast('category_id', CharField()),
+        count=Count('pk'),
+        updated=Value(None, output_field=DateTimeField()),
+        related=Value(None, output_field=DateTimeField()),
+    ))
+    if total is not None:
+        parts.append(_summary(
+            Task.objects.filter(pk__in=total.values('pk')), 'total',
+            count=Count('pk'),
+            updated=Value(None, output_field=DateTimeField()),
+            related=Value(None, output_field=DateTimeField()),
+        ))
+    # Görevler tek tek döner; sayfaya giren veya sayfadan çıkan görev de
+    # ETag'i değiştirir
+    return _summary(
+        Task.objects.filter(pk__in=ids), 'task', key=Cast('pk', CharField()),
+        count=Count('pk'),
+        updated=Max('updated_at'),
+        related=Max('category__updated_at'),
+    ).union(*parts, all=True)
+
+
+def _validators(rows, variant):
+    rows = sorted(rows, key=lambda row: row[:2])
+    if not any(kind == 'task' for kind, *_ in rows):
+        return None, None
+
+    timestamps = [
+        value for *_, updated, related in rows
+        for value in (updated, related) if value is not None
+    ]
+    raw = json.dumps([variant, rows], default=str)
+    return f'"{hashlib.sha1(raw.encode()).hexdigest()}"', max(timestamps)
+
+
+def task_validators(tasks, variant, total=None):
+    """
+    Görev sorgusunun (liste sayfası veya tek görev) güçlü ETag'ini ve
+    Last-Modified zamanını döndürür. variant aynı veriden üretilen farklı
+    gösterimleri (kullanıcı, URL, parametreler) ayırır; total verilirse
+    yanıttaki toplam sayının hesaplandığı sorgudur. Görev yoksa
+    (None, None) döner.
+    """
+    return _validators(_validator_rows(tasks, total), variant)
+
+
+async def atask_validators(tasks, variant, total=None):
+    """task_validators'ın async sürümü."""
+    return _validators([row async for row in _validator_rows(tasks, total)], variant)
@@ -0,0 +1,364 @@
+"""
+Görevlerin AI alanlarını (ai_tags, ai_summary, ai_suggestions) dolduran
+zenginleştirme hattı.
+
+Görevin başlık+açıklamasının SHA-256 özeti ai_content_hash'te tutulur;
+özeti değişmeyen görevler yeniden işlenmez. Sonuçlar içerik özeti ve model
+başına EnrichmentCache'e yazılır; aynı içerikli görevler modele tekrar
+gönderilmez. Önbellekte olmayan görevler BATCH_SIZE görevlik (en fazla
+MAX_PROMPT_CHARS karakterlik) tek isteklerde modele sorulur; istekler
+CONCURRENCY iş parçacığıyla paralel gönderilir.
+
+Sonuçlar yalnızca AI alanlarını yazan koşullu UPDATE'lerle görevlere
+yazılır: istek sürerken başlık veya açıklama değiştiyse yazılmaz, görev
+sonraki turda yeni içerikle işlenir. updated_at değişmez; görevin sahipleri
+senkronizasyon günlüğüyle bilgilendirilir.
+
+run_enrichment komutu başlangıçta tüm görevleri tarar, ardından değişiklik
+günlüğünden (ChangeLogEntry) yalnızca düzenlenen görevleri okur. Model
+hatası alan görevler içerikleri değişene veya komut yeniden başlatılana
+kadar bekler. Aynı anda tek bir süreç çalıştırılmalıdır.
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from .changes import ChangeSet, current_cursor
+from .models import ChangeLogEntry, EnrichmentCache, Task
+
+DEFAULT_ENRICHMENT_SETTINGS = {
+    'CLIENT': 'tasks.enrichment.StubClient',
+    'MODEL': 'gemini-1.5-flash',
+    'API_KEY': '',
+    'BATCH_SIZE': 20,  # Tek istekteki en fazla görev
+    'MAX_PROMPT_CHARS': 12000,  # Tek isteğin en fazla görev metni
+    'MAX_DESCRIPTION_CHARS': 2000,  # Modele gönderilen açıklama uzunluğu
+    'CONCURRENCY': 4,  # Aynı anda gönderilen istek
+    'TIMEOUT': 60,  # Saniye
+    'SCAN_BATCH_SIZE': 500,  # Tek sorguda okunan görev
+    'POLL_INTERVAL': 10,  # Saniye
+}
+
+PROMPT = (
+    'Sen bir görev yönetimi asistanısın. Aşağıdaki JSON dizisindeki her görev '
+    'için kısa bir özet, en fazla 5 küçük harfli etiket ve görevi tamamlamaya '
+    'yardımcı olacak somut öneriler üret. Görevin dilinde yanıt ver. Yanıt '
+    'yalnızca [{"id": <görev id>, "tags": [...], "summary": "...", '
+    '"suggestions": "..."}] biçiminde bir JSON dizisi olmalıdır.\n\nGörevler:\n'
+)
+
+Completion = namedtuple('Completion', ['text', 'prompt_tokens', 'output_tokens'])
+Enrichment = namedtuple('Enrichment', ['tags', 'summary', 'suggestions', 'prompt_tokens', 'output_tokens'])
+
+
+def get_enrichment_settings():
+    """Varsayılan değerlerle birleştirilmiş ENRICHMENT ayarlarını döndürür."""
+    config = dict(DEFAULT_ENRICHMENT_SETTINGS)
+    config.update(getattr(settings, 'ENRICHMENT', {}))
+    return config
+
+
+def content_hash(title, description):
+    """Başlık ve açıklamanın içerik özeti."""
+    return hashlib.sha256(f'{title.strip()}\n{description.strip()}'.encode()).hexdigest()
+
+
+def estimate_tokens(text):
+    """Kaba token tahmini (~4 karakter); sayım döndürmeyen istemciler için."""
+    return len(text) // 4 + 1
+
+
+class StubClient:
+    """
+    Ağa çıkmayan, aynı isteğe her zaman aynı yanıtı veren yerel istemci
+    (varsayılan). Testler ve geliştirme içindir.
+    """
+    model = 'stub'
+
+    def __init__(self, latency=0):
+        self.latency = latency
+
+    @classmethod
+    def from_settings(cls, config):
+        return cls()
+
+    def generate(self, prompt):
+        if self.latency:
+            time.sleep(self.latency)
+        tasks = json.loads(prompt[len(PROMPT):])
+        results = []
+        for task in tasks:
+            words = Counter(
+                word for word in re.findall(r'\w+', f"{task['title']} {task['description']}".lower())
+                if len(word) > 3 and not word.isdigit()
+            )
+            first_sentence = re.split(r'(?<=[.!?])\s', task['description'].strip(), maxsplit=1)[0]
+            results.append({
+                'id': task['id'],
+                'tags': [word for word, _ in words.most_common(3)],
+                'summary': (first_sentence or task['title'])[:160],
+                'suggestions': f"\"{task['title']}\" görevini küçük adımlara bölün ve ilk adıma bugün başlayın.",
+            })
+        text = json.dumps(results, ensure_ascii=False)
+        return Completion(text, estimate_tokens(prompt), estimate_tokens(text))
+
+
+class GeminiClient:
+    """Google Gemini generateContent REST API istemcisi."""
+    URL = 'https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent'
+
+    def __init__(self, model, api_key, timeout=60):
+        self.model = model
+        self.api_key = api_key
+        self.timeout = timeout
+
+    @classmethod
+    def from_settings(cls, config):
+        if not config['API_KEY']:
+            raise ImproperlyConfigured('ENRICHMENT[\'API_KEY\'] (GEMINI_API_KEY) tanımlı değil.')
+        return cls(config['MODEL'], config['API_KEY'], config['TIMEOUT'])
+
+    def generate(self, prompt):
+        import requests
+
+        response = requests.post(
+            self.URL.format(model=self.model),
+            params={'key': self.api_key},
+            json={
+                'contents': [{'parts': [{'text': prompt}]}],
+                'generationConfig': {'responseMimeType': 'application/json', 'temperature': 0.2},
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
+        text = ''.join(part.get('text', '') for part in data['candidates'][0]['content']['parts'])
+        usage = data.get('usageMetadata', {})
+        return Completion(
+            text,
+            usage.get('promptTokenCount', estimate_tokens(prompt)),
+            usage.get('candidatesTokenCount', estimate_tokens(text)),
+        )
+
+
+def get_client(config=None):
+    """ENRICHMENT['CLIENT'] ayarındaki model istemcisini oluşturur."""
+    config = config or get_enrichment_settings()
+    return import_string(config['CLIENT']).from_settings(config)
+
+
+class EnrichmentStats:
+    """Hattın çalışma sayaçları."""
+
+    def __init__(self):
+        self.tasks = 0  # Yazılan görev
+        self.cached = 0  # Önbellekten yazılan görev
+        self.failed = 0  # Model hatası veya geçersiz yanıt alan görev
+        self.last_error = ''
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.output_tokens = 0
+        self.seconds = 0.0
+
+    def as_dict(self):
+        generated = self.tasks - self.cached
+        return {
+            'tasks': self.tasks,
+            'cached': self.cached,
+            'failed': self.failed,
+            'requests': self.requests,
+            'prompt_tokens': self.prompt_tokens,
+            'output_tokens': self.output_tokens,
+            'tokens_per_task': round((self.prompt_tokens + self.output_tokens) / generated, 1) if generated else 0,
+            'tasks_per_second': round(self.tasks / self.seconds, 1) if self.seconds else 0,
+            'last_error': self.last_error,
+        }
+
+
+class EnrichmentPipeline:
+    """
+    İçeriği değişen görevleri toplu isteklerle zenginleştirir. client,
+    generate(prompt) ile Completion döndüren bir model istemcisidir.
+    """
+
+    def __init__(self, client=None, config=None):
+        self.config = config or get_enrichment_settings()
+        self.client = client or get_client(self.config)
+        self.stats = EnrichmentStats()
+
+    def _stale(self, task_ids=None):
+        """İçerik özeti ai_content_hash'ten farklı görevleri parça parça üretir."""
+        tasks = Task.objects.order_by('pk')
+        if task_ids is not None:
+            tasks = tasks.filter(pk__in=task_ids)
+        last = None
+        while True:
+            chunk = tasks if last is None else tasks.filter(pk__gt=last)
+            rows = list(chunk.values_list(
+                'pk', 'title', 'description', 'ai_content_hash', 'created_by_id', 'assigned_to_id'
+            )[:self.config['SCAN_BATCH_SIZE']])
+            if not rows:
+                return
+            last = rows[-1][0]
+            stale = [
+                (pk, title, description, digest, owners)
+                for pk, title, description, stored, *owners in rows
+                for digest in [content_hash(title, description)]
+                if digest != stored
+            ]
+            if stale:
+                yield stale
+            if len(rows) < self.config['SCAN_BATCH_SIZE']:
+                return
+
+    def _prompts(self, items):
+        """(özet, başlık, açıklama) öğelerini istek başına sınırlar içinde gruplar."""
+        batch, size = [], 0
+        for item in items:
+            task = {
+                'id': len(batch),
+                'title': item[1],
+                'description': item[2][:self.config['MAX_DESCRIPTION_CHARS']],
+            }
+            length = len(task['title']) + len(task['description'])
+            if batch and (len(batch) >= self.config['BATCH_SIZE'] or size + length > self.config['MAX_PROMPT_CHARS']):
+                yield batch
+                batch, size = [], 0
+                task['id'] = 0
+            batch.append((item[0], task))
+            size += length
+        if batch:
+            yield batch
+
+    def _generate(self, batch):
+        """Tek isteği gönderir; {içerik özeti: Enrichment} döndürür."""
+        completion = self.client.generate(
+            PROMPT + json.dumps([task for _, task in batch], ensure_ascii=False)
+        )
+        results = json.loads(completion.text)
+        # İstek tokenları görevler arasında paylaştırılır
+        prompt_share = completion.prompt_tokens // len(batch)
+        output_share = completion.output_tokens // len(batch)
+        enrichments = {}
+        for result in results if isinstance(results, list) else ():
+            try:
+                digest = batch[int(result['id'])][0]
+                enrichments[digest] = Enrichment(
+                    [str(tag) for tag in result.get('tags') or []][:5],
+                    str(result.get('summary') or ''),
+                    str(result.get('suggestions') or ''),
+                    prompt_share, output_share,
+                )
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+        return completion, enrichments
+
+    def _complete(self, digests):
+        """İçerik özetlerinin sonuçları: önce önbellek, sonra toplu istekler."""
+        found = {
+            row.content_hash: Enrichment(row.tags, row.summary, row.suggestions, row.prompt_tokens, row.output_tokens)
+            for row in EnrichmentCache.objects.filter(content_hash__in=digests, model=self.client.model)
+        }
+        missing = [(digest, *content) for digest, content in digests.items() if digest not in found]
+        generated = {}
+        with ThreadPoolExecutor(max_workers=self.config['CONCURRENCY']) as executor:
+            futures = [executor.submit(self._generate, batch) for batch in self._prompts(missing)]
+            for future in futures:
+                try:
+                    completion, enrichments = future.result()
+                except Exception as e:
+                    # Görevleri enrich() başarısız sayar
+                    self.stats.last_error = f'{type(e).__name__}: {e}'
+                    continue
+                self.stats.requests += 1
+                self.stats.prompt_tokens += completion.prompt_tokens
+                self.stats.output_tokens += completion.output_tokens
+                generated.update(enrichments)
+        EnrichmentCache.objects.bulk_create(
+            (
+                EnrichmentCache(
+                    content_hash=digest, model=self.client.model, tags=result.tags, summary=result.summary,
+                    suggestions=result.suggestions, prompt_tokens=result.prompt_tokens,
+                    output_tokens=result.output_tokens,
+                )
+                for digest, result in generated.items()
+            ),
+            ignore_conflicts=True,
+        )
+        return found, generated
+
+    def enrich(self, rows):
+        """
+        (id, başlık, açıklama, içerik özeti, sahipler) satırlarını işler;
+        yazılan görev sayısını döndürür.
+        """
+        digests = {digest: (title, description) for _, title, description, digest, _ in rows}
+        found, generated = self._complete(digests)
+        written = []
+        with transaction.atomic():
+            for pk, title, description, digest, owners in rows:
+                result = found.get(digest) or generated.get(digest)
+                if result is None:
+                    continue
+                # İstek sürerken içerik değiştiyse yazılmaz
+                if Task.objects.filter(pk=pk, title=title, description=description).update(
+                    ai_tags={'tags': result.tags},
+                    ai_summary=result.summary,
+                    ai_suggestions=result.suggestions,
+                    ai_content_hash=digest,
+                ):
+                    written.append((pk, *owners))
+                    self.stats.cached += digest in found
+            changes = ChangeSet()
+            changes.add_tasks(written)
+            changes.commit()
+        self.stats.failed += sum(1 for *_, digest, _ in rows if digest not in found and digest not in generated)
+        self.stats.tasks += len(written)
+        return len(written)
+
+    def run_once(self, task_ids=None):
+        """İçeriği değişen tüm görevleri (veya task_ids'tekileri) işler."""
+        started = time.perf_counter()
+        written = 0
+        pending = []
+        # Seyrek değişikliklerde istekler dolu gitsin diye taranan parçalar
+        # biriktirilir
+        for rows in self._stale(task_ids):
+            pending.extend(rows)
+            if len(pending) >= self.config['SCAN_BATCH_SIZE']:
+                written += self.enrich(pending)
+                pending = []
+        if pending:
+            written += self.enrich(pending)
+        self.stats.seconds += time.perf_counter() - started
+        return written
+
+    def _changed_tasks(self, cursor):
+        entries = list(
+            ChangeLogEntry.objects.filter(id__gt=cursor, model='task')
+            .order_by('id').values_list('id', 'object_id')
+        )
+        if not entries:
+            return cursor, set()
+        return entries[-1][0], {object_id for _, object_id in entries}
+
+    def run(self, stop=None):
+        """Tüm görevleri tarar, ardından stop ayarlanana kadar düzenlenenleri işler."""
+        stop = stop or threading.Event()
+        # Cursor taramadan önce alınır; arada düzenlenen görevler tekrar
+        # okunur ve özetleri eşleşirse atlanır
+        cursor = current_cursor()
+        self.run_once()
+        while not stop.wait(self.config['POLL_INTERVAL']):
+            cursor, task_ids = self._changed_tasks(cursor)
+            if task_ids:
+                self.run_once(task_ids)
@@ -0,0 +1,107 @@
+"""
+Ses-metin dönüştürme işleri için süreç içi (in-process) iş kuyruğu.
+
+Harici bir mesaj aracısı (broker) gerekmez: işler veritabanında
+TranscriptionJob olarak tutulur ve bir iş parçacığı havuzunda çalıştırılır.
+HTTP isteği dönüştürmeyi beklemeden iş kimliğiyle hemen yanıt verir.
+
+Kuyruk bellekte tutulduğundan süreç yeniden başlatıldığında bekleyen veya
+yarıda kalan işler kaybolur; bunlar requeue_transcription_jobs komutuyla
+(requeue_stale_jobs) yeniden çalıştırılır.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .models import TranscriptionJob
+from .transcription import get_transcription_settings
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            config = get_transcription_settings()
+            _executor = ThreadPoolExecutor(
+                max_workers=config.get('JOB_WORKERS', config['POOL_SIZE']),
+                thread_name_prefix='transcription-job',
+            )
+        return _executor
+
+
+def enqueue_job(job):
+    """İşi, içinde bulunulan transaction onaylandıktan sonra kuyruğa ekler."""
+    job_id = job.pk
+    transaction.on_commit(lambda: _get_executor().submit(_run_in_thread, job_id))
+
+
+def _run_in_thread(job_id):
+    # Arka plan iş parçacığı kendi veritabanı bağlantısını yönetir
+    close_old_connections()
+    try:
+        run_job(job_id)
+    finally:
+        close_old_connections()
+
+
+def run_job(job_id):
+    """
+    Bekleyen bir işi çalıştırır, sonucu kaydeder ve istenmişse göreve yazar.
+    """
+    # Döngüsel import'u önlemek için burada içe aktarılır
+    from .views import convert_audio_to_text
+
+    updated = TranscriptionJob.objects.filter(pk=job_id, status='pending').update(
+        status='running', started_at=timezone.now()
+    )
+    if not updated:
+        return None
+
+    job = TranscriptionJob.objects.select_related('task').get(pk=job_id)
+    result = convert_audio_to_text(job.audio.path, language=job.language)
+
+    job.finished_at = timezone.now()
+    if result['success']:
+        job.status = 'done'
+        job.text = result['text']
+        if job.task is not None and job.apply_to:
+            apply_to_task(job)
+    else:
+        job.status = 'failed'
+        job.error = result['error']
+    job.save(update_fields=['status', 'text', 'error', 'finished_at'])
+    return job
+
+
+def requeue_stale_jobs(stale_seconds=None):
+    """
+    stale_seconds'tan (varsayılan JOB_STALE_SECONDS) uzun süredir bekleyen
+    veya çalışan işlerin kimliklerini döndürür; çalışan işler yeniden
+    'pending' yapılır. Dönüştürme JOB_TIMEOUT ile sınırlı olduğundan bu
+    süreyi aşan bir iş, onu çalıştıran süreçle birlikte kaybolmuştur. İşi
+    başka bir sürecin de kuyruğa almış olması sorun değildir; run_job işi
+    yalnızca bir kez başlatır.
+    """
+    if stale_seconds is None:
+        stale_seconds = get_transcription_settings()['JOB_STALE_SECONDS']
+    cutoff = timezone.now() - timedelta(seconds=stale_seconds)
+    # Çalışmaya başlamış işler de kuyruğa girdikleri zamandan önce oluşturulmuştur
+    TranscriptionJob.objects.filter(status='running', started_at__lt=cutoff).update(
+        status='pending', started_at=None
+    )
+    pending = TranscriptionJob.objects.filter(status='pending', created_at__lt=cutoff)
+    return list(pending.order_by('created_at').values_list('pk', flat=True))
+
+
+def apply_to_task(job):
+    """Dönüştürülen metni ve ses kaydını ilgili göreve yazar."""
+    task = job.task
+    setattr(task, job.apply_to, job.text)
+    task.voice_note = job.audio.name
+    task.save(update_fields=[job.apply_to, 'voice_note', 'updated_at'])
@@ -0,0 +1,187 @@
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test.utils import setup_databases, teardown_databases
+from django.utils import timezone
+
+from tasks import analytics
+from tasks.models import DailyProductivity, Task
+
+User = get_user_model()
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Verimlilik analizini geçici bir test veritabanında ölçer: çok sayıda '
+        'kullanıcının yıllarca süren günlük özetleri üzerinde aralık '
+        'sorgularını, görevlerden özetleme hızını ve aynı sorgunun ham '
+        'görevlerden hesaplanmasını karşılaştırır.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10000)
+        parser.add_argument('--years', type=int, default=5)
+        parser.add_argument('--active', type=float, default=0.3,
+                            help='Kullanıcının görev tamamladığı günlerin oranı')
+        parser.add_argument('--per-day', type=float, default=3,
+                            help='Etkin günde ortalama tamamlanan görev')
+        parser.add_argument('--task-users', type=int, default=50,
+                            help='Özetleri gerçek görevlerden hesaplanan kullanıcı sayısı')
+        parser.add_argument('--iterations', type=int, default=200)
+
+    def handle(self, *args, **options):
+        # Geliştirme veritabanına dokunmamak için geçici test veritabanı kullanılır
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            self._run(options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+    def _history(self, user_ids, start, days, options, rng):
+        """Kullanıcıların tamamladığı sentetik görevler (analytics._completed_rows satırları)."""
+        active = rng.random((len(user_ids), days)) < options['active']
+        user_index, day_index = np.nonzero(active)
+        counts = rng.poisson(options['per_day'] - 1, len(user_index)) + 1
+        user_index, day_index = np.repeat(user_index, counts), np.repeat(day_index, counts)
+        midnight = timezone.make_aware(datetime.combine(start, datetime.min.time())).timestamp()
+        # Çalışma saatlerine yayılmış tamamlanma, log-normal tamamlanma süresi
+        completed = midnight + day_index * 86400 + rng.uniform(8, 20, len(day_index)) * 3600
+        lead_time = np.minimum(rng.lognormal(np.log(86400), 1.5, len(day_index)), 365 * 86400)
+        estimated = rng.choice([0, 1800, 3600, 7200, 14400], len(day_index))
+        actual = estimated * rng.lognormal(0.2, 0.5, len(day_index))
+        tz = timezone.get_current_timezone()
+        for i in range(len(day_index)):
+            yield (
+                user_ids[user_index[i]],
+                datetime.fromtimestamp(completed[i] - lead_time[i], tz),
+                datetime.fromtimestamp(completed[i], tz),
+                timedelta(seconds=int(estimated[i])) if estimated[i] else None,
+                timedelta(seconds=int(actual[i])) if estimated[i] else None,
+            )
+
+    def _seed_rollups(self, users, start, end, options, rng):
+        """Görevleri yazmadan özetleri doğrudan oluşturur."""
+        days = (end - start).days + 1
+        rows = 0
+        for offset in range(0, len(users), 500):
+            user_ids = [user.pk for user in users[offset:offset + 500]]
+            summaries = analytics._aggregate(list(self._history(user_ids, start, days, options, rng)), start, end)
+            DailyProductivity.objects.bulk_create(
+                (DailyProductivity(**dict(zip(analytics.ROLLUP_FIELDS, summary))) for summary in summaries),
+                batch_size=1000,
+            )
+            rows += len(summaries)
+            self.stdout.write(f'  {offset + len(user_ids)} kullanıcı, {rows} özet', ending='\r')
+        self.stdout.write('')
+        return rows
+
+    def _seed_tasks(self, users, start, end, options, rng):
+        days = (end - start).days + 1
+        created_at = Task._meta.get_field('created_at')
+        batch = []
+        count = 0
+        # created_at geçmişe yazılabilsin diye auto_now_add geçici olarak kapatılır
+        created_at.auto_now_add = False
+        try:
+            for user_id, created, completed, estimated, actual in self._history(
+                [user.pk for user in users], start, days, options, rng
+            ):
+                batch.append(Task(
+                    title='Görev', description='', created_by_id=user_id, assigned_to_id=user_id,
+                    status='done', created_at=created, completed_at=completed,
+                    estimated_time=estimated, actual_time=actual,
+                ))
+                if len(batch) == 5000:
+                    count += len(Task.objects.bulk_create(batch))
+                    batch = []
+            count += len(Task.objects.bulk_create(batch))
+        finally:
+            created_at.auto_now_add = True
+        return count
+
+    def _measure(self, query, users, ranges, iterations):
+        timings = {}
+        for label, (start, end) in ranges.items():
+            samples = []
+            for i in range(iterations):
+                user = users[i % len(users)]
+                started = time.perf_counter()
+                query(user, start, end)
+                samples.append((time.perf_counter() - started) * 1000)
+            timings[label] = samples
+        return timings
+
+    def _report(self, name, timings):
+        for label, samples in timings.items():
+            self.stdout.write(
+                f'  {name:<18} {label:<6} p50={statistics.median(samples):8.2f} ms  '
+                f'p99={_percentile(samples, 99):8.2f} ms'
+            )
+
+    def _run(self, options):
+        rng = np.random.default_rng(0)
+        today = timezone.localdate()
+        end = today - timedelta(days=1)
+        start = end - timedelta(days=round(365.25 * options['years']) - 1)
+
+        self.stdout.write(f"{options['users']} kullanıcı, {start} - {end} verisi oluşturuluyor...")
+        users = User.objects.bulk_create(
+            User(email=f'bench{i}@example.com') for i in range(options['users'] + options['task_users'])
+        )
+        users, task_users = users[:options['users']], users[options['users']:]
+        # Özetleme aralıktaki tüm satırları yeniden yazdığından sentetik
+        # özetlerden önce çalıştırılır
+        tasks = self._seed_tasks(task_users, start, end, options, rng)
+        started = time.perf_counter()
+        task_count, rollup_rows = analytics.rollup(start, end)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'Özetleme: {task_count:,}/{tasks:,} görev -> {rollup_rows:,} satır, '
+            f'{elapsed:.1f} sn ({task_count / elapsed:,.0f} görev/sn)'
+        )
+        started = time.perf_counter()
+        rows = self._seed_rollups(users, start, end, options, rng)
+        self.stdout.write(f'{rows:,} özet satırı {time.perf_counter() - started:.0f} sn içinde yazıldı.')
+        self.stdout.write(f'Toplam özet satırı: {DailyProductivity.objects.count():,}')
+
+        ranges = {
+            '30g': (end - timedelta(days=29), end),
+            '1y': (end - timedelta(days=364), end),
+            f"{options['years']}y": (start, end),
+        }
+        sample = random.sample(users, min(len(users), options['iterations']))
+        self.stdout.write('Aralık sorgusu (özetlerden):')
+        self._report('tüm kullanıcılar', self._measure(
+            lambda user, first, last: analytics.productivity(user, first, last, today),
+            sample, ranges, options['iterations']
+        ))
+
+        def raw(user, first, last):
+            return analytics.summarize(
+                analytics._aggregate(analytics._completed_rows(first, last, user), first, last), first, last
+            )
+
+        iterations = min(options['iterations'], 20)
+        self.stdout.write(f"Görevli {len(task_users)} kullanıcı, özetlerden ve ham görevlerden:")
+        self._report('özetler', self._measure(
+            lambda user, first, last: analytics.productivity(user, first, last, today),
+            task_users, ranges, iterations
+        ))
+        self._report('ham görevler', self._measure(raw, task_users, ranges, iterations))
+
+        user = task_users[0]
+        first, last = ranges['1y']
+        rolled, scanned = analytics.productivity(user, first, last, today), raw(user, first, last)
+        same = rolled == scanned
+        style = self.style.SUCCESS if same else self.style.ERROR
+        self.stdout.write(style(f"Özetlerden ve ham görevlerden aynı sonuç: {'evet' if same else 'hayır'}"))
@@ -0,0 +1,179 @@
+import asyncio
+import hashlib
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from django.contrib.auth import get_user_model
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from django.db.backends.signals import connection_created
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from django.urls import include, path
+
+from backend.firebase_auth import token_cache, user_cache
+from tasks import urls as tasks_urls
+from tasks.models import Category, Subtask, Tag, Task, TaskComment
+
+User = get_user_model()
+
+TOKEN = 'benchmark-token'
+
+
+class URLConf:
+    """ROOT_URLCONF olarak kullanılabilen, modül yerine geçen URL yapılandırması."""
+
+    def __init__(self, urlpatterns):
+        self.urlpatterns = urlpatterns
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Sık okunan görev uçlarını WSGI (iş parçacığı havuzu) ve ASGI (senkron '
+        've async görünümler) altında saniyedeki istek ve p99 gecikmesiyle '
+        'karşılaştırır. İstekler ağ yerine httpx\'in WSGI/ASGI taşıyıcılarıyla '
+        'süreç içinde gönderilir; --db-latency-ms her sorguya ağ üzerindeki '
+        'bir veritabanının gidiş-dönüş süresini ekler.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=200)
+        parser.add_argument('--requests', type=int, default=2000, help='Her kip için istek sayısı')
+        parser.add_argument('--threads', type=int, default=8, help='WSGI iş parçacığı sayısı')
+        parser.add_argument('--concurrency', type=int, default=64, help='ASGI eşzamanlı istek sayısı')
+        parser.add_argument('--db-latency-ms', type=float, default=0.0)
+        parser.add_argument('--response-cache', action='store_true', help='Yanıt önbelleğini açık bırak')
+
+    def handle(self, *args, **options):
+        # Geliştirme veritabanına dokunmamak için geçici test veritabanı kullanılır
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            self._run(options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+    def _seed(self, task_count):
+        user = User.objects.create_user(email='bench@example.com', firebase_uid='bench-uid')
+        other = User.objects.create_user(email='other@example.com')
+        category = Category.objects.create(name='İş', created_by=user)
+        tag = Tag.objects.create(name='önemli', created_by=user)
+        tasks = Task.objects.bulk_create(
+            Task(
+                title=f'Görev {i}', description='Açıklama', created_by=user,
+                assigned_to=user if i % 2 else other, category=category,
+                status=('todo', 'in_progress', 'done')[i % 3],
+            )
+            for i in range(task_count)
+        )
+        Task.tags.through.objects.bulk_create(
+            Task.tags.through(task_id=task.pk, tag_id=tag.pk) for task in tasks
+        )
+        Subtask.objects.bulk_create(
+            Subtask(parent_task=task, title='Alt', created_by=user) for task in tasks
+        )
+        TaskComment.objects.bulk_create(
+            TaskComment(task=task, user=other, content='Yorum') for task in tasks
+        )
+        # Kararlı durumdaki gibi token ve kullanıcı önbellekten doğrulanır
+        key = hashlib.sha256(TOKEN.encode('utf-8')).digest()
+        token_cache.set(key, {'uid': 'bench-uid'}, time.time() + 3600)
+        user_cache.set('bench-uid', user, time.time() + 3600)
+        return [
+            '/api/tasks/?view=compact',
+            '/api/tasks/',
+            f'/api/tasks/{tasks[0].pk}/',
+            '/api/tasks/my_tasks/?view=compact',
+            '/api/categories/',
+        ]
+
+    def _run(self, options):
+        urls = self._seed(options['tasks'])
+        latency = options['db_latency_ms'] / 1000
+
+        def add_latency(execute, sql, params, many, context):
+            time.sleep(latency)
+            return execute(sql, params, many, context)
+
+        def install_latency(sender, connection, **kwargs):
+            if latency:
+                connection.execute_wrappers.append(add_latency)
+
+        connection_created.connect(install_latency)
+        sync_urlconf = URLConf([path('api/', include(tasks_urls.urlpatterns))])
+        async_urlconf = URLConf([
+            path('api/', include([*tasks_urls.async_urlpatterns, *tasks_urls.urlpatterns])),
+        ])
+        cache_config = {} if options['response_cache'] else {'RESPONSE_CACHE': {'ENABLED': False}}
+        self.stdout.write(
+            f"{options['tasks']} görev, kip başına {options['requests']} istek, "
+            f"sorgu gecikmesi {options['db_latency_ms']} ms, "
+            f"yanıt önbelleği {'açık' if options['response_cache'] else 'kapalı'}"
+        )
+
+        modes = [
+            (f"WSGI ({options['threads']} iş parçacığı)", sync_urlconf, self._wsgi),
+            (f"ASGI senkron görünüm ({options['concurrency']} eşzamanlı)", sync_urlconf, self._asgi),
+            (f"ASGI async görünüm ({options['concurrency']} eşzamanlı)", async_urlconf, self._asgi),
+        ]
+        try:
+            for name, urlconf, runner in modes:
+                with override_settings(ROOT_URLCONF=urlconf, **cache_config):
+                    runner(urls[:1], 20, options)  # Isınma
+                    started = time.perf_counter()
+                    timings = runner(urls, options['requests'], options)
+                    elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f'{name:<40} RPS={len(timings) / elapsed:7.0f}  '
+                    f'p50={statistics.median(timings):7.1f} ms  '
+                    f'p99={_percentile(timings, 99):7.1f} ms'
+                )
+        finally:
+            connection_created.disconnect(install_latency)
+
+    def _check(self, response):
+        if response.status_code != 200:
+            raise RuntimeError(f'{response.request.url}: {response.status_code}')
+
+    def _wsgi(self, urls, count, options):
+        transport = httpx.WSGITransport(app=get_wsgi_application())
+        headers = {'Authorization': f'Bearer {TOKEN}'}
+        local = threading.local()
+
+        def request(index):
+            client = getattr(local, 'client', None)
+            if client is None:
+                client = local.client = httpx.Client(
+                    transport=transport, base_url='http://testserver', headers=headers
+                )
+            started = time.perf_counter()
+            self._check(client.get(urls[index % len(urls)]))
+            return (time.perf_counter() - started) * 1000
+
+        with ThreadPoolExecutor(options['threads']) as pool:
+            return list(pool.map(request, range(count)))
+
+    def _asgi(self, urls, count, options):
+        async def run():
+            transport = httpx.ASGITransport(app=get_asgi_application())
+            timings = []
+            counter = iter(range(count))
+            async with httpx.AsyncClient(
+                transport=transport, base_url='http://testserver',
+                headers={'Authorization': f'Bearer {TOKEN}'}
+            ) as client:
+                async def worker():
+                    for index in counter:
+                        started = time.perf_counter()
+                        self._check(await client.get(urls[index % len(urls)]))
+                        timings.append((time.perf_counter() - started) * 1000)
+                await asyncio.gather(*(worker() for _ in range(options['concurrency'])))
+            return timings
+        return asyncio.run(run())
@@ -0,0 +1,103 @@
+import io
+import json
+import math
+import os
+import statistics
+import struct
+import tempfile
+import time
+import wave
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+
+from tasks.audio import SAMPLE_RATE, decode_upload, load_audio
+
+
+def _make_wav(seconds):
+    """Belirtilen uzunlukta 440 Hz sinüs içeren bir WAV dosyası üretir."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        frames = b''.join(
+            struct.pack('<h', int(8000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)))
+            for i in range(SAMPLE_RATE)
+        )
+        for _ in range(int(seconds)):
+            wav.writeframes(frames)
+    return buffer.getvalue()
+
+
+def _io_counters():
+    """Linux'ta sürecin okuma/yazma sistem çağrısı ve bayt sayaçlarını döndürür."""
+    try:
+        with open('/proc/self/io') as f:
+            return {key: int(value) for key, value in (line.split(': ') for line in f)}
+    except OSError:
+        return None
+
+
+def _legacy_path(upload):
+    """Eski yol: geçici WAV dosyası + Whisper'ın yazdığı JSON yan dosyası."""
+    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
+        for chunk in upload.chunks():
+            temp_file.write(chunk)
+        temp_file_path = temp_file.name
+    try:
+        audio = load_audio(temp_file_path)
+        json_file_path = os.path.splitext(temp_file_path)[0] + '.json'
+        with open(json_file_path, 'w', encoding='utf-8') as f:
+            json.dump({'text': ''}, f)
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            json.load(f)
+        os.remove(json_file_path)
+        return audio
+    finally:
+        os.unlink(temp_file_path)
+
+
+class Command(BaseCommand):
+    help = (
+        'Ses yüklemelerinin geçici dosyalı eski yolu ile bellek içi çözümleme '
+        'hattını gecikme ve G/Ç açısından karşılaştırır (model çalıştırılmaz).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=int, default=30, help='Ses uzunluğu (saniye)')
+        parser.add_argument('--iterations', type=int, default=20)
+
+    def handle(self, *args, **options):
+        data = _make_wav(options['seconds'])
+        self.stdout.write(
+            f"{options['seconds']} sn ses ({len(data) / 1024:.0f} KiB), "
+            f"{options['iterations']} tekrar"
+        )
+
+        pipelines = [
+            ('geçici dosya + JSON', _legacy_path),
+            ('bellek içi', lambda upload: decode_upload(upload, max_in_memory_bytes=len(data))),
+        ]
+        for name, pipeline in pipelines:
+            timings = []
+            before = _io_counters()
+            for _ in range(options['iterations']):
+                upload = SimpleUploadedFile('bench.wav', data, content_type='audio/wav')
+                started = time.perf_counter()
+                pipeline(upload)
+                timings.append((time.perf_counter() - started) * 1000)
+            after = _io_counters()
+
+            line = (
+                f'{name:<22} p50={statistics.median(timings):7.1f} ms  '
+                f'max={max(timings):7.1f} ms'
+            )
+            if before and after:
+                per_call = options['iterations']
+                line += (
+                    f"  write çağrısı/istek={(after['syscw'] - before['syscw']) / per_call:.1f}"
+                    f"  yazılan (boru dahil)/istek={(after['wchar'] - before['wchar']) / per_call / 1024:.0f} KiB"
+                    f"  depolamaya yazılan/istek={(after['write_bytes'] - before['write_bytes']) / per_call / 1024:.0f} KiB"
+                )
+            self.stdout.write(line)
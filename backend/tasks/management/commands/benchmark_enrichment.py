@@ -0,0 +1,109 @@
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test.utils import setup_databases, teardown_databases
+
+from tasks.enrichment import EnrichmentPipeline, StubClient, get_enrichment_settings
+from tasks.models import EnrichmentCache, Task
+
+User = get_user_model()
+
+WORDS = (
+    'toplantı rapor fatura müşteri sunum proje bütçe tasarım kod inceleme '
+    'test hata düzeltme sürüm plan hazırlık alışveriş kira sözleşme eğitim'
+).split()
+
+
+def _text(words):
+    return ' '.join(random.choices(WORDS, k=words))
+
+
+class Command(BaseCommand):
+    help = (
+        'Zenginleştirme hattını gecikmesi ayarlanabilen yerel istemciyle '
+        'geçici bir test veritabanında ölçer: görev başına tek istek ile '
+        'toplu istekler, değişiklik olmadan yeniden çalıştırma ve görevlerin '
+        'bir kısmı düzenlendikten sonra yeniden çalıştırma.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=5000)
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--duplicates', type=float, default=0.2,
+                            help='Başka bir görevle aynı içerikli görevlerin oranı')
+        parser.add_argument('--latency-ms', type=float, default=300, help='İstek başına model gecikmesi')
+        parser.add_argument('--baseline', type=int, default=200,
+                            help='Görev başına tek istekle işlenen görev sayısı')
+        parser.add_argument('--edits', type=float, default=0.05, help='Düzenlenen görevlerin oranı')
+
+    def handle(self, *args, **options):
+        # Geliştirme veritabanına dokunmamak için geçici test veritabanı kullanılır
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            self._run(options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+    def _seed(self, options):
+        users = User.objects.bulk_create(
+            User(email=f'bench{i}@example.com') for i in range(options['users'])
+        )
+        contents = []
+        for i in range(options['tasks']):
+            if contents and random.random() < options['duplicates']:
+                contents.append(random.choice(contents))
+            else:
+                contents.append((f'{_text(3)} {i}', f'{_text(30)}. {_text(20)}.'))
+        tasks = []
+        for title, description in contents:
+            user = random.choice(users)
+            tasks.append(Task(title=title, description=description, created_by=user, assigned_to=user))
+        return Task.objects.bulk_create(tasks, batch_size=2000)
+
+    def _measure(self, label, pipeline, task_ids=None):
+        requests, started = pipeline.stats.requests, time.perf_counter()
+        written = pipeline.run_once(task_ids)
+        elapsed = time.perf_counter() - started
+        stats = pipeline.stats.as_dict()
+        self.stdout.write(
+            f'  {label:<28} {written:>6} görev  {pipeline.stats.requests - requests:>5} istek  '
+            f'{elapsed:7.2f} sn  {written / elapsed:8.1f} görev/sn  '
+            f"görev başına {stats['tokens_per_task']} token"
+        )
+        return written
+
+    def _run(self, options):
+        random.seed(0)
+        tasks = self._seed(options)
+        latency = options['latency_ms'] / 1000
+        config = get_enrichment_settings()
+        self.stdout.write(
+            f"{len(tasks)} görev, istek gecikmesi {options['latency_ms']:.0f} ms, "
+            f"BATCH_SIZE={config['BATCH_SIZE']}, CONCURRENCY={config['CONCURRENCY']}"
+        )
+
+        sample = [task.pk for task in tasks[:options['baseline']]]
+        baseline = EnrichmentPipeline(
+            client=StubClient(latency), config={**config, 'BATCH_SIZE': 1, 'CONCURRENCY': 1}
+        )
+        self._measure('görev başına istek', baseline, sample)
+        Task.objects.filter(pk__in=sample).update(ai_content_hash='')
+        EnrichmentCache.objects.all().delete()
+
+        pipeline = EnrichmentPipeline(client=StubClient(latency), config=config)
+        self._measure('toplu istekler', pipeline)
+        self._measure('değişiklik yok', pipeline)
+        edited = random.sample(tasks, int(len(tasks) * options['edits']))
+        for task in edited:
+            task.description += ' Güncellendi.'
+        Task.objects.bulk_update(edited, ['description'])
+        self._measure(f"%{options['edits'] * 100:.0f} görev düzenlendi", pipeline)
+
+        stats = pipeline.stats.as_dict()
+        self.stdout.write(self.style.SUCCESS(
+            f"Toplam: {stats['tasks']} görev, {stats['cached']} önbellekten, {stats['requests']} istek, "
+            f"{stats['prompt_tokens']} girdi + {stats['output_tokens']} çıktı token, "
+            f"{stats['tasks_per_second']} görev/sn"
+        ))
@@ -0,0 +1,110 @@
+import asyncio
+import gc
+import json
+import resource
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from tasks.realtime import get_broker, serve_websocket
+
+
+def _rss_kib():
+    """Linux'ta sürecin yerleşik bellek kullanımını (KiB) döndürür."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+class Command(BaseCommand):
+    help = (
+        'Tek bir ASGI işçisinin (tek olay döngüsü) kaç eşzamanlı WebSocket '
+        'bağlantısı tutabildiğini ölçer: bağlantı başına bellek ve bir olayın '
+        'tüm bağlantılara ulaşma süresi. Ağ soketleri yerine bellek içi ASGI '
+        'kanalları kullanılır; sunucunun soket başına maliyeti dahil değildir.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--connections', default='1000,5000,10000,20000',
+                            help='Virgülle ayrılmış bağlantı sayıları')
+        parser.add_argument('--per-user', type=int, default=1, help='Kullanıcı başına bağlantı')
+        parser.add_argument('--events', type=int, default=10, help='Her adımda yayınlanan olay sayısı')
+        parser.add_argument('--budget-ms', type=float, default=250,
+                            help='Bir olayın tüm bağlantılara ulaşması için kabul edilen süre')
+
+    def handle(self, *args, **options):
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        self.stdout.write(f'Açık dosya sınırı (gerçek soketler için üst sınır): {soft}')
+        held = 0
+        for connections in (int(value) for value in options['connections'].split(',')):
+            result = asyncio.run(self._measure(connections, options['per_user'], options['events']))
+            within = result['fanout_max'] <= options['budget_ms']
+            held = connections if within else held
+            line = (
+                f"bağlantı={connections:<6} kurulum={result['setup']:7.0f} ms  "
+                f"yayın p50={result['fanout_p50']:7.1f} ms  max={result['fanout_max']:7.1f} ms  "
+                f"mesaj/sn={result['throughput']:9.0f}"
+            )
+            if result['memory'] is not None:
+                line += f"  bellek/bağlantı={result['memory']:.1f} KiB"
+            self.stdout.write(line + ('' if within else '  (süre aşıldı)'))
+        self.stdout.write(self.style.SUCCESS(
+            f"{options['budget_ms']:.0f} ms yayın süresi içinde tutulan en fazla bağlantı: {held}"
+        ))
+
+    async def _measure(self, connections, per_user, events):
+        broker = get_broker()
+        loop = asyncio.get_running_loop()
+        users = list(range(max(1, connections // per_user)))
+        received = {'count': 0, 'target': connections, 'done': None}
+
+        async def send(message):
+            if message['type'] != 'websocket.send':
+                return
+            event = json.loads(message['text'])
+            if event['type'] == 'benchmark':
+                received['count'] += 1
+                if received['count'] == received['target']:
+                    received['done'].set()
+
+        gc.collect()
+        before = _rss_kib()
+        started = time.perf_counter()
+        inboxes = [asyncio.Queue() for _ in range(connections)]
+        tasks = [
+            asyncio.ensure_future(serve_websocket(users[index % len(users)], inbox.get, send))
+            for index, inbox in enumerate(inboxes)
+        ]
+        while broker.stats()['connections'] < connections:
+            await asyncio.sleep(0)
+        setup = (time.perf_counter() - started) * 1000
+        gc.collect()
+        after = _rss_kib()
+
+        # Olaylar bir istek iş parçacığından yayınlanır; tümüne ulaşma süresi ölçülür
+        timings = []
+        for _ in range(events):
+            received['count'] = 0
+            received['done'] = asyncio.Event()
+            sent = time.perf_counter()
+            await loop.run_in_executor(None, broker.publish, users, {'type': 'benchmark'})
+            await received['done'].wait()
+            timings.append((time.perf_counter() - sent) * 1000)
+
+        for inbox in inboxes:
+            inbox.put_nowait({'type': 'websocket.disconnect', 'code': 1000})
+        await asyncio.gather(*tasks)
+
+        return {
+            'setup': setup,
+            'fanout_p50': statistics.median(timings),
+            'fanout_max': max(timings),
+            'throughput': connections * events / (sum(timings) / 1000),
+            'memory': (after - before) / connections if before and after else None,
+        }
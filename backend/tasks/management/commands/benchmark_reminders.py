@@ -0,0 +1,145 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_databases, teardown_databases
+from django.utils import timezone
+
+from tasks.changes import ChangeSet
+from tasks.models import Task
+from tasks.reminders import ReminderScheduler, get_reminder_settings
+
+User = get_user_model()
+
+
+class CountingSender:
+    def __init__(self):
+        self.count = 0
+
+    def send(self, reminders):
+        self.count += len(reminders)
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Bir saate yayılmış hatırlatmaları simüle edilmiş saatle çalışan '
+        'zamanlayıcıdan geçirir; tur başına süre ve sorgu sayısıyla zamanlayıcının saatlik yükü gerçek zamandan ne kadar hızlı '
+        'işlediğini ölçer. Hatırlatmaların bir kısmı çalışma sırasında '
+        'düzenlenir.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reminders', type=int, default=100000, help='Bir saatteki hatırlatma sayısı')
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--idle', type=int, default=200000,
+                            help='Hatırlatması pencere dışında kalan görev sayısı')
+        parser.add_argument('--edits', type=float, default=0.05,
+                            help='Çalışma sırasında ertelenen hatırlatmaların oranı')
+
+    def handle(self, *args, **options):
+        # Geliştirme veritabanına dokunmamak için geçici test veritabanı kullanılır
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            self._run(options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+    def _seed(self, options, start):
+        users = User.objects.bulk_create(
+            User(email=f'user{i}@example.com') for i in range(options['users'])
+        )
+        count, idle = options['reminders'], options['idle']
+
+        def tasks():
+            for i in range(count + idle):
+                user = users[i % len(users)]
+                if i < count:
+                    reminder = start + timedelta(seconds=3600 * i / count)
+                else:
+                    # Geçmişte veya çok ileride; zamanlayıcı bunları okumamalıdır
+                    reminder = start + timedelta(days=(-30, 30)[i % 2], seconds=i)
+                yield Task(
+                    title=f'Görev {i}', description='', created_by=user, assigned_to=user,
+                    reminder_date=reminder,
+                )
+
+        created = 0
+        batch = []
+        for task in tasks():
+            batch.append(task)
+            if len(batch) == 5000:
+                created += len(Task.objects.bulk_create(batch))
+                batch = []
+        created += len(Task.objects.bulk_create(batch))
+        return created
+
+    def _run(self, options):
+        start = timezone.now().replace(microsecond=0) + timedelta(days=1)
+        self.stdout.write(f"Veri hazırlanıyor: {options['reminders'] + options['idle']} görev...")
+        self._seed(options, start)
+
+        clock = {'now': start}
+        sender = CountingSender()
+        config = get_reminder_settings()
+        scheduler = ReminderScheduler(sender=sender, clock=lambda: clock['now'], config=config)
+
+        counters = {'queries': 0}
+
+        def count_queries(execute, sql, params, many, context):
+            counters['queries'] += 1
+            return execute(sql, params, many, context)
+
+        # Çalışma sırasında ertelenecek hatırlatmalar: saatin ikinci yarısındakiler
+        step = max(1, int(1 / options['edits'])) if options['edits'] else 0
+        edit_at = start + timedelta(minutes=20)
+        edited = False
+
+        tick_times = []
+        started = time.perf_counter()
+        with connection.execute_wrapper(count_queries):
+            scheduler.start()
+            while clock['now'] <= start + timedelta(hours=1):
+                if step and not edited and clock['now'] >= edit_at:
+                    edited = True
+                    self._postpone(start, step)
+                tick_started = time.perf_counter()
+                scheduler.tick(clock['now'])
+                tick_times.append((time.perf_counter() - tick_started) * 1000)
+                clock['now'] += timedelta(seconds=config['POLL_INTERVAL'])
+        elapsed = time.perf_counter() - started
+
+        expected = options['reminders']
+        self.stdout.write(
+            f"gönderilen={sender.count} / beklenen={expected}  "
+            f"süre={elapsed:.1f} sn (1 saatlik yük)  "
+            f"hız={sender.count / elapsed:,.0f} hatırlatma/sn"
+        )
+        self.stdout.write(
+            f"tur={len(tick_times)}  tur süresi p50={statistics.median(tick_times):.1f} ms  "
+            f"p99={_percentile(tick_times, 99):.1f} ms  max={max(tick_times):.1f} ms  "
+            f"sorgu={counters['queries']}"
+        )
+        realtime = 3600 / elapsed
+        style = self.style.SUCCESS if sender.count == expected else self.style.ERROR
+        self.stdout.write(style(f'Zamanlayıcı gerçek zamandan {realtime:.0f} kat hızlı.'))
+
+    def _postpone(self, start, step):
+        """Saatin son yarısındaki her step'inci hatırlatmayı 10 dakika erteler."""
+        tasks = Task.objects.filter(
+            reminder_date__gt=start + timedelta(minutes=30),
+            reminder_date__lte=start + timedelta(minutes=50),
+        ).order_by('reminder_date').values_list('pk', 'reminder_date', 'created_by_id', 'assigned_to_id')
+        rows = list(tasks)[::step]
+        for task_id, reminder, _, _ in rows:
+            Task.objects.filter(pk=task_id).update(reminder_date=reminder + timedelta(minutes=10))
+        changes = ChangeSet()
+        changes.add_tasks((task_id, creator, assignee) for task_id, _, creator, assignee in rows)
+        changes.commit()
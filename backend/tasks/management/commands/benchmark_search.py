@@ -0,0 +1,128 @@
+import random
+import statistics
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.test.utils import setup_databases, teardown_databases
+
+from tasks.models import Task
+from tasks.search import index_tasks, search_tasks
+
+User = get_user_model()
+
+WORDS = (
+    'toplantı rapor fatura müşteri sunum proje bütçe tasarım kod inceleme '
+    'test hata düzeltme sürüm plan hazırlık alışveriş kira sözleşme eğitim '
+    'görüşme teklif analiz veritabanı sunucu güncelleme belge çeviri ödeme '
+    'randevu doktor spor kitap okuma yazma taslak onay gönderim kargo'
+).split()
+SUFFIXES = ['', '', 'lar', 'ler', 'ı', 'i', 'ya', 'ye', 'nın', 'nin', 'ları', 'leri']
+SYLLABLES = ['ka', 'ra', 'me', 'te', 'sin', 'lik', 'yol', 'bah', 'dur', 'gen', 'ton', 'kur', 'çe', 'şa']
+
+# Doğal dile benzer (Zipf) dağılım: sık kelimeler başta, uzun bir kuyruk sonda
+VOCABULARY = WORDS + sorted({
+    ''.join(random.choices(SYLLABLES, k=3)) for _ in range(5000)
+} - set(WORDS))
+WEIGHTS = [1 / rank for rank in range(1, len(VOCABULARY) + 1)]
+
+
+def _text(words):
+    return ' '.join(
+        word + random.choice(SUFFIXES)
+        for word in random.choices(VOCABULARY, WEIGHTS, k=words)
+    )
+
+
+def _legacy_search(queryset, text):
+    """Eski SearchFilter davranışı: her terim için başlık/açıklamada icontains."""
+    for term in text.split():
+        queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+    return queryset
+
+
+class Command(BaseCommand):
+    help = (
+        'Görev aramasını eski LIKE taraması ile tam metin dizini arasında '
+        'geçici bir test veritabanında karşılaştırır.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=1_000_000)
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--iterations', type=int, default=20)
+
+    def handle(self, *args, **options):
+        # Geliştirme veritabanına dokunmamak için geçici test veritabanı kullanılır
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            self._run(options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+    def _seed(self, task_count, user_count):
+        users = User.objects.bulk_create(
+            User(email=f'bench{i}@example.com') for i in range(user_count)
+        )
+        batch = []
+        index_seconds = 0
+        for i in range(task_count):
+            batch.append(Task(
+                id=uuid.uuid4(),
+                title=_text(4),
+                description=_text(20),
+                created_by=random.choice(users),
+                assigned_to=random.choice(users),
+            ))
+            if len(batch) == 10_000 or i == task_count - 1:
+                Task.objects.bulk_create(batch)
+                started = time.perf_counter()
+                index_tasks(batch)
+                index_seconds += time.perf_counter() - started
+                batch = []
+                self.stdout.write(f'  {i + 1} görev eklendi', ending='\r')
+        self.stdout.write('')
+        self.stdout.write(f'Dizinleme: {task_count / index_seconds:,.0f} görev/sn')
+        return users
+
+    def _measure(self, build, users, queries):
+        timings = []
+        for i, text in enumerate(queries):
+            user = users[i % len(users)] if users else None
+            started = time.perf_counter()
+            queryset = build(text, user)
+            queryset.count()
+            list(queryset[:10])
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), max(timings)
+
+    def _run(self, options):
+        self.stdout.write(f"{options['tasks']} görev, {options['users']} kullanıcı oluşturuluyor...")
+        users = self._seed(options['tasks'], options['users'])
+        sample = random.sample(users, min(len(users), options['iterations']))
+
+        tail = VOCABULARY[len(WORDS):]
+        queries = {
+            'sık kelime': [random.choice(WORDS[:10]) for _ in range(options['iterations'])],
+            'nadir kelime': [random.choice(tail) for _ in range(options['iterations'])],
+            'iki kelime': [
+                f'{random.choice(WORDS)} {random.choice(tail)}' for _ in range(options['iterations'])
+            ],
+        }
+        cases = [
+            ('LIKE, tüm görevler', lambda text, user: _legacy_search(Task.objects.all(), text)),
+            ('FTS, tüm görevler', lambda text, user: search_tasks(Task.objects.all(), text)),
+            ('LIKE, kullanıcının görevleri',
+             lambda text, user: _legacy_search(Task.objects.visible_to(user), text)),
+            ('FTS, kullanıcının görevleri',
+             lambda text, user: search_tasks(Task.objects.visible_to(user), text, user)),
+        ]
+        self.stdout.write('COUNT + ilk 10 sonuç:')
+        for label, texts in queries.items():
+            for name, build in cases:
+                p50, worst = self._measure(build, sample, texts)
+                self.stdout.write(
+                    f'  {label:<12} {name:<30} p50={p50:8.1f} ms  max={worst:8.1f} ms'
+                )
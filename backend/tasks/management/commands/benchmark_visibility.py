@@ -0,0 +1,112 @@
+import random
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.test.utils import setup_databases, teardown_databases
+from django.utils import timezone
+
+from tasks.models import Subtask, Task
+
+User = get_user_model()
+
+
+def _legacy_tasks(user):
+    return Task.objects.filter(
+        models.Q(created_by=user) | models.Q(assigned_to=user)
+    ).distinct()
+
+
+def _legacy_subtasks(user):
+    return Subtask.objects.filter(
+        models.Q(created_by=user) |
+        models.Q(assigned_to=user) |
+        models.Q(parent_task__created_by=user)
+    ).distinct()
+
+
+class Command(BaseCommand):
+    help = (
+        'Görünürlük sorgularının eski (OR + DISTINCT) ve yeni (indeksli, '
+        'DISTINCT\'siz) hallerini geçici bir test veritabanında karşılaştırır.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=1_000_000)
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--explain', action='store_true', help='Sorgu planlarını yazdır')
+
+    def handle(self, *args, **options):
+        # Geliştirme veritabanına dokunmamak için geçici test veritabanı kullanılır
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            self._run(options)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+
+    def _seed(self, task_count, user_count):
+        users = User.objects.bulk_create(
+            User(email=f'bench{i}@example.com') for i in range(user_count)
+        )
+        now = timezone.now()
+        batch = []
+        subtasks = []
+        for i in range(task_count):
+            task = Task(
+                id=uuid.uuid4(),
+                title=f'Görev {i}',
+                description='',
+                status=random.choice(['todo', 'in_progress', 'review', 'done']),
+                created_by=random.choice(users),
+                assigned_to=random.choice(users),
+                due_date=now + timedelta(hours=random.randint(-500, 500)),
+            )
+            batch.append(task)
+            if i % 10 == 0:
+                subtasks.append(Subtask(
+                    parent_task=task, title='Alt görev',
+                    created_by=task.created_by, assigned_to=random.choice(users)
+                ))
+            if len(batch) == 10_000:
+                Task.objects.bulk_create(batch)
+                Subtask.objects.bulk_create(subtasks)
+                batch, subtasks = [], []
+                self.stdout.write(f'  {i + 1} görev eklendi', ending='\r')
+        Task.objects.bulk_create(batch)
+        Subtask.objects.bulk_create(subtasks)
+        self.stdout.write('')
+        return users
+
+    def _measure(self, build, users, iterations):
+        timings = []
+        for i in range(iterations):
+            user = users[i % len(users)]
+            started = time.perf_counter()
+            queryset = build(user)
+            queryset.count()
+            list(queryset[:10])
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), max(timings)
+
+    def _run(self, options):
+        self.stdout.write(f"{options['tasks']} görev, {options['users']} kullanıcı oluşturuluyor...")
+        users = self._seed(options['tasks'], options['users'])
+        sample = random.sample(users, min(len(users), options['iterations']))
+
+        cases = [
+            ('görevler (OR + DISTINCT)', _legacy_tasks),
+            ('görevler (OR, DISTINCT yok)', Task.objects.visible_to),
+            ('alt görevler (OR + DISTINCT)', _legacy_subtasks),
+            ('alt görevler (UNION)', Subtask.objects.visible_to),
+        ]
+        self.stdout.write('İlk sayfa (COUNT + 10 satır):')
+        for name, build in cases:
+            p50, worst = self._measure(build, sample, options['iterations'])
+            self.stdout.write(f'  {name:<30} p50={p50:8.1f} ms  max={worst:8.1f} ms')
+            if options['explain']:
+                self.stdout.write(build(sample[0])[:10].explain())
@@ -0,0 +1,30 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from tasks.notifications import NotificationDispatcher
+
+
+class Command(BaseCommand):
+    help = (
+        'Bildirim kuyruğundaki görev durum değişikliklerini toplu olarak '
+        'NOTIFICATIONS[\'SENDER\'] ile gönderir. Durdurulana kadar çalışır; '
+        '--once ile kuyruğu bir kez boşaltıp çıkar (cron için).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Kuyruğu bir kez boşalt ve çık')
+
+    def handle(self, *args, **options):
+        dispatcher = NotificationDispatcher()
+        if options['once']:
+            sent = dispatcher.dispatch()
+            self.stdout.write(self.style.SUCCESS(f'{sent} bildirim gönderildi.'))
+            return
+
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *args: stop.set())
+        self.stdout.write('Bildirim dağıtıcısı çalışıyor (durdurmak için Ctrl+C).')
+        dispatcher.run(stop)
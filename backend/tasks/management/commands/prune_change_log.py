@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from tasks.changes import get_sync_settings
+from tasks.models import ChangeLogEntry
+
+
+class Command(BaseCommand):
+    help = (
+        'Saklama süresinden eski senkronizasyon kayıtlarını siler. Daha eski '
+        'bir cursor ile gelen istemciler 410 alır ve tam senkronizasyon yapar.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None)
+
+    def handle(self, *args, **options):
+        days = options['days'] if options['days'] is not None else get_sync_settings()['RETENTION_DAYS']
+        cutoff = timezone.now() - timedelta(days=days)
+        # Günlük id sırasıyla yazıldığından sınır, kesimden sonraki ilk kayıttır.
+        # En son kayıt her zaman tutulur; budanan aralık ondan anlaşılır
+        boundary = (
+            ChangeLogEntry.objects.filter(created_at__gte=cutoff).order_by('id')
+            .values_list('id', flat=True).first()
+        )
+        if boundary is None:
+            boundary = ChangeLogEntry.objects.order_by('-id').values_list('id', flat=True).first()
+        if boundary is None:
+            self.stdout.write('Silinecek kayıt yok.')
+            return
+        deleted, _ = ChangeLogEntry.objects.filter(id__lt=boundary).delete()
+        self.stdout.write(self.style.SUCCESS(f'{deleted} değişiklik kaydı silindi.'))
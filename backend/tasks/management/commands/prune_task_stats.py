@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from tasks.stats import prune
+
+
+class Command(BaseCommand):
+    help = (
+        'Sıfıra inen pano istatistik sayaçlarını siler. Okumada eksik sayaç '
+        'sıfır sayılır; sayaçları yeniden hesaplamadığı için rebuild_task_stats '
+        'komutundan ucuzdur ve düzenli çalıştırılabilir.'
+    )
+
+    def handle(self, *args, **options):
+        deleted = prune()
+        self.stdout.write(self.style.SUCCESS(f'{deleted} sıfır istatistik sayacı silindi.'))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from tasks.models import Task
+from tasks.search import index_tasks
+
+
+class Command(BaseCommand):
+    help = (
+        'Tüm görevlerin arama belgelerini yeniden oluşturur. queryset.update() '
+        'gibi sinyal tetiklemeyen toplu değişikliklerden sonra kullanılır.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        batch = []
+        count = 0
+        tasks = Task.objects.order_by().only('title', 'description', 'created_by', 'assigned_to')
+        for task in tasks.iterator(chunk_size=options['batch_size']):
+            batch.append(task)
+            if len(batch) == options['batch_size']:
+                index_tasks(batch)
+                count += len(batch)
+                batch = []
+        index_tasks(batch)
+        count += len(batch)
+        self.stdout.write(self.style.SUCCESS(f'{count} görev dizinlendi.'))
@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.stats import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        'Pano istatistik sayaçlarını görevlerden yeniden hesaplar. Sayaçlar '
+        'normalde görev değişiklikleriyle artımlı güncellenir; sinyal '
+        'göndermeyen toplu değişikliklerden sonra veya tutarlılık kontrolü '
+        'için kullanılır. Sıfırlanan eski gün sayaçlarını da temizler.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='Yalnızca bu e-posta adresine sahip kullanıcı')
+
+    def handle(self, *args, **options):
+        user = None
+        if options['user']:
+            try:
+                user = get_user_model().objects.get(email=options['user'])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"Kullanıcı bulunamadı: {options['user']}")
+        created = rebuild(user=user)
+        self.stdout.write(self.style.SUCCESS(f'{created} sayaç yazıldı.'))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from tasks.jobs import requeue_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = (
+        'Süreç yeniden başlatıldığı için bekleyen veya çalışır durumda kalmış '
+        'ses dönüştürme işlerini bu süreçte yeniden çalıştırır. Sunucu '
+        'başlatılırken veya cron ile çalıştırılır.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--stale-seconds', type=int, default=None,
+                            help='Bu süreden eski işler (varsayılan JOB_STALE_SECONDS)')
+
+    def handle(self, *args, **options):
+        job_ids = requeue_stale_jobs(options['stale_seconds'])
+        if not job_ids:
+            self.stdout.write('Yarıda kalmış iş yok.')
+            return
+        done = failed = 0
+        for job_id in job_ids:
+            job = run_job(job_id)
+            if job is None:
+                # Başka bir süreç işi bu arada başlatmış
+                continue
+            if job.status == 'done':
+                done += 1
+            else:
+                failed += 1
+        self.stdout.write(self.style.SUCCESS(f'{done} iş tamamlandı, {failed} iş başarısız.'))
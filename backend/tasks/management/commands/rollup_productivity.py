@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils import timezone
+
+from tasks.analytics import rollup
+from tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        'Tamamlanan görevlerin günlük verimlilik özetlerini yeniden hesaplar. '
+        'Varsayılan olarak dün ve bugün özetlenir; saatlik veya gecelik '
+        'çalıştırılması önerilir. Geçmiş görevler toplu olarak '
+        'değiştirildiyse --days veya --all ile yeniden çalıştırılır.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=2, help='Bugünle biten gün sayısı')
+        parser.add_argument('--all', action='store_true', help='İlk tamamlanan görevden bugüne kadar')
+        parser.add_argument('--user', help='Yalnızca bu e-posta adresine sahip kullanıcı')
+
+    def handle(self, *args, **options):
+        user = None
+        if options['user']:
+            try:
+                user = get_user_model().objects.get(email=options['user'])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"Kullanıcı bulunamadı: {options['user']}")
+        if options['days'] < 1:
+            raise CommandError('--days en az 1 olmalıdır.')
+
+        end = timezone.localdate()
+        start = end - timedelta(days=options['days'] - 1)
+        if options['all']:
+            first = Task.objects.filter(status='done').aggregate(first=Min('completed_at'))['first']
+            start = timezone.localdate(first) if first else end
+        tasks, rows = rollup(start, end, user=user)
+        self.stdout.write(self.style.SUCCESS(
+            f'{start} - {end}: {tasks} görev {rows} günlük özete yazıldı.'
+        ))
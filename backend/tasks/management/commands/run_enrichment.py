@@ -0,0 +1,41 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from tasks.enrichment import EnrichmentPipeline
+
+
+class Command(BaseCommand):
+    help = (
+        'Başlığı veya açıklaması değişen görevlerin AI alanlarını '
+        '(ai_tags, ai_summary, ai_suggestions) ENRICHMENT[\'CLIENT\'] ile '
+        'doldurur. Durdurulana kadar çalışır; --once ile tüm görevleri bir '
+        'kez tarayıp çıkar (cron için).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Tek tur çalış ve çık')
+
+    def handle(self, *args, **options):
+        pipeline = EnrichmentPipeline()
+        if options['once']:
+            pipeline.run_once()
+        else:
+            stop = threading.Event()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(signum, lambda *args: stop.set())
+            self.stdout.write('Zenginleştirme hattı çalışıyor (durdurmak için Ctrl+C).')
+            pipeline.run(stop)
+        self._report(pipeline.stats.as_dict())
+
+    def _report(self, stats):
+        self.stdout.write(self.style.SUCCESS(
+            f"{stats['tasks']} görev zenginleştirildi ({stats['cached']} önbellekten), "
+            f"{stats['requests']} istek, görev başına {stats['tokens_per_task']} token, "
+            f"{stats['tasks_per_second']} görev/sn."
+        ))
+        if stats['failed']:
+            self.stdout.write(self.style.ERROR(
+                f"{stats['failed']} görev işlenemedi; son hata: {stats['last_error'] or 'geçersiz yanıt'}"
+            ))
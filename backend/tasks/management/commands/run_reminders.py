@@ -0,0 +1,31 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from tasks.reminders import ReminderScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        'Görevlerin hatırlatma (reminder_date) ve bitiş (due_date) zamanı '
+        'geldiğinde REMINDERS[\'SENDER\'] ile bildirim gönderir. Durdurulana '
+        'kadar çalışır; --once ile tek tur çalışıp çıkar (cron için).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Tek tur çalış ve çık')
+
+    def handle(self, *args, **options):
+        scheduler = ReminderScheduler()
+        if options['once']:
+            sent = scheduler.tick()
+            self.stdout.write(self.style.SUCCESS(f'{sent} hatırlatma gönderildi.'))
+            return
+
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *args: stop.set())
+        self.stdout.write('Hatırlatma zamanlayıcısı çalışıyor (durdurmak için Ctrl+C).')
+        scheduler.run(stop)
+        self.stdout.write(self.style.SUCCESS(f'{scheduler.sent} hatırlatma gönderildi.'))
@@ -1,6 +1,8 @@
-# Generated by Django 5.2 on 2025-04-28 23:26
+# Generated by Django 5.2.18 on 2026-10-18 05:13
 
+import django.core.validators
 import django.db.models.deletion
+import uuid
 from django.conf import settings
 from django.db import migrations, models
 
@@ -14,22 +16,107 @@ class Migration(migrations.Migration):
     ]
 
     operations = [
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, verbose_name='kategori adı')),
+                ('description', models.TextField(blank=True, verbose_name='açıklama')),
+                ('color', models.CharField(default='#007bff', max_length=7, verbose_name='renk kodu')),
+                ('icon', models.CharField(blank=True, max_length=50, verbose_name='icon')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='oluşturulma tarihi')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='categories', to=settings.AUTH_USER_MODEL, verbose_name='created by')),
+            ],
+            options={
+                'verbose_name': 'kategori',
+                'verbose_name_plural': 'kategoriler',
+                'ordering': ['name'],
+                'unique_together': {('name', 'created_by')},
+            },
+        ),
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=50, verbose_name='etiket adı')),
+                ('color', models.CharField(default='#6c757d', max_length=7, verbose_name='renk kodu')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tags', to=settings.AUTH_USER_MODEL, verbose_name='created by')),
+            ],
+            options={
+                'verbose_name': 'etiket',
+                'verbose_name_plural': 'etiketler',
+                'ordering': ['name'],
+                'unique_together': {('name', 'created_by')},
+            },
+        ),
         migrations.CreateModel(
             name='Task',
             fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('title', models.CharField(max_length=200)),
-                ('description', models.TextField(blank=True)),
-                ('status', models.CharField(choices=[('TODO', 'To Do'), ('IN_PROGRESS', 'In Progress'), ('DONE', 'Done')], default='TODO', max_length=20)),
-                ('created_at', models.DateTimeField(auto_now_add=True)),
-                ('updated_at', models.DateTimeField(auto_now=True)),
-                ('due_date', models.DateTimeField(blank=True, null=True)),
-                ('tags', models.JSONField(blank=True, default=list)),
-                ('priority', models.IntegerField(default=0)),
-                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to=settings.AUTH_USER_MODEL)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=200, verbose_name='başlık')),
+                ('description', models.TextField(verbose_name='açıklama')),
+                ('status', models.CharField(choices=[('todo', 'Yapılacak'), ('in_progress', 'Devam Ediyor'), ('review', 'İncelemede'), ('done', 'Tamamlandı'), ('cancelled', 'İptal Edildi')], default='todo', max_length=20, verbose_name='durum')),
+                ('priority', models.IntegerField(choices=[(1, 'Düşük'), (2, 'Normal'), (3, 'Yüksek'), (4, 'Acil')], default=2, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(4)], verbose_name='öncelik')),
+                ('due_date', models.DateTimeField(blank=True, null=True, verbose_name='bitiş tarihi')),
+                ('reminder_date', models.DateTimeField(blank=True, null=True, verbose_name='reminder date')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='completed at')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='oluşturulma tarihi')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='güncellenme tarihi')),
+                ('estimated_time', models.DurationField(blank=True, null=True, verbose_name='estimated time')),
+                ('actual_time', models.DurationField(blank=True, null=True, verbose_name='actual time')),
+                ('ai_tags', models.JSONField(blank=True, default=dict, verbose_name='AI tags')),
+                ('ai_summary', models.TextField(blank=True, verbose_name='AI özeti')),
+                ('ai_suggestions', models.TextField(blank=True, verbose_name='AI önerileri')),
+                ('voice_note', models.FileField(blank=True, null=True, upload_to='voice_notes/', verbose_name='ses notu')),
+                ('assigned_to', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assigned_tasks', to=settings.AUTH_USER_MODEL, verbose_name='atanan kişi')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tasks', to='tasks.category', verbose_name='kategori')),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='created_tasks', to=settings.AUTH_USER_MODEL, verbose_name='oluşturan')),
+                ('tags', models.ManyToManyField(blank=True, related_name='tasks', to='tasks.tag', verbose_name='etiketler')),
+            ],
+            options={
+                'verbose_name': 'görev',
+                'verbose_name_plural': 'görevler',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Subtask',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=200, verbose_name='başlık')),
+                ('description', models.TextField(blank=True, verbose_name='description')),
+                ('is_completed', models.BooleanField(default=False, verbose_name='tamamlandı mı')),
+                ('due_date', models.DateTimeField(blank=True, null=True, verbose_name='due date')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='oluşturulma tarihi')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='updated at')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='tamamlanma tarihi')),
+                ('assigned_to', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='assigned_subtasks', to=settings.AUTH_USER_MODEL, verbose_name='assigned to')),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='created_subtasks', to=settings.AUTH_USER_MODEL, verbose_name='created by')),
+                ('parent_task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='subtasks', to='tasks.task', verbose_name='ana görev')),
+            ],
+            options={
+                'verbose_name': 'alt görev',
+                'verbose_name_plural': 'alt görevler',
+                'ordering': ['created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TaskComment',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('content', models.TextField(verbose_name='yorum')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='oluşturulma tarihi')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='güncellenme tarihi')),
+                ('attachment', models.FileField(blank=True, null=True, upload_to='task_attachments/', verbose_name='dosya eki')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='tasks.task', verbose_name='görev')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_comments', to=settings.AUTH_USER_MODEL, verbose_name='kullanıcı')),
             ],
             options={
-                'ordering': ['priority', '-created_at'],
+                'verbose_name': 'görev yorumu',
+                'verbose_name_plural': 'görev yorumları',
+                'ordering': ['-created_at'],
             },
         ),
     ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:14
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptionJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('audio', models.FileField(upload_to='voice_notes/', verbose_name='ses dosyası')),
+                ('language', models.CharField(default='tr', max_length=10, verbose_name='dil')),
+                ('status', models.CharField(choices=[('pending', 'Beklemede'), ('running', 'İşleniyor'), ('done', 'Tamamlandı'), ('failed', 'Başarısız')], default='pending', max_length=20, verbose_name='durum')),
+                ('text', models.TextField(blank=True, verbose_name='metin')),
+                ('error', models.TextField(blank=True, verbose_name='hata')),
+                ('apply_to', models.CharField(blank=True, choices=[('description', 'Açıklama'), ('ai_summary', 'AI özeti')], max_length=20, verbose_name='yazılacak alan')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='oluşturulma tarihi')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='başlama tarihi')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='bitiş tarihi')),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transcription_jobs', to=settings.AUTH_USER_MODEL, verbose_name='oluşturan')),
+                ('task', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='transcription_jobs', to='tasks.task', verbose_name='görev')),
+            ],
+            options={
+                'verbose_name': 'ses dönüştürme işi',
+                'verbose_name_plural': 'ses dönüştürme işleri',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
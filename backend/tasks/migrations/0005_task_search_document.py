@@ -0,0 +1,134 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE tasks_task_fts USING fts5(
+        title, description, owners,
+        content='tasks_tasksearchdocument', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 0'
+    )
+    """,
+    """
+    CREATE TRIGGER tasks_task_fts_ai AFTER INSERT ON tasks_tasksearchdocument BEGIN
+        INSERT INTO tasks_task_fts(rowid, title, description, owners)
+        VALUES (new.id, new.title, new.description, new.owners);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_task_fts_ad AFTER DELETE ON tasks_tasksearchdocument BEGIN
+        INSERT INTO tasks_task_fts(tasks_task_fts, rowid, title, description, owners)
+        VALUES ('delete', old.id, old.title, old.description, old.owners);
+    END
+    """,
+    """
+    CREATE TRIGGER tasks_task_fts_au AFTER UPDATE ON tasks_tasksearchdocument BEGIN
+        INSERT INTO tasks_task_fts(tasks_task_fts, rowid, title, description, owners)
+        VALUES ('delete', old.id, old.title, old.description, old.owners);
+        INSERT INTO tasks_task_fts(rowid, title, description, owners)
+        VALUES (new.id, new.title, new.description, new.owners);
+    END
+    """,
+    # Başlıktaki eşleşmeler açıklamadakilerin iki katı ağırlıklıdır; owners puana katılmaz
+    "INSERT INTO tasks_task_fts(tasks_task_fts, rank) VALUES ('rank', 'bm25(2.0, 1.0, 0.0)')",
+]
+
+SQLITE_BACKWARD = [
+    'DROP TRIGGER IF EXISTS tasks_task_fts_au',
+    'DROP TRIGGER IF EXISTS tasks_task_fts_ad',
+    'DROP TRIGGER IF EXISTS tasks_task_fts_ai',
+    'DROP TABLE IF EXISTS tasks_task_fts',
+]
+
+
+def _postgresql_index(apps):
+    from django.contrib.postgres.indexes import GinIndex
+
+    from tasks.search import search_vector
+
+    return apps.get_model('tasks', 'TaskSearchDocument'), GinIndex(
+        search_vector('title', 'description'), name='task_search_gin_idx'
+    )
+
+
+def create_search_index(apps, schema_editor):
+    """SQLite'ta FTS5 tablosunu, PostgreSQL'de tsvector GIN dizinini oluşturur."""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        for sql in SQLITE_FORWARD:
+            schema_editor.execute(sql)
+    elif vendor == 'postgresql':
+        schema_editor.add_index(*_postgresql_index(apps))
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        for sql in SQLITE_BACKWARD:
+            schema_editor.execute(sql)
+    elif vendor == 'postgresql':
+        schema_editor.remove_index(*_postgresql_index(apps))
+
+
+def build_documents(apps, schema_editor):
+    """Mevcut görevlerin arama belgelerini oluşturur."""
+    from tasks.search import normalize, owners
+
+    Task = apps.get_model('tasks', 'Task')
+    TaskSearchDocument = apps.get_model('tasks', 'TaskSearchDocument')
+    tasks = Task.objects.using(schema_editor.connection.alias).only(
+        'title', 'description', 'created_by', 'assigned_to'
+    )
+    TaskSearchDocument.objects.using(schema_editor.connection.alias).bulk_create(
+        (
+            TaskSearchDocument(
+                task_id=task.pk,
+                title=normalize(task.title),
+                description=normalize(task.description),
+                owners=owners(task)
+            )
+            for task in tasks.iterator(chunk_size=2000)
+        ),
+        batch_size=2000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_my_tasks_due_date_desc_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskSearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.TextField()),
+                ('description', models.TextField()),
+                ('owners', models.TextField()),
+                ('task', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='search_document', to='tasks.task')),
+            ],
+            options={
+                'verbose_name': 'arama belgesi',
+                'verbose_name_plural': 'arama belgeleri',
+            },
+        ),
+        migrations.CreateModel(
+            name='TaskSearchIndex',
+            fields=[
+                ('document', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='fts', serialize=False, to='tasks.tasksearchdocument')),
+                ('match', models.TextField(db_column='tasks_task_fts')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'tasks_task_fts',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(build_documents, migrations.RunPython.noop),
+    ]
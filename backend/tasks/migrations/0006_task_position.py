@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:26
+
+import tasks.ranking
+from django.conf import settings
+from django.db import migrations, models
+
+
+def use_binary_collation(apps, schema_editor):
+    """Sıra anahtarları bayt sırasıyla karşılaştırılmalıdır (SQLite'ta varsayılan)."""
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'ALTER TABLE tasks_task ALTER COLUMN position TYPE varchar(255) COLLATE "C"'
+        )
+
+
+def assign_positions(apps, schema_editor):
+    """Mevcut görevleri oluşturulma sırasına göre sıralar."""
+    from tasks.ranking import key_for_time
+
+    Task = apps.get_model('tasks', 'Task')
+    tasks = Task.objects.using(schema_editor.connection.alias).only('created_at')
+    batch = []
+    for task in tasks.order_by('created_at').iterator(chunk_size=2000):
+        task.position = key_for_time(task.created_at.timestamp())
+        batch.append(task)
+        if len(batch) == 2000:
+            Task.objects.using(schema_editor.connection.alias).bulk_update(batch, ['position'])
+            batch = []
+    Task.objects.using(schema_editor.connection.alias).bulk_update(batch, ['position'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_search_document'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='position',
+            field=models.CharField(default=tasks.ranking.key_for_time, max_length=255, verbose_name='sıra'),
+        ),
+        migrations.RunPython(use_binary_collation, migrations.RunPython.noop),
+        migrations.RunPython(assign_positions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assigned_to', 'status', 'position'], name='task_assignee_status_pos_idx'),
+        ),
+    ]
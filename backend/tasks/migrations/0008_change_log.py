@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def _entries(ChangeLogEntry, model, rows):
+    for object_id, *user_ids in rows:
+        for user_id in dict.fromkeys(user_ids):
+            if user_id is not None:
+                yield ChangeLogEntry(user_id=user_id, model=model, object_id=object_id, action='create')
+
+
+def backfill_change_log(apps, schema_editor):
+    """Mevcut kayıtlar için oluşturma kayıtları; since=0 tam senkronizasyon olur."""
+    alias = schema_editor.connection.alias
+    ChangeLogEntry = apps.get_model('tasks', 'ChangeLogEntry')
+    sources = [
+        ('task', apps.get_model('tasks', 'Task'), ('pk', 'created_by', 'assigned_to')),
+        ('subtask', apps.get_model('tasks', 'Subtask'), ('pk', 'created_by', 'assigned_to', 'parent_task__created_by')),
+        ('comment', apps.get_model('tasks', 'TaskComment'), ('pk', 'user', 'task__created_by', 'task__assigned_to')),
+    ]
+    for model, Model, fields in sources:
+        rows = Model.objects.using(alias).order_by('created_at').values_list(*fields)
+        ChangeLogEntry.objects.using(alias).bulk_create(
+            _entries(ChangeLogEntry, model, rows.iterator(chunk_size=2000)), batch_size=2000
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_tag_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(choices=[('task', 'Görev'), ('subtask', 'Alt görev'), ('comment', 'Yorum')], max_length=10, verbose_name='nesne türü')),
+                ('object_id', models.UUIDField(verbose_name='nesne kimliği')),
+                ('action', models.CharField(choices=[('create', 'Oluşturma'), ('update', 'Güncelleme'), ('delete', 'Silme')], max_length=10, verbose_name='işlem')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='oluşturulma tarihi')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='change_log', to=settings.AUTH_USER_MODEL, verbose_name='kullanıcı')),
+            ],
+            options={
+                'verbose_name': 'değişiklik kaydı',
+                'verbose_name_plural': 'değişiklik kayıtları',
+                'indexes': [models.Index(fields=['user', 'id'], name='changelog_user_id_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_change_log, migrations.RunPython.noop),
+    ]
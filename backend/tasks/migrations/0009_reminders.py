@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_change_log'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderDelivery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('reminder', 'Hatırlatma'), ('due', 'Bitiş tarihi')], max_length=10, verbose_name='tür')),
+                ('scheduled_for', models.DateTimeField(verbose_name='planlanan zaman')),
+                ('sent_at', models.DateTimeField(auto_now_add=True, verbose_name='gönderilme tarihi')),
+            ],
+            options={
+                'verbose_name': 'gönderilen hatırlatma',
+                'verbose_name_plural': 'gönderilen hatırlatmalar',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['reminder_date'], name='task_reminder_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['due_date'], name='task_due_date_idx'),
+        ),
+        migrations.AddField(
+            model_name='reminderdelivery',
+            name='task',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='reminder_deliveries', to='tasks.task', verbose_name='görev'),
+        ),
+        migrations.AddIndex(
+            model_name='reminderdelivery',
+            index=models.Index(fields=['scheduled_for'], name='reminder_delivery_time_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='reminderdelivery',
+            constraint=models.UniqueConstraint(fields=('task', 'kind', 'scheduled_for'), name='reminder_delivery_unique'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0009_reminders'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('todo', 'Yapılacak'), ('in_progress', 'Devam Ediyor'), ('review', 'İncelemede'), ('done', 'Tamamlandı'), ('cancelled', 'İptal Edildi')], max_length=20, verbose_name='durum')),
+                ('available_at', models.DateTimeField(verbose_name='gönderilebilir olduğu zaman')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='deneme sayısı')),
+                ('last_error', models.TextField(blank=True, verbose_name='son hata')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='oluşturulma tarihi')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_outbox', to='tasks.task', verbose_name='görev')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_outbox', to=settings.AUTH_USER_MODEL, verbose_name='kullanıcı')),
+            ],
+            options={
+                'verbose_name': 'bildirim kuyruğu kaydı',
+                'verbose_name_plural': 'bildirim kuyruğu kayıtları',
+                'indexes': [models.Index(fields=['available_at'], name='outbox_available_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_task_stats(apps, schema_editor):
+    """Mevcut görevlerin pano sayaçlarını hesaplar."""
+    from tasks.stats import rebuild
+
+    rebuild(
+        task_model=apps.get_model('tasks', 'Task'),
+        counter_model=apps.get_model('tasks', 'TaskStatsCounter'),
+        using=schema_editor.connection.alias,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_notification_outbox'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskStatsCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, verbose_name='anahtar')),
+                ('value', models.BigIntegerField(default=0, verbose_name='değer')),
+                ('user', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='task_stats', to=settings.AUTH_USER_MODEL, verbose_name='kullanıcı')),
+            ],
+            options={
+                'verbose_name': 'görev istatistiği',
+                'verbose_name_plural': 'görev istatistikleri',
+                'constraints': [models.UniqueConstraint(fields=('user', 'key'), name='task_stats_user_key_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_task_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0011_task_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyProductivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='gün')),
+                ('completed', models.PositiveIntegerField(default=0, verbose_name='tamamlanan görev')),
+                ('lead_time_total', models.BigIntegerField(default=0, verbose_name='toplam tamamlanma süresi (sn)')),
+                ('lead_time_histogram', models.BinaryField(default=bytes, verbose_name='tamamlanma süresi histogramı')),
+                ('estimated_count', models.PositiveIntegerField(default=0, verbose_name='tahminli görev')),
+                ('estimated_total', models.BigIntegerField(default=0, verbose_name='toplam tahmini süre (sn)')),
+                ('actual_total', models.BigIntegerField(default=0, verbose_name='toplam gerçek süre (sn)')),
+                ('accuracy_histogram', models.BinaryField(default=bytes, verbose_name='tahmin isabeti histogramı')),
+            ],
+            options={
+                'verbose_name': 'günlük verimlilik özeti',
+                'verbose_name_plural': 'günlük verimlilik özetleri',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['completed_at'], name='task_completed_at_idx'),
+        ),
+        migrations.AddField(
+            model_name='dailyproductivity',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='daily_productivity', to=settings.AUTH_USER_MODEL, verbose_name='kullanıcı'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyproductivity',
+            constraint=models.UniqueConstraint(fields=('user', 'day'), name='productivity_user_day_unique'),
+        ),
+    ]
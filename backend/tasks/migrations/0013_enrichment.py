@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0012_daily_productivity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='ai_content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64, verbose_name='AI içerik özeti'),
+        ),
+        migrations.CreateModel(
+            name='EnrichmentCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, verbose_name='içerik özeti')),
+                ('model', models.CharField(max_length=100, verbose_name='model')),
+                ('tags', models.JSONField(default=list, verbose_name='etiketler')),
+                ('summary', models.TextField(blank=True, verbose_name='özet')),
+                ('suggestions', models.TextField(blank=True, verbose_name='öneriler')),
+                ('prompt_tokens', models.PositiveIntegerField(default=0, verbose_name='girdi token')),
+                ('output_tokens', models.PositiveIntegerField(default=0, verbose_name='çıktı token')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='oluşturulma tarihi')),
+            ],
+            options={
+                'verbose_name': 'AI zenginleştirme önbelleği',
+                'verbose_name_plural': 'AI zenginleştirme önbelleği',
+                'constraints': [models.UniqueConstraint(fields=('content_hash', 'model'), name='enrichment_cache_hash_model_unique')],
+            },
+        ),
+    ]
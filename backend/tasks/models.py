@@ -5,6 +5,28 @@ from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from .ranking import key_for_time
+
+
+class LoadedValuesMixin:
+    """
+    Veritabanından yüklenen nesnenin TRACKED_FIELDS alanlarının o andaki
+    değerlerini _loaded_values'ta tutar. Sahip değiştiğinde eski
+    sahiplerin önbelleği ve senkronizasyon kayıtları da güncellenir; durum
+    geçişleri anlık bildirim olarak yayınlanır.
+    """
+    TRACKED_FIELDS = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_loaded_values()
+        return instance
+
+    def remember_loaded_values(self):
+        """Kaydedilen değerleri bir sonraki değişikliğin 'eski' değerleri yapar."""
+        self._loaded_values = {name: self.__dict__.get(name) for name in self.TRACKED_FIELDS}
+
 class Category(models.Model):
     """
     Görev kategorileri (örn. İş, Kişisel, Alışveriş, vb.)
@@ -46,6 +68,7 @@ class Tag(models.Model):
         verbose_name=_('created by')
     )
     created_at = models.DateTimeField(_('created at'), auto_now_add=True)
+    updated_at = models.DateTimeField(_('updated at'), auto_now=True)
 
     class Meta:
         verbose_name = _('etiket')
@@ -56,10 +79,91 @@ class Tag(models.Model):
     def __str__(self):
         return self.name
 
-class Task(models.Model):
+class TaskQuerySet(models.QuerySet):
+    """Görev sorguları için yardımcı metotlar."""
+
+    def visible_to(self, user):
+        """
+        Kullanıcının oluşturduğu veya kendisine atanan görevler.
+
+        Tek tablo üzerinde olduğundan koşul satır çoğaltmaz; DISTINCT
+        gerekmez. İki koşul da kendi bileşik indeksiyle çözülür
+        (SQLite MULTI-INDEX OR, PostgreSQL BitmapOr).
+        """
+        return self.filter(models.Q(created_by=user) | models.Q(assigned_to=user))
+
+    def visible_ids(self, user):
+        """Erişilebilen görev kimlikleri (alt sorgu olarak kullanılmak üzere)."""
+        return self.model.objects.visible_to(user).order_by().values('pk')
+
+    # Serializer alanı -> önceden yüklenmesi gereken ilişki
+    SELECT_RELATED_FIELDS = {
+        'created_by_username': 'created_by',
+        'assigned_to_username': 'assigned_to',
+    }
+    PREFETCH_FIELDS = {
+        'category_detail': 'category',
+        'tags': 'tags',
+        'tags_detail': 'tags',
+        'subtasks': 'subtasks',
+        'comments': 'comments',
+    }
+
+    def _prefetch(self, relation):
+        if relation == 'category':
+            return models.Prefetch(
+                'category',
+                queryset=Category.objects.annotate(num_tasks=models.Count('tasks'))
+            )
+        if relation == 'subtasks':
+            return models.Prefetch(
+                'subtasks',
+                queryset=Subtask.objects.select_related('created_by', 'assigned_to')
+            )
+        if relation == 'comments':
+            return models.Prefetch(
+                'comments',
+                queryset=TaskComment.objects.select_related('user')
+            )
+        return relation
+
+    def with_details(self, fields=None):
+        """
+        TaskSerializer'ın iç içe alanları için ilişkileri önceden yükler.
+        Sayfadaki görev sayısından bağımsız, sabit sayıda sorgu çalışır.
+
+        fields verilirse yalnızca bu serializer alanlarının ihtiyaç duyduğu
+        sütunlar (.only()) ve ilişkiler yüklenir.
+        """
+        if fields is None:
+            select = set(self.SELECT_RELATED_FIELDS.values())
+            prefetch = set(self.PREFETCH_FIELDS.values())
+            queryset = self
+        else:
+            select = {self.SELECT_RELATED_FIELDS[f] for f in fields if f in self.SELECT_RELATED_FIELDS}
+            prefetch = {self.PREFETCH_FIELDS[f] for f in fields if f in self.PREFETCH_FIELDS}
+            concrete = {f.name for f in self.model._meta.concrete_fields}
+            columns = {'id'} | {f for f in fields if f in concrete} | select
+            if 'category' in prefetch:
+                columns.add('category')
+            queryset = self.only(*columns)
+
+        if select:
+            queryset = queryset.select_related(*sorted(select))
+        if prefetch:
+            queryset = queryset.prefetch_related(*(self._prefetch(r) for r in sorted(prefetch)))
+        return queryset
+
+class Task(LoadedValuesMixin, models.Model):
     """
     Ana görev modeli
     """
+    TRACKED_FIELDS = (
+        'created_by_id', 'assigned_to_id', 'category_id', 'status',
+        # Pano istatistiklerinin eski katkısı için (bkz. tasks.stats)
+        'priority', 'due_date', 'completed_at', 'estimated_time', 'actual_time',
+    )
+
     PRIORITY_CHOICES = [
         (1, _('Düşük')),
         (2, _('Normal')),
@@ -109,6 +213,9 @@ class Task(models.Model):
         validators=[MinValueValidator(1), MaxValueValidator(4)]
     )
     
+    # Kanban sırası (kesirli sıra anahtarı, bkz. tasks.ranking)
+    position = models.CharField(_('sıra'), max_length=255, default=key_for_time)
+
     # Tarihler
     due_date = models.DateTimeField(_('bitiş tarihi'), null=True, blank=True)
     reminder_date = models.DateTimeField(_('reminder date'), null=True, blank=True)
@@ -140,6 +247,8 @@ class Task(models.Model):
     ai_tags = models.JSONField(_('AI tags'), default=dict, blank=True)
     ai_summary = models.TextField(_('AI özeti'), blank=True)
     ai_suggestions = models.TextField(_('AI önerileri'), blank=True)
+    # AI alanlarının üretildiği başlık+açıklamanın özeti (bkz. tasks.enrichment)
+    ai_content_hash = models.CharField(_('AI içerik özeti'), max_length=64, blank=True, editable=False)
     
     # Ses kaydı için alan
     voice_note = models.FileField(
@@ -148,11 +257,23 @@ class Task(models.Model):
         null=True,
         blank=True
     )
+
+    objects = TaskQuerySet.as_manager()
     
     class Meta:
         verbose_name = _('görev')
         verbose_name_plural = _('görevler')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['assigned_to', 'status', '-due_date'], name='task_assignee_status_due_idx'),
+            models.Index(fields=['created_by', 'created_at'], name='task_creator_created_idx'),
+            models.Index(fields=['assigned_to', 'status', 'position'], name='task_assignee_status_pos_idx'),
+            # Hatırlatma zamanlayıcısının aralık sorguları (bkz. tasks.reminders)
+            models.Index(fields=['reminder_date'], name='task_reminder_date_idx'),
+            models.Index(fields=['due_date'], name='task_due_date_idx'),
+            # Günlük verimlilik özetlerinin aralık sorguları (bkz. tasks.analytics)
+            models.Index(fields=['completed_at'], name='task_completed_at_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -168,10 +289,70 @@ class Task(models.Model):
             from django.utils import timezone
             self.completed_at = timezone.now()
 
-class Subtask(models.Model):
+class TaskSearchDocument(models.Model):
+    """
+    Görev başlık ve açıklamasının arama için normalize edilmiş hali
+    (Türkçe küçük harf, kökler ve yüzey biçimleri) ve görevi görebilen
+    kullanıcıların belirteçleri. Tam metin dizini bu tablo üzerine kurulur;
+    bkz. tasks.search.
+    """
+    task = models.OneToOneField(
+        Task,
+        on_delete=models.CASCADE,
+        related_name='search_document'
+    )
+    title = models.TextField()
+    description = models.TextField()
+    owners = models.TextField()
+
+    class Meta:
+        verbose_name = _('arama belgesi')
+        verbose_name_plural = _('arama belgeleri')
+
+
+class TaskSearchIndex(models.Model):
+    """
+    SQLite'taki FTS5 sanal tablosu; yalnızca sorgularda birleştirme için
+    kullanılır. 'match' alanı tablonun gizli sütunudur, 'rank' bm25 puanıdır.
+    """
+    document = models.OneToOneField(
+        TaskSearchDocument,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column='rowid',
+        related_name='fts'
+    )
+    match = models.TextField(db_column='tasks_task_fts')
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'tasks_task_fts'
+
+
+class SubtaskQuerySet(models.QuerySet):
+    """Alt görev sorguları için yardımcı metotlar."""
+
+    def visible_to(self, user):
+        """
+        Kullanıcının oluşturduğu, kendisine atanan veya ana görevini
+        oluşturduğu alt görevler; indeksli alt sorguların UNION'ı ile.
+        """
+        base = self.model.objects.order_by()
+        visible_ids = base.filter(created_by=user).values('pk').union(
+            base.filter(assigned_to=user).values('pk'),
+            base.filter(
+                parent_task__in=Task.objects.filter(created_by=user).order_by().values('pk')
+            ).values('pk')
+        )
+        return self.filter(pk__in=visible_ids)
+
+class Subtask(LoadedValuesMixin, models.Model):
     """
     Alt görev modeli
     """
+    TRACKED_FIELDS = ('created_by_id', 'assigned_to_id', 'is_completed')
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     parent_task = models.ForeignKey(
         Task,
@@ -201,6 +382,8 @@ class Subtask(models.Model):
     updated_at = models.DateTimeField(_('updated at'), auto_now=True)
     completed_at = models.DateTimeField(_('tamamlanma tarihi'), null=True, blank=True)
 
+    objects = SubtaskQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('alt görev')
         verbose_name_plural = _('alt görevler')
@@ -217,6 +400,20 @@ class Subtask(models.Model):
             from django.utils import timezone
             self.completed_at = timezone.now()
 
+class TaskCommentQuerySet(models.QuerySet):
+    """Görev yorumu sorguları için yardımcı metotlar."""
+
+    def visible_to(self, user):
+        """
+        Kullanıcının yazdığı yorumlar ile erişebildiği görevlerin yorumları;
+        indeksli alt sorguların UNION'ı ile.
+        """
+        base = self.model.objects.order_by()
+        visible_ids = base.filter(user=user).values('pk').union(
+            base.filter(task__in=Task.objects.visible_ids(user)).values('pk')
+        )
+        return self.filter(pk__in=visible_ids)
+
 class TaskComment(models.Model):
     """
     Görev yorumları
@@ -246,10 +443,279 @@ class TaskComment(models.Model):
         blank=True
     )
 
+    objects = TaskCommentQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('görev yorumu')
         verbose_name_plural = _('görev yorumları')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['task', 'created_at'], name='comment_task_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.created_at.strftime('%Y-%m-%d %H:%M')}"
+
+class TranscriptionJob(models.Model):
+    """
+    Asenkron ses-metin dönüştürme işi.
+    Ses kaydı alınır alınmaz iş oluşturulur; dönüştürme arka planda yapılır.
+    """
+    STATUS_CHOICES = [
+        ('pending', _('Beklemede')),
+        ('running', _('İşleniyor')),
+        ('done', _('Tamamlandı')),
+        ('failed', _('Başarısız'))
+    ]
+
+    APPLY_TO_CHOICES = [
+        ('description', _('Açıklama')),
+        ('ai_summary', _('AI özeti'))
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        verbose_name=_('oluşturan'),
+        related_name='transcription_jobs'
+    )
+    audio = models.FileField(_('ses dosyası'), upload_to='voice_notes/')
+    language = models.CharField(_('dil'), max_length=10, default='tr')
+    status = models.CharField(
+        _('durum'),
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='pending'
+    )
+    text = models.TextField(_('metin'), blank=True)
+    error = models.TextField(_('hata'), blank=True)
+
+    # İsteğe bağlı: sonuç bu göreve yazılır
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name=_('görev'),
+        related_name='transcription_jobs'
+    )
+    apply_to = models.CharField(
+        _('yazılacak alan'),
+        max_length=20,
+        choices=APPLY_TO_CHOICES,
+        blank=True
+    )
+
+    created_at = models.DateTimeField(_('oluşturulma tarihi'), auto_now_add=True)
+    started_at = models.DateTimeField(_('başlama tarihi'), null=True, blank=True)
+    finished_at = models.DateTimeField(_('bitiş tarihi'), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('ses dönüştürme işi')
+        verbose_name_plural = _('ses dönüştürme işleri')
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.id} ({self.status})"
+
+
+class ChangeLogEntry(models.Model):
+    """
+    Senkronizasyon için yalnızca eklenen değişiklik günlüğü. Her değişiklik,
+    nesneyi gören (veya görmeyi bırakan) her kullanıcı için bir satırdır;
+    artan id istemcinin cursor'ıdır. Kayıt yalnızca nesne türü, kimliği ve
+    işlemi tutar; güncel veri senkronizasyon sırasında okunur.
+    """
+    MODEL_CHOICES = [
+        ('task', _('Görev')),
+        ('subtask', _('Alt görev')),
+        ('comment', _('Yorum')),
+    ]
+
+    ACTION_CHOICES = [
+        ('create', _('Oluşturma')),
+        ('update', _('Güncelleme')),
+        ('delete', _('Silme')),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        verbose_name=_('kullanıcı'),
+        related_name='change_log',
+        db_index=False
+    )
+    model = models.CharField(_('nesne türü'), max_length=10, choices=MODEL_CHOICES)
+    object_id = models.UUIDField(_('nesne kimliği'))
+    action = models.CharField(_('işlem'), max_length=10, choices=ACTION_CHOICES)
+    created_at = models.DateTimeField(_('oluşturulma tarihi'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('değişiklik kaydı')
+        verbose_name_plural = _('değişiklik kayıtları')
+        indexes = [
+            models.Index(fields=['user', 'id'], name='changelog_user_id_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.id} {self.action} {self.model} {self.object_id}"
+
+
+class ReminderDelivery(models.Model):
+    """
+    Gönderilmiş bir hatırlatma. Zamanlayıcı yeniden başladığında aynı
+    hatırlatmanın tekrar gönderilmesini önler; GRACE süresinden eski
+    kayıtlar silinir (bkz. tasks.reminders).
+    """
+    KIND_CHOICES = [
+        ('reminder', _('Hatırlatma')),
+        ('due', _('Bitiş tarihi')),
+    ]
+
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        verbose_name=_('görev'),
+        related_name='reminder_deliveries',
+        db_index=False
+    )
+    kind = models.CharField(_('tür'), max_length=10, choices=KIND_CHOICES)
+    scheduled_for = models.DateTimeField(_('planlanan zaman'))
+    sent_at = models.DateTimeField(_('gönderilme tarihi'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('gönderilen hatırlatma')
+        verbose_name_plural = _('gönderilen hatırlatmalar')
+        constraints = [
+            models.UniqueConstraint(fields=['task', 'kind', 'scheduled_for'], name='reminder_delivery_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['scheduled_for'], name='reminder_delivery_time_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task_id} {self.kind} {self.scheduled_for}"
+
+
+class NotificationOutbox(models.Model):
+    """
+    Gönderilmeyi bekleyen görev durum bildirimi. Durum değişikliğiyle aynı
+    transaction'da her alıcı için bir satır yazılır; satırlar gönderildikten
+    sonra silinir. available_at birleştirme penceresinin ve yeniden deneme
+    beklemesinin sonudur (bkz. tasks.notifications).
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        verbose_name=_('kullanıcı'),
+        related_name='notification_outbox'
+    )
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        verbose_name=_('görev'),
+        related_name='notification_outbox'
+    )
+    status = models.CharField(_('durum'), max_length=20, choices=Task.STATUS_CHOICES)
+    available_at = models.DateTimeField(_('gönderilebilir olduğu zaman'))
+    attempts = models.PositiveSmallIntegerField(_('deneme sayısı'), default=0)
+    last_error = models.TextField(_('son hata'), blank=True)
+    created_at = models.DateTimeField(_('oluşturulma tarihi'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('bildirim kuyruğu kaydı')
+        verbose_name_plural = _('bildirim kuyruğu kayıtları')
+        indexes = [
+            models.Index(fields=['available_at'], name='outbox_available_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task_id} -> {self.user_id} ({self.status})"
+
+
+class TaskStatsCounter(models.Model):
+    """
+    Kullanıcının görev panosu sayaçlarından biri: durum, öncelik, kategori
+    ve gün başına görev sayıları ile süre toplamları. Görev değişikliklerinde
+    artımlı olarak güncellenir (bkz. tasks.stats).
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        verbose_name=_('kullanıcı'),
+        related_name='task_stats',
+        db_index=False
+    )
+    key = models.CharField(_('anahtar'), max_length=64)
+    value = models.BigIntegerField(_('değer'), default=0)
+
+    class Meta:
+        verbose_name = _('görev istatistiği')
+        verbose_name_plural = _('görev istatistikleri')
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='task_stats_user_key_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.key}={self.value}"
+
+
+class DailyProductivity(models.Model):
+    """
+    Kullanıcının bir günde (TIME_ZONE'a göre) tamamladığı görevlerin özeti.
+    Histogramlar seyrek (kutu, sayı) dizileri olarak saklanır; aralık
+    sorguları bu satırlardan hesaplanır (bkz. tasks.analytics).
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        verbose_name=_('kullanıcı'),
+        related_name='daily_productivity',
+        db_index=False
+    )
+    day = models.DateField(_('gün'))
+    completed = models.PositiveIntegerField(_('tamamlanan görev'), default=0)
+    lead_time_total = models.BigIntegerField(_('toplam tamamlanma süresi (sn)'), default=0)
+    lead_time_histogram = models.BinaryField(_('tamamlanma süresi histogramı'), default=bytes)
+    estimated_count = models.PositiveIntegerField(_('tahminli görev'), default=0)
+    estimated_total = models.BigIntegerField(_('toplam tahmini süre (sn)'), default=0)
+    actual_total = models.BigIntegerField(_('toplam gerçek süre (sn)'), default=0)
+    accuracy_histogram = models.BinaryField(_('tahmin isabeti histogramı'), default=bytes)
+
+    class Meta:
+        verbose_name = _('günlük verimlilik özeti')
+        verbose_name_plural = _('günlük verimlilik özetleri')
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'day'], name='productivity_user_day_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.day}: {self.completed}"
+
+
+class EnrichmentCache(models.Model):
+    """
+    Başlık+açıklama içerik özeti (SHA-256) başına model çıktısı. Aynı
+    içerikli görevler ve içeriği değişmeyen görevler modele yeniden
+    gönderilmez (bkz. tasks.enrichment).
+    """
+    content_hash = models.CharField(_('içerik özeti'), max_length=64)
+    model = models.CharField(_('model'), max_length=100)
+    tags = models.JSONField(_('etiketler'), default=list)
+    summary = models.TextField(_('özet'), blank=True)
+    suggestions = models.TextField(_('öneriler'), blank=True)
+    # Görevin toplu istekteki token payı
+    prompt_tokens = models.PositiveIntegerField(_('girdi token'), default=0)
+    output_tokens = models.PositiveIntegerField(_('çıktı token'), default=0)
+    created_at = models.DateTimeField(_('oluşturulma tarihi'), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('AI zenginleştirme önbelleği')
+        verbose_name_plural = _('AI zenginleştirme önbelleği')
+        constraints = [
+            models.UniqueConstraint(fields=['content_hash', 'model'], name='enrichment_cache_hash_model_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.content_hash[:12]}"
@@ -0,0 +1,194 @@
+"""
+Görev durum değişikliği bildirimleri.
+
+Durum değişiklikleri istek sırasında bildirim göndermez; tasks.changes her
+alıcı için NotificationOutbox satırını değişiklikle aynı transaction'da
+yazar. Dağıtıcı (dispatch_notifications komutu) kuyruğu toplu olarak boşaltır:
+
+- Birleştirme: satır COALESCE_WINDOW saniye sonra gönderilebilir olur; aynı
+  kullanıcı ve görev için biriken değişiklikler son durumu taşıyan tek
+  bildirimle gönderilir.
+- notification_enabled kapalı kullanıcıların satırları gönderilmeden silinir.
+- Gönderilemeyen bildirimler BACKOFF saniyeden başlayıp her denemede iki
+  katına çıkan beklemeyle yeniden denenir; MAX_ATTEMPTS denemeden sonra
+  satır last_error ile birlikte kuyrukta bırakılır.
+
+Satırlar gönderimden sonra silindiğinden bir bildirim en az bir kez
+gönderilir. Aynı anda tek bir dağıtıcı süreci çalıştırılmalıdır.
+"""
+import sys
+import threading
+from collections import namedtuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import NotificationOutbox
+
+DEFAULT_NOTIFICATION_SETTINGS = {
+    'SENDER': 'tasks.notifications.ConsoleSender',
+    'COALESCE_WINDOW': 30,  # Saniye
+    'BATCH_SIZE': 500,  # Tek turda okunan en fazla kuyruk satırı
+    'MAX_ATTEMPTS': 5,
+    'BACKOFF': 30,  # Saniye; her başarısız denemede iki katına çıkar
+    'MAX_BACKOFF': 3600,  # Saniye
+    'POLL_INTERVAL': 2,  # Saniye
+}
+
+Notification = namedtuple('Notification', ['user_id', 'task_id', 'title', 'status', 'changes'])
+
+
+def get_notification_settings():
+    """Varsayılan değerlerle birleştirilmiş NOTIFICATIONS ayarlarını döndürür."""
+    config = dict(DEFAULT_NOTIFICATION_SETTINGS)
+    config.update(getattr(settings, 'NOTIFICATIONS', {}))
+    return config
+
+
+def enqueue_status_changes(status_changes):
+    """
+    (alıcılar, görev id, yeni durum) üçlülerini kuyruğa yazar; çağıranın
+    transaction'ında çalışır.
+    """
+    available_at = timezone.now() + timedelta(seconds=get_notification_settings()['COALESCE_WINDOW'])
+    NotificationOutbox.objects.bulk_create(
+        NotificationOutbox(user_id=user_id, task_id=task_id, status=status, available_at=available_at)
+        for user_ids, task_id, status in status_changes
+        for user_id in {user_id for user_id in user_ids if user_id is not None}
+    )
+
+
+class ConsoleSender:
+    """Bildirimleri standart çıktıya yazan yerel gönderici (varsayılan)."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    @classmethod
+    def from_settings(cls, config):
+        return cls()
+
+    def send(self, notifications):
+        for notification in notifications:
+            self.stream.write(
+                f'kullanıcı={notification.user_id} görev={notification.task_id} '
+                f'{notification.title}: {notification.status} ({notification.changes} değişiklik)\n'
+            )
+        return []
+
+
+class FCMSender:
+    """
+    Bildirimleri Firebase Cloud Messaging ile gönderir. Her kullanıcının
+    cihazları 'user-<kullanıcı id>' konusuna abone olur.
+    """
+
+    @classmethod
+    def from_settings(cls, config):
+        return cls()
+
+    def send(self, notifications):
+        from firebase_admin import messaging
+
+        messages = [
+            messaging.Message(
+                topic=f'user-{notification.user_id}',
+                notification=messaging.Notification(title=notification.title, body=notification.status),
+                data={'task': str(notification.task_id), 'status': notification.status},
+            )
+            for notification in notifications
+        ]
+        failed = []
+        # send_each tek istekte en fazla 500 mesaj kabul eder
+        for start in range(0, len(messages), 500):
+            response = messaging.send_each(messages[start:start + 500])
+            failed.extend(
+                (notification, str(result.exception))
+                for notification, result in zip(notifications[start:start + 500], response.responses)
+                if not result.success
+            )
+        return failed
+
+
+def get_sender(config=None):
+    """NOTIFICATIONS['SENDER'] ayarındaki göndericiyi oluşturur."""
+    config = config or get_notification_settings()
+    return import_string(config['SENDER']).from_settings(config)
+
+
+class NotificationDispatcher:
+    """
+    Bildirim kuyruğunu toplu olarak boşaltır. Göndericinin send() metodu
+    gönderilemeyen (bildirim, hata) çiftlerini döndürür; hata fırlatırsa
+    tüm toplu gönderim başarısız sayılır.
+    """
+
+    def __init__(self, sender=None, clock=timezone.now, config=None):
+        self.config = config or get_notification_settings()
+        self.sender = sender or get_sender(self.config)
+        self.clock = clock
+
+    def dispatch(self, now=None):
+        """Gönderilebilir tüm satırları işler; gönderilen bildirim sayısını döndürür."""
+        now = now or self.clock()
+        sent = 0
+        while True:
+            result = self._dispatch_batch(now)
+            if result is None:
+                return sent
+            sent += result
+
+    def _dispatch_batch(self, now):
+        pending = NotificationOutbox.objects.filter(attempts__lt=self.config['MAX_ATTEMPTS'])
+        ready = set(
+            pending.filter(available_at__lte=now).order_by('available_at')
+            .values_list('user_id', 'task_id')[:self.config['BATCH_SIZE']]
+        )
+        if not ready:
+            return None
+
+        # Pencereyi henüz dolmamış yeni değişiklikler de aynı bildirime katılır
+        groups = {}
+        rows = pending.filter(task_id__in={task_id for _, task_id in ready}).order_by('id').values_list(
+            'id', 'user_id', 'task_id', 'status', 'attempts', 'task__title', 'user__notification_enabled'
+        )
+        for row_id, user_id, task_id, status, attempts, title, enabled in rows:
+            if (user_id, task_id) in ready:
+                group = groups.setdefault((user_id, task_id), {'ids': [], 'attempts': 0, 'enabled': enabled})
+                group['ids'].append(row_id)
+                group['attempts'] = max(group['attempts'], attempts)
+                group['notification'] = Notification(user_id, task_id, title, status, len(group['ids']))
+
+        muted = [row_id for group in groups.values() if not group['enabled'] for row_id in group['ids']]
+        groups = {key: group for key, group in groups.items() if group['enabled']}
+        notifications = [group['notification'] for group in groups.values()]
+        try:
+            failed = list(self.sender.send(notifications)) if notifications else []
+        except Exception as e:
+            failed = [(notification, str(e)) for notification in notifications]
+
+        errors = {(notification.user_id, notification.task_id): error for notification, error in failed}
+        NotificationOutbox.objects.filter(pk__in=muted + [
+            row_id for key, group in groups.items() if key not in errors for row_id in group['ids']
+        ]).delete()
+        # Aynı deneme sayısı ve hatayı paylaşan satırlar (ör. servis kesintisi)
+        # tek UPDATE ile ertelenir
+        retries = {}
+        for key, error in errors.items():
+            group = groups[key]
+            retries.setdefault((group['attempts'] + 1, error), []).extend(group['ids'])
+        for (attempts, error), row_ids in retries.items():
+            delay = min(self.config['BACKOFF'] * 2 ** (attempts - 1), self.config['MAX_BACKOFF'])
+            NotificationOutbox.objects.filter(pk__in=row_ids).update(
+                attempts=attempts, available_at=now + timedelta(seconds=delay), last_error=error
+            )
+        return len(notifications) - len(errors)
+
+    def run(self, stop=None):
+        """stop (threading.Event) ayarlanana kadar kuyruğu boşaltır."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.dispatch()
+            stop.wait(self.config['POLL_INTERVAL'])
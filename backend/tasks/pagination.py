@@ -0,0 +1,204 @@
+"""
+Keyset (cursor) sayfalama.
+
+OFFSET yerine son görülen satırın (sıralama alanı, id) değerinden devam
+edilir; böylece derin sayfalar da ilk sayfa kadar hızlıdır. Toplam sayı
+isteğe bağlıdır (?count=false ile COUNT(*) sorgusu atlanır).
+"""
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    (sıralama alanı, id) çiftine göre keyset sayfalama.
+
+    Sıralama alanı ?ordering= parametresinden (görünümün ordering_fields
+    listesiyle sınırlı) veya görünümün ordering değerinden alınır. Sorguda
+    search_rank anotasyonu varsa (tam metin arama) ve açık bir sıralama
+    istenmemişse ilgililiğe göre sıralanır. Boş (NULL) değerler her iki
+    yönde de en sona sıralanır.
+    """
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    ordering_query_param = 'ordering'
+    count_query_param = 'count'
+    default_ordering = '-created_at'
+    rank_annotation = 'search_rank'
+    invalid_cursor_message = 'Geçersiz cursor.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self._prepare(queryset, request, view)
+        if self.include_count(request):
+            self.count = queryset.order_by().count()
+        return self._set_page(list(self._page_slice(queryset)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset'in Django'nun async ORM'iyle çalışan sürümü."""
+        queryset = self._prepare(queryset, request, view)
+        if self.include_count(request):
+            self.count = await queryset.order_by().acount()
+        # prefetch_related ile aiterator() chunk_size gerektirir
+        rows = [row async for row in self._page_slice(queryset).aiterator(chunk_size=self.page_size + 1)]
+        return self._set_page(rows)
+
+    def page_queryset(self, queryset, request, view=None):
+        """
+        İstenen sayfanın satırlarını (ve sonraki sayfanın varlığını belirleyen
+        satırı) seçen dilimlenmiş sorgu; sorgu çalıştırılmaz.
+        """
+        return self._page_slice(self._prepare(queryset, request, view))
+
+    def _prepare(self, queryset, request, view):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        ordering = self.get_ordering(request, queryset, view)
+        self.field_name = ordering.lstrip('-')
+        self.descending = ordering.startswith('-')
+        if self.field_name in queryset.query.annotations:
+            self.field = queryset.query.annotations[self.field_name].output_field
+        else:
+            self.field = queryset.model._meta.get_field(self.field_name)
+        self.cursor = self.decode_cursor(request, queryset)
+        self.count = None
+        return queryset
+
+    def _page_slice(self, queryset):
+        cursor = self.cursor
+        reverse = bool(cursor and cursor['reverse'])
+        # Geri giderken sıralama (NULL'ların yeri dahil) tersine çevrilir
+        descending = self.descending != reverse
+        nulls_last = not reverse
+        # Alan .only() ile ertelenmiş olsa bile cursor değeri ek sorgusuz okunur
+        queryset = queryset.annotate(keyset_value=F(self.field_name)).order_by(
+            self._order_expression(descending, nulls_last),
+            '-pk' if descending else 'pk'
+        )
+        if cursor:
+            queryset = queryset.filter(
+                self._after(cursor['value'], cursor['pk'], descending, nulls_last)
+            )
+        return queryset[:self.page_size + 1]
+
+    def _set_page(self, rows):
+        cursor = self.cursor
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if cursor and cursor['reverse']:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, request, queryset, view):
+        allowed = getattr(view, 'ordering_fields', None) or []
+        requested = request.query_params.get(self.ordering_query_param, '')
+        requested = requested.split(',')[0].strip()
+        if requested and requested.lstrip('-') in allowed:
+            return requested
+        if self.rank_annotation in queryset.query.annotations:
+            return f'-{self.rank_annotation}'
+        default = getattr(view, 'ordering', None) or self.default_ordering
+        if isinstance(default, (list, tuple)):
+            default = default[0]
+        return default
+
+    def include_count(self, request):
+        value = request.query_params.get(self.count_query_param, 'true')
+        return value.lower() not in ('0', 'false', 'no')
+
+    def _order_expression(self, descending, nulls_last):
+        expression = F(self.field_name)
+        if not self.field.null:
+            return expression.desc() if descending else expression.asc()
+        nulls = {'nulls_last': True} if nulls_last else {'nulls_first': True}
+        return expression.desc(**nulls) if descending else expression.asc(**nulls)
+
+    def _after(self, value, pk, descending, nulls_last):
+        """Sıralamada (value, pk) konumundan sonra gelen satırların koşulu."""
+        name = self.field_name
+        op = 'lt' if descending else 'gt'
+        if value is None:
+            condition = Q(**{f'{name}__isnull': True, f'pk__{op}': pk})
+            if not nulls_last:
+                condition |= Q(**{f'{name}__isnull': False})
+            return condition
+        condition = Q(**{f'{name}__{op}': value}) | Q(**{name: value, f'pk__{op}': pk})
+        if nulls_last and self.field.null:
+            condition |= Q(**{f'{name}__isnull': True})
+        return condition
+
+    def encode_cursor(self, row, reverse):
+        value = row.keyset_value
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        payload = json.dumps({'v': value, 'p': str(row.pk), 'r': int(reverse)})
+        token = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request, queryset):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+            value = payload['v']
+            if value is not None:
+                value = self.field.to_python(value)
+            pk = queryset.model._meta.pk.to_python(payload['p'])
+            return {'value': value, 'pk': pk, 'reverse': bool(payload.get('r'))}
+        except (TypeError, ValueError, KeyError, binascii.Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        response = OrderedDict()
+        if self.count is not None:
+            response['count'] = self.count
+        response['next'] = self.get_next_link()
+        response['previous'] = self.get_previous_link()
+        response['results'] = data
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer'},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,175 @@
+"""
+Kanban sıralaması için kesirli sıra anahtarları.
+
+Anahtarlar, ikili (bayt) karşılaştırmayla sıralanan base62 dizgileridir ve
+herhangi iki anahtar arasına her zaman yeni bir anahtar üretilebilir; bir
+kartı taşımak yalnızca o kartın anahtarını değiştirir, sütun yeniden
+numaralanmaz. Anahtar biçimi: uzunluğu ilk karakterden anlaşılan bir tam sayı
+kısmı ve sıfırla bitmeyen isteğe bağlı bir kesir kısmı
+(https://observablehq.com/@dgreensp/implementing-fractional-indexing).
+
+Aynı iki kart arasına tekrar tekrar taşıma anahtarı uzatır; MAX_KEY_LENGTH'i
+aşan bir anahtar üretildiğinde sıkışan aralıktaki kartlar keys_between ile
+eşit aralıklı kısa anahtarlarla yeniden numaralanır.
+"""
+import random
+import time
+
+DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+SMALLEST_INTEGER = 'A' + DIGITS[0] * 26
+
+# Bu uzunluğu aşan anahtarlar yerine komşu kartlar yeniden numaralanır
+# (Task.position en fazla 255 karakterdir)
+MAX_KEY_LENGTH = 64
+
+
+def _midpoint(a, b):
+    """a < sonuç < b olacak kesir kısmı; b None ise üst sınır yoktur."""
+    if b is not None:
+        # Ortak önek korunur
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else DIGITS[0]) == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else len(DIGITS)
+    if digit_b - digit_a > 1:
+        return DIGITS[round((digit_a + digit_b) / 2)]
+    if b is not None and len(b) > 1:
+        return b[:1]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def _integer_length(head):
+    if 'a' <= head <= 'z':
+        return ord(head) - ord('a') + 2
+    if 'A' <= head <= 'Z':
+        return ord('Z') - ord(head) + 2
+    raise ValueError(f'Geçersiz sıra anahtarı başı: {head}')
+
+
+def _integer_part(key):
+    length = _integer_length(key[0])
+    if length > len(key):
+        raise ValueError(f'Geçersiz sıra anahtarı: {key}')
+    return key[:length]
+
+
+def validate_key(key):
+    if not key or key == SMALLEST_INTEGER:
+        raise ValueError(f'Geçersiz sıra anahtarı: {key}')
+    integer = _integer_part(key)
+    if key[len(integer):].endswith(DIGITS[0]) or any(c not in DIGITS for c in key[1:]):
+        raise ValueError(f'Geçersiz sıra anahtarı: {key}')
+
+
+def _increment_integer(integer):
+    head, digits = integer[0], list(integer[1:])
+    for i in range(len(digits) - 1, -1, -1):
+        d = DIGITS.index(digits[i]) + 1
+        if d < len(DIGITS):
+            digits[i] = DIGITS[d]
+            return head + ''.join(digits)
+        digits[i] = DIGITS[0]
+    if head == 'Z':
+        return 'a' + DIGITS[0]
+    if head == 'z':
+        return None
+    head = chr(ord(head) + 1)
+    if head > 'a':
+        digits.append(DIGITS[0])
+    else:
+        digits.pop()
+    return head + ''.join(digits)
+
+
+def _decrement_integer(integer):
+    head, digits = integer[0], list(integer[1:])
+    for i in range(len(digits) - 1, -1, -1):
+        d = DIGITS.index(digits[i]) - 1
+        if d >= 0:
+            digits[i] = DIGITS[d]
+            return head + ''.join(digits)
+        digits[i] = DIGITS[-1]
+    if head == 'a':
+        return 'Z' + DIGITS[-1]
+    if head == 'A':
+        return None
+    head = chr(ord(head) - 1)
+    if head < 'Z':
+        digits.append(DIGITS[-1])
+    else:
+        digits.pop()
+    return head + ''.join(digits)
+
+
+def key_between(a, b):
+    """
+    a ile b arasında sıralanan bir anahtar döndürür. a None ise en başa,
+    b None ise en sona yerleştirilir.
+    """
+    if a is not None:
+        validate_key(a)
+    if b is not None:
+        validate_key(b)
+    if a is not None and b is not None and a >= b:
+        raise ValueError(f'{a} >= {b}')
+
+    if a is None:
+        if b is None:
+            return 'a' + DIGITS[0]
+        integer_b = _integer_part(b)
+        if integer_b == SMALLEST_INTEGER:
+            return integer_b + _midpoint('', b[len(integer_b):])
+        if integer_b < b:
+            return integer_b
+        key = _decrement_integer(integer_b)
+        if key is None:
+            raise ValueError('Daha küçük anahtar üretilemez.')
+        return key
+
+    integer_a = _integer_part(a)
+    fraction_a = a[len(integer_a):]
+    if b is None:
+        key = _increment_integer(integer_a)
+        return integer_a + _midpoint(fraction_a, None) if key is None else key
+
+    integer_b = _integer_part(b)
+    if integer_a == integer_b:
+        return integer_a + _midpoint(fraction_a, b[len(integer_b):])
+    key = _increment_integer(integer_a)
+    if key is None:
+        raise ValueError('Daha büyük anahtar üretilemez.')
+    if key < b:
+        return key
+    return integer_a + _midpoint(fraction_a, None)
+
+
+def keys_between(a, b, count):
+    """
+    a ile b arasında sıralanan count anahtar. Aralık ikiye bölünerek
+    doldurulduğundan anahtarlar yaklaşık eşit aralıklıdır ve count'un
+    logaritmasıyla uzar.
+    """
+    if count <= 0:
+        return []
+    middle = count // 2
+    key = key_between(a, b)
+    return keys_between(a, key, middle) + [key] + keys_between(key, b, count - middle - 1)
+
+
+def key_for_time(timestamp=None):
+    """
+    Zamana göre artan bir anahtar: mikrosaniye cinsinden zaman 9 haneli base62
+    tam sayı kısmına yazılır; aynı anda oluşturulan görevler çakışmasın diye
+    rastgele bir kesir kısmı eklenir. Yeni görevler böylece sorgu gerekmeden
+    sütunun sonuna düşer.
+    """
+    value = int((time.time() if timestamp is None else timestamp) * 1_000_000)
+    digits = []
+    for _ in range(9):
+        value, remainder = divmod(value, len(DIGITS))
+        digits.append(DIGITS[remainder])
+    fraction = ''.join(random.choice(DIGITS) for _ in range(3)) + random.choice(DIGITS[1:])
+    return 'i' + ''.join(reversed(digits)) + fraction
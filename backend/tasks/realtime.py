@@ -0,0 +1,319 @@
+"""
+Görev değişikliklerinin bağlı istemcilere anlık iletimi.
+
+tasks.changes görev durum değişikliklerini, yeni yorumları ve tamamlanan alt
+görevleri commit sonrasında görevi gören kullanıcılara yayınlar. Yayıncı
+(broker) REALTIME['BROKER'] ayarıyla seçilir; varsayılan InProcessBroker
+olayları aynı süreçteki bağlantılara dağıtır. Birden çok süreçle
+çalışırken aynı arayüzü (from_settings, subscribe, publish, stats) sağlayan
+merkezi bir yayıncı kullanılmalıdır.
+
+İstemciler ASGI uygulamasına WebSocket (REALTIME['WEBSOCKET_PATH']) veya
+Server-Sent Events (/api/tasks/events/) ile bağlanır; ikisi de ASGI sunucusu
+gerektirir. Tarayıcılar bu bağlantılarda Authorization başlığı
+gönderemediğinden Firebase token'ı ?token= ile de verilebilir. Kuyruğu dolan
+yavaş istemciye 'resync' olayı gönderilip bağlantı kapatılır; istemci
+/api/tasks/sync/ ile eksiğini tamamlar.
+"""
+import asyncio
+import json
+import threading
+from collections import defaultdict, deque
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.db import close_old_connections, transaction
+from django.dispatch import receiver
+from django.http import HttpRequest, QueryDict
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+DEFAULT_REALTIME_SETTINGS = {
+    'BROKER': 'tasks.realtime.InProcessBroker',
+    'QUEUE_SIZE': 100,  # Bağlantı başına gönderilmeyi bekleyen en fazla olay
+    'HEARTBEAT': 25,  # Saniye; olay yoksa bağlantıyı canlı tutan mesaj aralığı
+    'WEBSOCKET_PATH': '/ws/tasks/',
+}
+
+# WebSocket kapanış kodları (4000-4999 uygulamaya ayrılmıştır)
+CLOSE_NOT_FOUND = 4404
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_RESYNC = 4409
+
+
+def get_realtime_settings():
+    """Varsayılan değerlerle birleştirilmiş REALTIME ayarlarını döndürür."""
+    config = dict(DEFAULT_REALTIME_SETTINGS)
+    config.update(getattr(settings, 'REALTIME', {}))
+    return config
+
+
+class SubscriptionOverflow(Exception):
+    """Bağlantının kuyruğu doldu; kaçırılan olaylar sync ile alınmalıdır."""
+
+
+class Subscription:
+    """
+    Tek bir bağlantının olay kuyruğu; oluşturulduğu olay döngüsüne bağlıdır.
+    Bekleme her olayda yeni görev oluşturan asyncio.wait_for yerine tek bir
+    Future ve zamanlayıcıyla yapılır; geniş yayınlarda fark belirgindir.
+    """
+
+    def __init__(self, broker, user_id, queue_size):
+        self.broker = broker
+        self.user_id = user_id
+        self.queue_size = queue_size
+        self.overflowed = False
+        self.loop = asyncio.get_running_loop()
+        self._queue = deque()
+        self._waiter = None
+
+    def put(self, event):
+        """Olayı kuyruğa ekler; yalnızca aboneliğin olay döngüsünden çağrılır."""
+        if len(self._queue) >= self.queue_size:
+            if not self.overflowed:
+                self.overflowed = True
+                self.broker.record_overflow()
+        else:
+            self._queue.append(event)
+        self._wake()
+
+    def _wake(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def get(self, timeout=None):
+        """
+        Sıradaki olay; timeout içinde olay gelmezse None. Kuyruk taşmışsa
+        SubscriptionOverflow.
+        """
+        if not self._queue and not self.overflowed:
+            self._waiter = self.loop.create_future()
+            timer = self.loop.call_later(timeout, self._wake) if timeout is not None else None
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+                if timer is not None:
+                    timer.cancel()
+        if self.overflowed:
+            raise SubscriptionOverflow()
+        return self._queue.popleft() if self._queue else None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+def _put_all(subscriptions, event):
+    for subscription in subscriptions:
+        subscription.put(event)
+
+
+class InProcessBroker:
+    """Olayları bu süreçteki kullanıcı aboneliklerine dağıtan yayıncı."""
+
+    def __init__(self, queue_size=100):
+        self.queue_size = queue_size
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+        self.overflows = 0
+
+    @classmethod
+    def from_settings(cls, config):
+        return cls(queue_size=config['QUEUE_SIZE'])
+
+    def subscribe(self, user_id):
+        """Kullanıcının olaylarına abone olur; çalışan olay döngüsünden çağrılır."""
+        subscription = Subscription(self, user_id, self.queue_size)
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def publish(self, user_ids, event):
+        """Olayı kullanıcıların tüm bağlantılarına iletir; her iş parçacığından çağrılabilir."""
+        with self._lock:
+            targets = [
+                subscription
+                for user_id in set(user_ids)
+                for subscription in self._subscriptions.get(user_id, ())
+            ]
+            self.published += 1
+            self.delivered += len(targets)
+        # Olay döngüsü başına tek uyandırma; her bağlantı için ayrı çağrı
+        # geniş yayınlarda döngüyü tıkar
+        by_loop = defaultdict(list)
+        for subscription in targets:
+            by_loop[subscription.loop].append(subscription)
+        for loop, subscriptions in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_put_all, subscriptions, event)
+            except RuntimeError:
+                # Olay döngüsü kapanmış; bağlantılar zaten sona ermiştir
+                pass
+
+    def record_overflow(self):
+        with self._lock:
+            self.overflows += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'connections': sum(len(subscriptions) for subscriptions in self._subscriptions.values()),
+                'users': len(self._subscriptions),
+                'published': self.published,
+                'delivered': self.delivered,
+                'overflows': self.overflows,
+            }
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """REALTIME['BROKER'] ayarındaki yayıncıyı (tek örnek) döndürür."""
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            config = get_realtime_settings()
+            _broker = import_string(config['BROKER']).from_settings(config)
+        return _broker
+
+
+@receiver(setting_changed)
+def _reset_broker(sender, setting, **kwargs):
+    global _broker
+    if setting == 'REALTIME':
+        with _broker_lock:
+            _broker = None
+
+
+def publish(user_ids, event):
+    """Olayı transaction commit edildikten sonra kullanıcılara yayınlar."""
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if user_ids:
+        transaction.on_commit(lambda: get_broker().publish(user_ids, event))
+
+
+def encode(event):
+    return json.dumps(event, cls=DjangoJSONEncoder)
+
+
+def authenticate(request):
+    """
+    İsteği REST framework'ün kimlik doğrulama sınıflarıyla doğrular. Başlık
+    yoksa ?token= parametresi Bearer token olarak kullanılır. Kullanıcıyı
+    veya None döndürür.
+    """
+    token = request.GET.get('token')
+    if token and 'HTTP_AUTHORIZATION' not in request.META:
+        request.META['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+    drf_request = Request(
+        request,
+        authenticators=[authenticator() for authenticator in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    )
+    try:
+        user = drf_request.user
+    except APIException:
+        return None
+    return user if user.is_authenticated else None
+
+
+def _authenticate_scope(scope):
+    # Django'nun istek döngüsü dışında çalışıldığından bağlantılar elle
+    # kapatılır. Oturum çerezi ara katmanlar çalışmadığı için desteklenmez
+    request = HttpRequest()
+    request.GET = QueryDict(scope.get('query_string', b'').decode('latin-1'))
+    for name, value in scope.get('headers', ()):
+        if name.lower() == b'authorization':
+            request.META['HTTP_AUTHORIZATION'] = value.decode('latin-1')
+    close_old_connections()
+    try:
+        return authenticate(request)
+    finally:
+        close_old_connections()
+
+
+async def _events(subscription, heartbeat):
+    """Olayları sırayla üretir; heartbeat süresince olay yoksa None üretir."""
+    while True:
+        try:
+            yield await subscription.get(heartbeat)
+        except SubscriptionOverflow:
+            yield {'type': 'resync'}
+            return
+
+
+async def sse_stream(user_id):
+    """Kullanıcının olaylarını text/event-stream biçiminde üretir."""
+    subscription = get_broker().subscribe(user_id)
+    try:
+        yield b': connected\n\n'
+        async for event in _events(subscription, get_realtime_settings()['HEARTBEAT']):
+            if event is None:
+                yield b': ping\n\n'
+            else:
+                yield f"event: {event['type']}\ndata: {encode(event)}\n\n".encode()
+    finally:
+        subscription.close()
+
+
+async def _send_events(subscription, send):
+    async for event in _events(subscription, get_realtime_settings()['HEARTBEAT']):
+        await send({'type': 'websocket.send', 'text': encode(event or {'type': 'ping'})})
+        if event is not None and event['type'] == 'resync':
+            await send({'type': 'websocket.close', 'code': CLOSE_RESYNC})
+            return
+
+
+async def serve_websocket(user_id, receive, send):
+    """
+    Kabul edilmiş bir WebSocket bağlantısına kullanıcının olaylarını
+    gönderir; istemci bağlantıyı kapatana kadar sürer. İstemci mesajları
+    yok sayılır.
+    """
+    subscription = get_broker().subscribe(user_id)
+    sender = asyncio.ensure_future(_send_events(subscription, send))
+    try:
+        while True:
+            message = await receive()
+            if message['type'] == 'websocket.disconnect':
+                break
+    finally:
+        sender.cancel()
+        try:
+            await sender
+        except asyncio.CancelledError:
+            pass
+        subscription.close()
+
+
+async def websocket_application(scope, receive, send):
+    """Görev olayları için ham ASGI WebSocket uygulaması."""
+    message = await receive()
+    if message['type'] != 'websocket.connect':
+        return
+    if scope['path'] != get_realtime_settings()['WEBSOCKET_PATH']:
+        await send({'type': 'websocket.close', 'code': CLOSE_NOT_FOUND})
+        return
+
+    user = await sync_to_async(_authenticate_scope)(scope)
+    if user is None:
+        await send({'type': 'websocket.close', 'code': CLOSE_UNAUTHORIZED})
+        return
+    await send({'type': 'websocket.accept'})
+    await serve_websocket(user.pk, receive, send)
@@ -0,0 +1,252 @@
+"""
+Hatırlatma ve bitiş tarihi zamanlayıcısı.
+
+Zamanlayıcı (run_reminders komutu) önümüzdeki LOOKAHEAD saniyedeki
+hatırlatmaları reminder_date ve due_date indeksleri üzerinden aralık
+sorgusuyla okur ve bellekteki bir yığında (heap) tutar; pencere ilerledikçe
+yalnızca yeni dilim okunur, tablo taranmaz. Görev düzenlemeleri
+senkronizasyon günlüğünden (ChangeLogEntry) artımlı olarak alınır: değişen
+görevlerin tarihleri yeniden okunur, yığındaki eski kayıtlar çıkarılırken
+atlanır.
+
+Zamanı gelen hatırlatmalar toplu olarak REMINDERS['SENDER'] ile gönderilir
+ve ReminderDelivery ile kaydedilir; yeniden başlatmada GRACE süresi içinde
+kaçırılanlar gönderilir, gönderilmiş olanlar tekrarlanmaz. Kayıt
+göndermeden önce yazıldığından bir hatırlatma en fazla bir kez gönderilir.
+Aynı anda tek bir zamanlayıcı süreci çalıştırılmalıdır.
+"""
+import heapq
+import sys
+import threading
+from collections import namedtuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .changes import current_cursor
+from .models import ChangeLogEntry, ReminderDelivery, Task
+
+DEFAULT_REMINDER_SETTINGS = {
+    'SENDER': 'tasks.reminders.ConsoleSender',
+    'LOOKAHEAD': 600,  # Saniye; belleğe alınan gelecek penceresi
+    'POLL_INTERVAL': 5,  # Saniye; düzenlemelerin en geç fark edilme süresi
+    'GRACE': 3600,  # Saniye; başlangıçta bu kadar geriye kadar kaçırılanlar gönderilir
+    'BATCH_SIZE': 500,  # Tek sorguda okunan / gönderilen en fazla hatırlatma
+}
+
+# Hatırlatma türü ve tarih alanı
+KINDS = (
+    ('reminder', 'reminder_date'),
+    ('due', 'due_date'),
+)
+
+# Bu durumlardaki görevler için hatırlatma gönderilmez
+CLOSED_STATUSES = ('done', 'cancelled')
+
+Reminder = namedtuple('Reminder', ['task_id', 'user_id', 'kind', 'scheduled_for', 'title'])
+
+
+def get_reminder_settings():
+    """Varsayılan değerlerle birleştirilmiş REMINDERS ayarlarını döndürür."""
+    config = dict(DEFAULT_REMINDER_SETTINGS)
+    config.update(getattr(settings, 'REMINDERS', {}))
+    return config
+
+
+class ConsoleSender:
+    """Hatırlatmaları standart çıktıya yazan yerel gönderici (varsayılan)."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    @classmethod
+    def from_settings(cls, config):
+        return cls()
+
+    def send(self, reminders):
+        for reminder in reminders:
+            self.stream.write(
+                f'[{reminder.kind}] {reminder.scheduled_for.isoformat()} '
+                f'kullanıcı={reminder.user_id} görev={reminder.task_id} {reminder.title}\n'
+            )
+
+
+def get_sender(config=None):
+    """REMINDERS['SENDER'] ayarındaki göndericiyi oluşturur."""
+    config = config or get_reminder_settings()
+    return import_string(config['SENDER']).from_settings(config)
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class ReminderScheduler:
+    """
+    Yaklaşan hatırlatmaları bellekte tutan ve zamanı gelince gönderen
+    zamanlayıcı. clock, simülasyon ve testler için değiştirilebilir.
+    """
+
+    def __init__(self, sender=None, clock=timezone.now, config=None):
+        self.config = config or get_reminder_settings()
+        self.sender = sender or get_sender(self.config)
+        self.clock = clock
+        self.sent = 0
+        self._lookahead = timedelta(seconds=self.config['LOOKAHEAD'])
+        self._started = False
+
+    def start(self):
+        """Durumu sıfırlar ve ilk pencereyi yükler."""
+        now = self.clock()
+        # Cursor pencereden önce alınır; arada yapılan düzenlemeler tekrar
+        # okunur ve aynı sonucu verir
+        self._cursor = current_cursor()
+        self._heap = []
+        self._scheduled = {}
+        self._fired_until = now - timedelta(seconds=self.config['GRACE'])
+        self._horizon = self._fired_until
+        self._extend(now)
+        self._started = True
+
+    def _schedule(self, task_id, kind, when):
+        key = (task_id, kind)
+        if self._scheduled.get(key) == when:
+            return
+        if when is None:
+            self._scheduled.pop(key, None)
+        else:
+            self._scheduled[key] = when
+            heapq.heappush(self._heap, (when, task_id, kind))
+
+    def _extend(self, now):
+        """Pencerenin kalanı yarıya indiyse sonraki dilimi yükler."""
+        if self._horizon - now >= self._lookahead / 2:
+            return
+        start, end = self._horizon, now + self._lookahead
+        delivered = set(
+            ReminderDelivery.objects.filter(scheduled_for__gt=start, scheduled_for__lte=end)
+            .values_list('task_id', 'kind', 'scheduled_for')
+        )
+        for kind, field in KINDS:
+            rows = (
+                Task.objects.filter(**{f'{field}__gt': start, f'{field}__lte': end})
+                .exclude(status__in=CLOSED_STATUSES)
+                .order_by()
+                .values_list('pk', field)
+            )
+            for task_id, when in rows.iterator(chunk_size=self.config['BATCH_SIZE']):
+                if (task_id, kind, when) not in delivered:
+                    self._schedule(task_id, kind, when)
+        self._horizon = end
+        # Pencerenin gerisinde kalan kayıtlar tekrar gönderimi önlemek için
+        # artık gerekmez
+        ReminderDelivery.objects.filter(
+            scheduled_for__lte=now - timedelta(seconds=self.config['GRACE'])
+        ).delete()
+
+    def _refresh(self):
+        """Son kontrolden bu yana değişen görevlerin hatırlatmalarını günceller."""
+        while True:
+            entries = list(
+                ChangeLogEntry.objects.filter(id__gt=self._cursor, model='task')
+                .order_by('id')
+                .values_list('id', 'object_id')[:self.config['BATCH_SIZE']]
+            )
+            if not entries:
+                return
+            self._cursor = entries[-1][0]
+            task_ids = {object_id for _, object_id in entries}
+            rows = {
+                task_id: (status, dates)
+                for task_id, status, *dates in Task.objects.filter(pk__in=task_ids)
+                .values_list('pk', 'status', *(field for _, field in KINDS))
+            }
+            for task_id in task_ids:
+                status, dates = rows.get(task_id, (None, [None] * len(KINDS)))
+                for (kind, _), when in zip(KINDS, dates):
+                    # Gönderilmiş ya da pencere dışındaki tarihler planlanmaz
+                    if (
+                        status in CLOSED_STATUSES or when is None
+                        or not self._fired_until < when <= self._horizon
+                    ):
+                        when = None
+                    self._schedule(task_id, kind, when)
+
+    def run_pending(self, now):
+        """Zamanı gelen hatırlatmaları gönderir; gönderilen sayısını döndürür."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, task_id, kind = heapq.heappop(self._heap)
+            if self._scheduled.get((task_id, kind)) == when:
+                del self._scheduled[(task_id, kind)]
+                due.append((task_id, kind, when))
+        self._fired_until = max(self._fired_until, now)
+        sent = 0
+        for batch in _chunks(due, self.config['BATCH_SIZE']):
+            sent += self._dispatch(batch)
+        self.sent += sent
+        return sent
+
+    def _dispatch(self, batch):
+        tasks = (
+            Task.objects.filter(pk__in={task_id for task_id, _, _ in batch})
+            .select_related('assigned_to')
+            .only('title', 'status', 'reminder_date', 'due_date', 'assigned_to__notification_enabled')
+            .in_bulk()
+        )
+        reminders = []
+        for task_id, kind, when in batch:
+            task = tasks.get(task_id)
+            # Henüz okunmamış bir düzenleme tarihi değiştirmiş olabilir;
+            # sonraki _refresh görevi doğru zamana yeniden planlar
+            if (
+                task is None or task.status in CLOSED_STATUSES
+                or getattr(task, dict(KINDS)[kind]) != when
+                or not task.assigned_to.notification_enabled
+            ):
+                continue
+            reminders.append(Reminder(task.pk, task.assigned_to_id, kind, when, task.title))
+        if not reminders:
+            return 0
+        with transaction.atomic():
+            ReminderDelivery.objects.bulk_create(
+                (
+                    ReminderDelivery(task_id=reminder.task_id, kind=reminder.kind,
+                                     scheduled_for=reminder.scheduled_for)
+                    for reminder in reminders
+                ),
+                ignore_conflicts=True,
+            )
+        self.sender.send(reminders)
+        return len(reminders)
+
+    def tick(self, now=None):
+        """Düzenlemeleri okur, pencereyi ilerletir ve zamanı gelenleri gönderir."""
+        if not self._started:
+            self.start()
+        now = now or self.clock()
+        self._refresh()
+        self._extend(now)
+        return self.run_pending(now)
+
+    def next_wakeup(self, now):
+        """Bir sonraki tick'e kadar beklenecek süre (saniye)."""
+        wait = self.config['POLL_INTERVAL']
+        if self._heap:
+            wait = min(wait, (self._heap[0][0] - now).total_seconds())
+        return max(0, wait)
+
+    def run(self, stop=None):
+        """stop (threading.Event) ayarlanana kadar çalışır."""
+        stop = stop or threading.Event()
+        self.start()
+        while not stop.is_set():
+            self.tick()
+            stop.wait(self.next_wakeup(self.clock()))
+
+    def __len__(self):
+        return len(self._scheduled) if self._started else 0
@@ -0,0 +1,263 @@
+"""
+Kullanıcı başına okuma yanıtı önbelleği.
+
+Yanıtlar (kullanıcı, kullanıcının sürüm belirteci, tam URL + sıralı sorgu
+parametreleri, medya türü) anahtarıyla saklanır. Kullanıcının görebildiği bir
+Task, Subtask, TaskComment, Category veya Tag kaydedildiğinde ya da
+silindiğinde o kullanıcının sürüm belirteci yenilenir (bkz. tasks.changes);
+eski anahtarlar bir daha okunmaz ve zaman aşımıyla düşer. Böylece anahtar
+taraması veya silme gerekmez ve her Django önbellek arka ucuyla (locmem,
+dosya, Redis) çalışır.
+
+Not: locmem süreç içidir; birden çok süreçle çalışırken sürüm belirteçlerinin
+paylaşılması için dosya tabanlı veya merkezi bir önbellek kullanılmalıdır.
+"""
+import functools
+import hashlib
+import json
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+DEFAULT_RESPONSE_CACHE_SETTINGS = {
+    'ENABLED': True,
+    'CACHE': 'default',
+    'TIMEOUT': 300,
+}
+
+
+def get_response_cache_settings():
+    """Varsayılan değerlerle birleştirilmiş RESPONSE_CACHE ayarlarını döndürür."""
+    config = dict(DEFAULT_RESPONSE_CACHE_SETTINGS)
+    config.update(getattr(settings, 'RESPONSE_CACHE', {}))
+    return config
+
+
+def _cache():
+    return caches[get_response_cache_settings()['CACHE']]
+
+
+class ResponseCacheStats:
+    """Süreç içi isabet/ıska sayaçları."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def record_invalidation(self, count):
+        with self._lock:
+            self.invalidations += count
+
+    def reset(self):
+        with self._lock:
+            self.hits = self.misses = self.invalidations = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'invalidations': self.invalidations,
+            }
+
+
+_stats = ResponseCacheStats()
+
+
+def get_stats():
+    return _stats
+
+
+def _version_key(user_id):
+    return f'response:version:{user_id}'
+
+
+def user_version(user_id):
+    """Kullanıcının geçerli sürüm belirteci; yoksa oluşturulur."""
+    cache = _cache()
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key) or version
+    return version
+
+
+async def auser_version(user_id):
+    """user_version'ın async sürümü."""
+    cache = _cache()
+    key = _version_key(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not await cache.aadd(key, version, timeout=None):
+            version = await cache.aget(key) or version
+    return version
+
+
+def _bump(user_ids):
+    _cache().set_many({_version_key(user_id): uuid.uuid4().hex for user_id in user_ids}, timeout=None)
+
+
+def invalidate_users(user_ids):
+    """
+    Kullanıcıların önbellekteki tüm yanıtlarını geçersiz kılar. Açık bir
+    transaction içindeyse belirteçler commit sonrasında bir kez daha
+    yenilenir; commit'ten önce okunan eski veri önbellekte kalmaz.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return
+    _bump(user_ids)
+    _stats.record_invalidation(len(user_ids))
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump(user_ids))
+
+
+def _variant(request):
+    return [
+        request.build_absolute_uri(request.path),
+        sorted(request.query_params.lists()),
+        request.accepted_media_type,
+    ]
+
+
+def _key(request, version):
+    digest = hashlib.sha1(json.dumps(_variant(request)).encode()).hexdigest()
+    return f'response:{request.user.pk}:{version}:{digest}'
+
+
+def response_key(request):
+    """Kullanıcı, sürüm, URL, sıralı sorgu parametreleri ve medya türünden anahtar."""
+    return _key(request, user_version(request.user.pk))
+
+
+def _set_validators(response, etag, last_modified):
+    if etag:
+        response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
+
+def _not_modified(request, etag, last_modified):
+    if not (etag or last_modified):
+        return None
+    response = get_conditional_response(
+        request._request,
+        etag=etag,
+        last_modified=last_modified and int(last_modified.timestamp()),
+    )
+    if response is None:
+        return None
+    return _set_validators(response, etag, last_modified)
+
+
+def _entry(data, etag, last_modified):
+    return {
+        'data': json.loads(JSONRenderer().render(data)),
+        'etag': etag,
+        'last_modified': last_modified,
+    }
+
+
+def cache_response(method):
+    """
+    ViewSet okuma metotları için dekoratör. Başarılı yanıtın verisi JSON'a
+    uygun sade yapılara çevrilerek saklanır; isabette sorgu ve serialize
+    yapılmadan döner.
+
+    Görünüm get_validators(variant) tanımlıyorsa yanıta ETag ve
+    Last-Modified eklenir; If-None-Match / If-Modified-Since eşleşirse
+    serializer çalıştırılmadan 304 döner. Doğrulayıcılar yanıtla birlikte
+    saklandığından önbellek isabetinde yeniden hesaplanmaz.
+    """
+    @functools.wraps(method)
+    def wrapper(view, request, *args, **kwargs):
+        config = get_response_cache_settings()
+        if not request.user.is_authenticated:
+            return method(view, request, *args, **kwargs)
+
+        cache = _cache() if config['ENABLED'] else None
+        # Anahtar sorgudan önce alınır: bu arada bir yazma olursa yanıt eski
+        # sürümle saklanır ve bir daha okunmaz
+        key = response_key(request) if cache is not None else None
+        entry = cache.get(key) if cache is not None else None
+        if cache is not None:
+            _stats.record(hit=entry is not None)
+
+        if entry is not None:
+            etag, last_modified = entry['etag'], entry['last_modified']
+        elif hasattr(view, 'get_validators'):
+            etag, last_modified = view.get_validators([request.user.pk, *_variant(request)])
+        else:
+            etag, last_modified = None, None
+
+        not_modified = _not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        if entry is not None:
+            return _set_validators(Response(entry['data']), etag, last_modified)
+
+        response = method(view, request, *args, **kwargs)
+        if response.status_code != 200:
+            return response
+        if cache is not None:
+            cache.set(key, _entry(response.data, etag, last_modified), config['TIMEOUT'])
+        return _set_validators(response, etag, last_modified)
+    return wrapper
+
+
+async def acache_response(request, build, render, validators=None):
+    """
+    cache_response'un async görünümler için karşılığı. build() yanıt
+    verisini üreten, validators(variant) ise (ETag, Last-Modified) döndüren
+    coroutine'lerdir; render(data) HttpResponse üretir. Anahtarlar aynı
+    olduğundan senkron görünümlerle önbelleği paylaşır. request kimliği
+    doğrulanmış bir REST framework isteğidir.
+    """
+    config = get_response_cache_settings()
+    cache = _cache() if config['ENABLED'] else None
+    key = _key(request, await auser_version(request.user.pk)) if cache is not None else None
+    entry = await cache.aget(key) if cache is not None else None
+    if cache is not None:
+        _stats.record(hit=entry is not None)
+
+    if entry is not None:
+        etag, last_modified = entry['etag'], entry['last_modified']
+    elif validators is not None:
+        etag, last_modified = await validators([request.user.pk, *_variant(request)])
+    else:
+        etag, last_modified = None, None
+
+    not_modified = _not_modified(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+
+    if entry is not None:
+        return _set_validators(render(entry['data']), etag, last_modified)
+
+    data = await build()
+    if cache is not None:
+        await cache.aset(key, _entry(data, etag, last_modified), config['TIMEOUT'])
+    return _set_validators(render(data), etag, last_modified)
@@ -0,0 +1,192 @@
+"""
+Görev başlık ve açıklamaları için tam metin arama.
+
+Metinler Türkçe kurallarına göre küçük harfe çevrilir (I→ı, İ→i), Snowball
+Türkçe kök bulucusundan geçirilir ve TaskSearchDocument tablosunda tutulur.
+Kök bulucu her çekimi aynı köke indiremediği için köklerin yanında yüzey
+biçimleri de saklanır; sorgudaki her kelimenin kökü veya kendisi bu
+terimlerden biriyle eşleşmelidir. Eşleşme kelime bazlıdır (önek araması
+yapılmaz); önek sorguları FTS5'te dizin üzerinde atlamayı engeller.
+
+SQLite'ta belge tablosu üzerinde bir FTS5 dizini (tetikleyicilerle senkron)
+kullanılır. Görevin oluşturanı ve atananı da 'owners' sütununda belirteç
+olarak dizinlenir; böylece sık geçen bir kelime aransa bile dizin yalnızca
+kullanıcının görevleri üzerinde gezilir. PostgreSQL'de tsvector üzerinde bir
+GIN dizini kullanılır. Diğer veritabanlarında arama LIKE taramasına döner.
+"""
+import re
+import threading
+import uuid
+
+import snowballstemmer
+from django.db import connections
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from rest_framework import filters
+
+from .models import Task, TaskSearchDocument
+
+SEARCH_RANK = 'search_rank'
+INDEXED_FIELDS = ('title', 'description', 'created_by', 'created_by_id', 'assigned_to', 'assigned_to_id')
+
+_WORD_RE = re.compile(r'[^\W_]+')
+_local = threading.local()
+
+
+def turkish_lower(text):
+    """Türkçe noktalı/noktasız i kurallarına uygun küçük harf dönüşümü."""
+    return text.replace('I', 'ı').replace('İ', 'i').lower()
+
+
+def _stemmer():
+    # Snowball kök bulucuları iş parçacıkları arasında paylaşılamaz
+    stemmer = getattr(_local, 'stemmer', None)
+    if stemmer is None:
+        stemmer = _local.stemmer = snowballstemmer.stemmer('turkish')
+    return stemmer
+
+
+def analyze(text):
+    """Metni (kök, yüzey biçimi) çiftlerine ayırır."""
+    words = _WORD_RE.findall(turkish_lower(text or ''))
+    return list(zip(_stemmer().stemWords(words), words))
+
+
+def normalize(text):
+    """Dizinlenecek metin: her kelimenin kökü ve (farklıysa) kendisi."""
+    terms = []
+    for stem, word in analyze(text):
+        terms.append(stem)
+        if word != stem:
+            terms.append(word)
+    return ' '.join(terms)
+
+
+def owner_token(user_id):
+    return f'u{uuid.UUID(str(user_id)).hex}'
+
+
+def owners(task):
+    """Görevi görebilen kullanıcıların (oluşturan ve atanan) belirteçleri."""
+    return ' '.join(dict.fromkeys(
+        owner_token(user_id) for user_id in (task.created_by_id, task.assigned_to_id)
+    ))
+
+
+def build_query(text, vendor, user=None):
+    """
+    Arama metnini veritabanının sorgu diline çevirir. Her kelimenin kökü ya da
+    kendisi eşleşmelidir (VE). SQLite'ta kullanıcı verilirse sorgu onun
+    görevleriyle sınırlanır. Aranacak kelime yoksa None döndürür.
+    """
+    groups = []
+    for stem, word in analyze(text):
+        variants = dict.fromkeys([stem, word])
+        if vendor == 'postgresql':
+            groups.append('(' + ' | '.join(variants) + ')')
+        else:
+            groups.append('(' + ' OR '.join(f'"{v}"' for v in variants) + ')')
+    if not groups:
+        return None
+    if vendor == 'postgresql':
+        return ' & '.join(groups)
+    query = '{title description}: (' + ' AND '.join(groups) + ')'
+    if user is not None:
+        query += f' AND owners: "{owner_token(user.pk)}"'
+    return query
+
+
+def index_tasks(tasks):
+    """Görevlerin arama belgelerini tek sorguda ekler veya günceller."""
+    documents = [
+        TaskSearchDocument(
+            task_id=task.pk,
+            title=normalize(task.title),
+            description=normalize(task.description),
+            owners=owners(task)
+        )
+        for task in tasks
+    ]
+    TaskSearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=['task'],
+        update_fields=['title', 'description', 'owners']
+    )
+
+
+@receiver(post_save, sender=Task)
+def _index_saved_task(sender, instance, update_fields=None, raw=False, **kwargs):
+    """
+    Başlık, açıklama, oluşturan veya atanan değiştiğinde arama belgesini
+    günceller. Silinen görevlerin belgeleri CASCADE ile, dizin kayıtları
+    tetikleyicilerle silinir.
+    """
+    if raw:
+        return
+    if update_fields is not None and not set(INDEXED_FIELDS) & set(update_fields):
+        return
+    index_tasks([instance])
+
+
+def search_vector(title, description):
+    """PostgreSQL tsvector ifadesi; migration'daki GIN dizini de bununla kurulur."""
+    from django.contrib.postgres.search import SearchVector
+
+    return (
+        SearchVector(title, weight='A', config='simple') +
+        SearchVector(description, weight='B', config='simple')
+    )
+
+
+def _sqlite_search(queryset, query):
+    # FTS5 tablosu sorguyu sürer; bm25 her eşleşme için bir kez hesaplanır.
+    # bm25 küçükse daha ilgilidir, işaret çevrilerek "büyük olan önde" yapılır.
+    return queryset.filter(search_document__fts__match=query).annotate(
+        **{SEARCH_RANK: -F('search_document__fts__rank')}
+    )
+
+
+def _postgresql_search(queryset, query):
+    from django.contrib.postgres.search import SearchQuery, SearchRank
+
+    vector = search_vector('search_document__title', 'search_document__description')
+    search_query = SearchQuery(query, search_type='raw', config='simple')
+    return queryset.alias(search_vector=vector).filter(
+        search_vector=search_query
+    ).annotate(**{SEARCH_RANK: SearchRank(vector, search_query)})
+
+
+_BACKENDS = {
+    'sqlite': _sqlite_search,
+    'postgresql': _postgresql_search,
+}
+
+
+def search_tasks(queryset, text, user=None):
+    """
+    Görev sorgusunu tam metin aramayla daraltır ve her satıra search_rank
+    (büyük olan daha ilgili) ekler. user verilirse arama yalnızca onun
+    oluşturduğu veya kendisine atanan görevlerde yapılır.
+    """
+    vendor = connections[queryset.db].vendor
+    query = build_query(text, vendor, user)
+    if query is None:
+        return queryset
+    return _BACKENDS[vendor](queryset, query)
+
+
+class TaskSearchFilter(filters.SearchFilter):
+    """
+    ?search= parametresi için tam metin arama. Desteklenmeyen veritabanlarında
+    görünümün search_fields alanlarında LIKE aramasına geri döner.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms or connections[queryset.db].vendor not in _BACKENDS:
+            return super().filter_queryset(request, queryset, view)
+        # Görev listeleri zaten kullanıcının görevleriyle sınırlıdır; aynı
+        # kısıt dizine de verilerek arama o görevlerle sınırlı tutulur
+        return search_tasks(queryset, ' '.join(terms), request.user)
@@ -1,6 +1,19 @@
 from rest_framework import serializers
 from django.utils.translation import gettext_lazy as _
-from .models import Category, Tag, Task, Subtask, TaskComment
+from .models import Category, Tag, Task, Subtask, TaskComment, TranscriptionJob
+
+class DynamicFieldsMixin:
+    """
+    'fields' parametresiyle verilen alanlar dışındakileri çıkaran serializer
+    karışımı. Seyrek alan kümeleri (?fields=, ?view=compact) için kullanılır.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
 
 class CategorySerializer(serializers.ModelSerializer):
     """Kategori modeli için serializer."""
@@ -13,7 +26,10 @@ class CategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_by', 'created_at', 'updated_at']
 
     def get_task_count(self, obj):
-        """Kategoriye ait görev sayısını döndürür."""
+        """Kategoriye ait görev sayısını döndürür (varsa sorgudaki sayımı kullanır)."""
+        num_tasks = getattr(obj, 'num_tasks', None)
+        if num_tasks is not None:
+            return num_tasks
         return obj.tasks.count()
 
     def create(self, validated_data):
@@ -66,8 +82,11 @@ class TaskCommentSerializer(serializers.ModelSerializer):
         validated_data['user'] = self.context['request'].user
         return super().create(validated_data)
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Ana görev modeli için serializer."""
+
+    # Kanban panosu gibi listeler için kompakt görünüm (?view=compact)
+    COMPACT_FIELDS = ['id', 'title', 'status', 'priority', 'due_date', 'position']
     category_detail = CategorySerializer(source='category', read_only=True)
     tags_detail = TagSerializer(source='tags', many=True, read_only=True)
     subtasks = SubtaskSerializer(many=True, read_only=True)
@@ -81,7 +100,7 @@ class TaskSerializer(serializers.ModelSerializer):
             'id', 'title', 'description', 
             'category', 'category_detail',
             'tags', 'tags_detail',
-            'status', 'priority',
+            'status', 'priority', 'position',
             'due_date', 'reminder_date', 'completed_at',
             'created_by', 'created_by_username',
             'assigned_to', 'assigned_to_username',
@@ -91,7 +110,8 @@ class TaskSerializer(serializers.ModelSerializer):
             'voice_note',
             'subtasks', 'comments'
         ]
-        read_only_fields = ['id', 'created_by', 'created_at', 'updated_at']
+        # Sıra yalnızca move action'ı ile değişir
+        read_only_fields = ['id', 'position', 'created_by', 'created_at', 'updated_at']
 
     def validate(self, data):
         """Özel doğrulama kuralları."""
@@ -112,4 +132,35 @@ class TaskSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """Görev oluştururken mevcut kullanıcıyı ekler."""
         validated_data['created_by'] = self.context['request'].user
-        return super().create(validated_data) 
\ No newline at end of file
+        return super().create(validated_data)
+
+class TranscriptionJobSerializer(serializers.ModelSerializer):
+    """Ses-metin dönüştürme işi için serializer."""
+
+    class Meta:
+        model = TranscriptionJob
+        fields = ['id', 'audio', 'language', 'status', 'text', 'error',
+                 'task', 'apply_to', 'created_at', 'started_at', 'finished_at']
+        read_only_fields = ['id', 'status', 'text', 'error',
+                           'created_at', 'started_at', 'finished_at']
+        extra_kwargs = {'audio': {'write_only': True}}
+
+    def validate_task(self, value):
+        """Yalnızca kullanıcının erişebildiği görevlere yazılabilir."""
+        user = self.context['request'].user
+        if value and not Task.objects.visible_to(user).filter(pk=value.pk).exists():
+            raise serializers.ValidationError(_('Bu göreve erişim yetkiniz yok.'))
+        return value
+
+    def validate(self, data):
+        """Hedef alan seçildiyse görev de belirtilmelidir."""
+        if data.get('apply_to') and not data.get('task'):
+            raise serializers.ValidationError(
+                _('Metnin yazılacağı görev belirtilmelidir.')
+            )
+        return data
+
+    def create(self, validated_data):
+        """İş oluştururken mevcut kullanıcıyı ekler."""
+        validated_data['created_by'] = self.context['request'].user
+        return super().create(validated_data)
@@ -0,0 +1,212 @@
+"""
+Kullanıcı başına görev panosu istatistikleri.
+
+Kullanıcının gördüğü (oluşturduğu veya kendisine atanan) görevlerin
+sayaçları TaskStatsCounter tablosunda (kullanıcı, anahtar) başına bir satır
+olarak tutulur. Görev değişikliklerinde tasks.changes eski ve yeni katkının
+farkını tek bir INSERT ... ON CONFLICT ile ekler; pano görevler listelenmeden
+tek sorguyla okunur. rebuild_task_stats komutu sayaçları görevlerden yeniden
+hesaplar; sıfıra inen sayaçlar prune_task_stats komutuyla (prune) silinir.
+
+Anahtarlar:
+    total, status:<durum>, priority:<öncelik>, category:<id>,
+    estimated_time ve actual_time (saniye),
+    due:<gün>   bitiş günü o gün olan açık görevler,
+    done:<gün>  o gün tamamlanan görevler.
+
+Günler TIME_ZONE'a göre yerel tarihtir. Gecikmiş görevler bitiş günü
+bugünden önce olan açık görevlerdir; bu haftanın tamamlananları
+pazartesiden bugüne kadar sayılır.
+"""
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.db import connections, router, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.duration import duration_string
+
+from .models import Task, TaskStatsCounter
+
+# Katkıyı belirleyen görev alanları
+STATS_FIELDS = ('status', 'priority', 'category_id', 'due_date', 'completed_at', 'estimated_time', 'actual_time')
+
+# Bitiş tarihi geçse de gecikmiş sayılmayan durumlar
+CLOSED_STATUSES = ('done', 'cancelled')
+
+
+def _day(value):
+    return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+
+
+def contribution(values):
+    """Görevin (STATS_FIELDS sözlüğü) sayaçlara katkısı."""
+    counts = Counter(total=1)
+    counts[f"status:{values['status']}"] += 1
+    counts[f"priority:{values['priority']}"] += 1
+    if values['category_id']:
+        counts[f"category:{values['category_id']}"] += 1
+    if values['due_date'] and values['status'] not in CLOSED_STATUSES:
+        counts[f"due:{_day(values['due_date'])}"] += 1
+    if values['completed_at'] and values['status'] == 'done':
+        counts[f"done:{_day(values['completed_at'])}"] += 1
+    for field in ('estimated_time', 'actual_time'):
+        if values[field]:
+            counts[field] += int(values[field].total_seconds())
+    return counts
+
+
+class StatsDelta:
+    """Birlikte yazılacak sayaç farkları: {(kullanıcı, anahtar): fark}."""
+
+    def __init__(self):
+        self.values = defaultdict(int)
+
+    def add(self, user_ids, values, sign=1):
+        """values katkısını kullanıcılara ekler (sign=-1 ile çıkarır)."""
+        user_ids = {user_id for user_id in user_ids if user_id is not None}
+        if not user_ids or values is None:
+            return
+        for key, value in contribution(values).items():
+            for user_id in user_ids:
+                self.values[(user_id, key)] += sign * value
+
+    def change(self, old_owners, old_values, new_owners, new_values):
+        self.add(old_owners, old_values, -1)
+        self.add(new_owners, new_values)
+
+    def apply(self, exclude=()):
+        rows = [
+            (user_id, key, value) for (user_id, key), value in self.values.items()
+            if value and user_id not in exclude
+        ]
+        if rows:
+            increment(rows)
+        self.values.clear()
+
+
+def increment(rows):
+    """(kullanıcı, anahtar, fark) satırlarını sayaçlara tek sorguyla ekler."""
+    connection = connections[router.db_for_write(TaskStatsCounter)]
+    meta = TaskStatsCounter._meta
+    qn = connection.ops.quote_name
+    table, user, key, value = (
+        qn(meta.db_table), qn(meta.get_field('user').column), qn('key'), qn('value')
+    )
+    user_field = meta.get_field('user')
+    batch_size = connection.ops.bulk_batch_size(['user', 'key', 'value'], rows)
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            cursor.execute(
+                f'INSERT INTO {table} ({user}, {key}, {value}) VALUES '
+                + ', '.join(['(%s, %s, %s)'] * len(batch))
+                + f' ON CONFLICT ({user}, {key}) DO UPDATE SET {value} = {table}.{value} + excluded.{value}',
+                [
+                    param
+                    for user_id, name, delta in batch
+                    for param in (user_field.get_db_prep_value(user_id, connection), name, delta)
+                ]
+            )
+
+
+def prune():
+    """
+    Sıfıra inen sayaçları siler; okumada eksik sayaç sıfır sayılır. Sonraki
+    artış satırı yeniden oluşturur. Silinen sayaç sayısını döndürür.
+    """
+    deleted, _ = TaskStatsCounter.objects.filter(value=0).delete()
+    return deleted
+
+
+def task_values(task):
+    return {field: getattr(task, field) for field in STATS_FIELDS}
+
+
+def loaded_task_values(task):
+    """Görevin son kaydedilen (yüklenen) katkı alanları; bilinmiyorsa None."""
+    loaded = getattr(task, '_loaded_values', None)
+    if not loaded:
+        return None
+    return {field: loaded.get(field) for field in STATS_FIELDS}
+
+
+def remove_category(category_id, user_ids):
+    """Silinen kategorinin sayaçlarını kaldırır; görevleri SET_NULL ile boşaltılır."""
+    TaskStatsCounter.objects.filter(user__in=user_ids, key=f'category:{category_id}').delete()
+
+
+def user_stats(user, today=None):
+    """Kullanıcının pano istatistikleri."""
+    today = today or timezone.localdate()
+    week_start = today - timedelta(days=today.weekday())
+    rows = (
+        TaskStatsCounter.objects.filter(user=user)
+        # Eski tamamlanma günleri ve gelecekteki bitiş günleri okunmaz
+        .exclude(key__startswith='done:', key__lt=f'done:{week_start}')
+        .exclude(key__startswith='due:', key__gte=f'due:{today}')
+        .values_list('key', 'value')
+    )
+    stats = {
+        'total': 0,
+        'by_status': {status: 0 for status, _ in Task.STATUS_CHOICES},
+        'by_priority': {priority: 0 for priority, _ in Task.PRIORITY_CHOICES},
+        'by_category': {},
+        'overdue': 0,
+        'completed_this_week': 0,
+        'estimated_time': 0,
+        'actual_time': 0,
+    }
+    for key, value in rows:
+        kind, _, name = key.partition(':')
+        if kind == 'status':
+            stats['by_status'][name] = value
+        elif kind == 'priority':
+            stats['by_priority'][int(name)] = value
+        elif kind == 'category':
+            if value:
+                stats['by_category'][name] = value
+        elif kind == 'due':
+            stats['overdue'] += value
+        elif kind == 'done':
+            stats['completed_this_week'] += value
+        else:
+            stats[kind] = value
+    for field in ('estimated_time', 'actual_time'):
+        stats[field] = duration_string(timedelta(seconds=stats[field]))
+    return stats
+
+
+def rebuild(user=None, task_model=Task, counter_model=TaskStatsCounter, using=None):
+    """
+    Sayaçları görevlerden yeniden hesaplar; user verilirse yalnızca onunkileri.
+    Migrasyonlarda tarihsel modellerle de çağrılabilir. Oluşturulan sayaç
+    sayısını döndürür.
+    """
+    using = using or router.db_for_write(counter_model)
+    tasks = task_model.objects.using(using).order_by()
+    counters = counter_model.objects.using(using)
+    if user is not None:
+        tasks = tasks.filter(Q(created_by=user) | Q(assigned_to=user))
+        counters = counters.filter(user=user)
+
+    totals = defaultdict(int)
+    rows = tasks.values_list('created_by_id', 'assigned_to_id', *STATS_FIELDS)
+    for created_by_id, assigned_to_id, *values in rows.iterator(chunk_size=2000):
+        owners = {created_by_id, assigned_to_id}
+        if user is not None:
+            owners &= {user.pk}
+        for key, value in contribution(dict(zip(STATS_FIELDS, values))).items():
+            for user_id in owners:
+                totals[(user_id, key)] += value
+
+    with transaction.atomic(using=using):
+        counters.delete()
+        counter_model.objects.using(using).bulk_create(
+            (
+                counter_model(user_id=user_id, key=key, value=value)
+                for (user_id, key), value in totals.items() if value
+            ),
+            batch_size=2000,
+        )
+    return sum(1 for value in totals.values() if value)
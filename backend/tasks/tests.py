@@ -1,3 +1,1806 @@
-from django.test import TestCase
+import asyncio
+import base64
+import io
+import json
+import multiprocessing
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import numpy as np
+
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from backend.firebase_auth import token_cache, user_cache
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.conf import settings
+from django.middleware.csrf import _get_new_csrf_string
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, path
+from django.utils import timezone
+from rest_framework import permissions, throttling
+from rest_framework.test import APIClient
+
+from .audio import SAMPLE_RATE, decode_upload, split_segments, split_stream, stream_pcm
+from .jobs import run_job
+from . import analytics, ranking, realtime, response_cache, search, stats
+from . import urls as tasks_urls
+from .models import (
+    Category, ChangeLogEntry, DailyProductivity, EnrichmentCache, NotificationOutbox, ReminderDelivery, Subtask, Tag, Task, TaskComment, TaskSearchDocument,
+    TaskStatsCounter, TranscriptionJob
+)
+from .changes import task_updated
+from .enrichment import EnrichmentPipeline, StubClient, get_enrichment_settings
+from .notifications import NotificationDispatcher
+from .realtime import InProcessBroker
+from .reminders import ReminderScheduler
+from .transcript_cache import TranscriptCache
+from .transcription import TranscriptionEngine, TranscriptionTimeout
+from .views import CategoryViewSet, TaskViewSet, convert_audio_to_text
+
+User = get_user_model()
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class TranscriptionJobTests(TestCase):
+    """Asenkron ses-metin dönüştürme işlerinin testleri."""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.task = Task.objects.create(
+            title='Toplantı', description='', created_by=self.user, assigned_to=self.user
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _post_job(self, **extra):
+        audio = SimpleUploadedFile('note.wav', b'RIFF....WAVE', content_type='audio/wav')
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(
+                '/api/transcription-jobs/', {'audio': audio, **extra}, format='multipart'
+            )
+        return response, callbacks
+
+    def test_create_returns_job_id_without_waiting(self):
+        with mock.patch('tasks.views.convert_audio_to_text') as convert:
+            response, callbacks = self._post_job()
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['status'], 'pending')
+        self.assertEqual(len(callbacks), 1)
+        convert.assert_not_called()
+
+    def test_job_result_is_written_to_task(self):
+        response, _ = self._post_job(task=str(self.task.pk), apply_to='description')
+        job_id = response.data['id']
+
+        with mock.patch('tasks.views.convert_audio_to_text',
+                        return_value={'success': True, 'text': 'Rapor hazırla'}):
+            run_job(job_id)
+
+        response = self.client.get(f'/api/transcription-jobs/{job_id}/')
+        self.assertEqual(response.data['status'], 'done')
+        self.assertEqual(response.data['text'], 'Rapor hazırla')
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.description, 'Rapor hazırla')
+        self.assertEqual(self.task.voice_note.name, TranscriptionJob.objects.get(pk=job_id).audio.name)
+
+    def test_failed_job_reports_error(self):
+        response, _ = self._post_job()
+        with mock.patch('tasks.views.convert_audio_to_text',
+                        return_value={'success': False, 'error': 'hata'}):
+            job = run_job(response.data['id'])
+        self.assertEqual(job.status, 'failed')
+        self.assertEqual(job.error, 'hata')
+
+    def test_stale_jobs_are_requeued(self):
+        response, _ = self._post_job(task=str(self.task.pk), apply_to='description')
+        stale = TranscriptionJob.objects.get(pk=response.data['id'])
+        fresh = TranscriptionJob.objects.create(created_by=self.user, audio=stale.audio.name)
+        # Süreç dönüştürme sırasında kapanmış gibi 'running' kalan iş
+        past = timezone.now() - timedelta(hours=1)
+        TranscriptionJob.objects.filter(pk=stale.pk).update(status='running', created_at=past, started_at=past)
+
+        with mock.patch('tasks.views.convert_audio_to_text',
+                        return_value={'success': True, 'text': 'Rapor hazırla'}) as convert:
+            call_command('requeue_transcription_jobs', stdout=io.StringIO())
+
+        convert.assert_called_once()
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, 'done')
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.description, 'Rapor hazırla')
+        # Yeni iş kuyruktaki sırasını bekler
+        self.assertEqual(TranscriptionJob.objects.get(pk=fresh.pk).status, 'pending')
+
+
+class TranscriptCacheTests(TestCase):
+    """Ses özetine göre adreslenen transkript önbelleğinin testleri."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TranscriptCache(self.directory, max_bytes=10)
+        cache.set('a', 'aaaa')
+        cache.set('b', 'bbbb')
+        cache.get('a')
+        cache.set('c', 'cccc')
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'aaaa')
+        self.assertEqual(cache.get('c'), 'cccc')
+        self.assertEqual(cache.stats()['hits'], 3)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_repeated_audio_skips_whisper(self):
+        cache = TranscriptCache(self.directory, max_bytes=1024)
+        engine = mock.Mock()
+        engine.transcribe.return_value = 'Alışveriş listesi'
+        with mock.patch('tasks.views.get_cache', return_value=cache), \
+                mock.patch('tasks.views.get_engine', return_value=engine):
+            first = convert_audio_to_text('note.wav', audio_hash='abc')
+            second = convert_audio_to_text('note.wav', audio_hash='abc')
+            other_language = convert_audio_to_text('note.wav', language='en', audio_hash='abc')
+
+        self.assertFalse(first['cached'])
+        self.assertTrue(second['cached'])
+        self.assertEqual(second['text'], 'Alışveriş listesi')
+        self.assertFalse(other_language['cached'])
+        self.assertEqual(engine.transcribe.call_count, 2)
+
+
+def _init_fake_worker(model_size):
+    pass
+
+
+def _fake_worker(audio, language):
+    if audio == 'takılan':
+        time.sleep(60)
+    return f'{audio} ({language})'
+
+
+@skipUnless('fork' in multiprocessing.get_all_start_methods(), "'fork' başlatma yöntemi gerekir")
+class TranscriptionEngineTests(SimpleTestCase):
+    """İşçi süreç havuzunun sahte işçi fonksiyonuyla testleri."""
+
+    def setUp(self):
+        # Test modülündeki işçinin alt süreçte bulunması için 'fork' kullanılır
+        self.engine = TranscriptionEngine(
+            job_timeout=30, worker=_fake_worker, initializer=_init_fake_worker, start_method='fork'
+        )
+        self.addCleanup(self.engine.shutdown)
+
+    def test_segments_are_returned_in_order(self):
+        texts = list(self.engine.transcribe_many(['bir', 'iki', 'üç'], language='en'))
+        self.assertEqual(texts, ['bir (en)', 'iki (en)', 'üç (en)'])
+
+    def test_timeout_resets_the_pool_and_next_call_succeeds(self):
+        self.assertEqual(self.engine.transcribe('önce'), 'önce (tr)')
+        stuck = self.engine._pool
+
+        with self.assertRaises(TranscriptionTimeout):
+            self.engine.transcribe('takılan', timeout=0.5)
+
+        # Takılan işçi sonlandırılır; sonraki iş yeni havuzda çalışır
+        self.assertIsNone(self.engine._pool)
+        self.assertEqual(self.engine.transcribe('sonra'), 'sonra (tr)')
+        self.assertIsNot(self.engine._pool, stuck)
+
+
+class StreamingTranscriptionTests(TestCase):
+    """Bölütlenmiş, akışlı ses-metin dönüştürme testleri."""
+
+    def test_segments_are_cut_at_silence(self):
+        audio = np.ones(SAMPLE_RATE * 25, dtype=np.float32)
+        audio[SAMPLE_RATE * 9:SAMPLE_RATE * 9 + 800] = 0.0
+
+        segments = list(split_segments(audio, segment_seconds=10, search_seconds=2))
+
+        self.assertEqual(segments[0][1], 9.0)
+        self.assertEqual(sum(len(pcm) for _, _, pcm in segments), len(audio))
+
+    def test_partial_results_are_streamed_as_events(self):
+        user = User.objects.create_user(email='stream@example.com', password='pass')
+        client = APIClient()
+        client.force_authenticate(user)
+        words = iter(['Merhaba', 'dünya'])
+        engine = mock.Mock()
+        engine.transcribe_many.side_effect = lambda audios, language: (next(words) for _ in audios)
+        cache = TranscriptCache(tempfile.mkdtemp(), max_bytes=1024)
+        self.addCleanup(shutil.rmtree, cache.directory, ignore_errors=True)
+        decoded = []
+
+        def decode(upload, max_in_memory_bytes):
+            # 45 saniyelik ses, ffmpeg'den saniyelik parçalar halinde gelir
+            for second in range(45):
+                decoded.append(second)
+                yield np.zeros(SAMPLE_RATE, dtype=np.float32)
+
+        with mock.patch('tasks.views.stream_upload', side_effect=decode), \
+                mock.patch('tasks.views.get_engine', return_value=engine), \
+                mock.patch('tasks.views.get_cache', return_value=cache):
+            response = client.post(
+                '/api/voice-to-text/?stream=1',
+                {'audio': SimpleUploadedFile('long.wav', b'RIFF'), 'language': 'tr'},
+                format='multipart'
+            )
+            events = iter(response.streaming_content)
+            first = next(events).decode('utf-8')
+            # İlk bölüt sesin tamamı çözülmeden gönderilir
+            self.assertLess(len(decoded), 45)
+            body = first + b''.join(events).decode('utf-8')
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertIn('event: partial', first)
+        self.assertEqual(body.count('event: partial'), 2)
+        self.assertIn('"text": "Merhaba dünya"', body)
+
+    def test_chunked_split_matches_whole_split(self):
+        rng = np.random.default_rng(0)
+        audio = rng.uniform(-1, 1, SAMPLE_RATE * 70).astype(np.float32)
+        audio[456000:456000 + 800] = 0.0
+        chunks = np.array_split(audio, 37)
+
+        whole = list(split_segments(audio, segment_seconds=30))
+        streamed = list(split_stream(chunks, segment_seconds=30))
+
+        self.assertEqual([(start, end) for start, end, _ in streamed], [(start, end) for start, end, _ in whole])
+        self.assertEqual(streamed[0][1], 28.5)
+        np.testing.assert_array_equal(np.concatenate([pcm for _, _, pcm in streamed]), audio)
+
+    def _fake_decoder(self, script):
+        # ffmpeg yerine stdin'i stdout'a kopyalayan bir süreç
+        return lambda source, pipe_stdin: subprocess.Popen(
+            [sys.executable, '-c', script],
+            stdin=subprocess.PIPE if pipe_stdin else None, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+
+    def test_pcm_is_streamed_from_the_decoder_pipe(self):
+        samples = (np.arange(SAMPLE_RATE * 3) % 1000).astype(np.int16)
+        data = samples.tobytes()
+        copy = 'import shutil, sys; shutil.copyfileobj(sys.stdin.buffer, sys.stdout.buffer)'
+        with mock.patch('tasks.audio._start_decoder', self._fake_decoder(copy)):
+            chunks = list(stream_pcm('pipe:', (data[i:i + 4096] for i in range(0, len(data), 4096))))
+        self.assertEqual(len(chunks), 3)
+        np.testing.assert_array_equal(np.concatenate(chunks), samples / 32768.0)
+
+        failing = 'import sys; sys.stderr.write("bozuk veri"); sys.exit(1)'
+        with mock.patch('tasks.audio._start_decoder', self._fake_decoder(failing)):
+            with self.assertRaisesMessage(RuntimeError, 'bozuk veri'):
+                list(stream_pcm('kayit.wav'))
+
+
+class InMemoryAudioPipelineTests(TestCase):
+    """Geçici dosya kullanmayan ses çözümleme hattının testleri."""
+
+    def test_session_upload_with_csrf_uses_audio_handlers(self):
+        user = User.objects.create_user(email='web@example.com', password='pass')
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(user)
+        token = _get_new_csrf_string()
+        client.cookies[settings.CSRF_COOKIE_NAME] = token
+        result = {'success': True, 'text': 'Merhaba', 'cached': False}
+
+        with mock.patch('tasks.views.convert_audio_to_text', return_value=result) as convert:
+            response = client.post(
+                '/api/voice-to-text/', {'audio': SimpleUploadedFile('note.wav', b'RIFF' * 10)},
+                HTTP_X_CSRFTOKEN=token
+            )
+            rejected = client.post('/api/voice-to-text/', {'audio': SimpleUploadedFile('note.wav', b'RIFF')})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['text'], 'Merhaba')
+        # Eşik altındaki yükleme bellekte tutulur
+        self.assertFalse(hasattr(convert.call_args[0][0], 'temporary_file_path'))
+        self.assertEqual(rejected.status_code, 403)
+
+    def test_small_upload_is_decoded_from_memory(self):
+        upload = SimpleUploadedFile('note.wav', b'RIFF' * 10)
+        pcm = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        with mock.patch('tasks.audio.decode_audio_bytes', return_value=pcm) as decode, \
+                mock.patch('tasks.audio.tempfile.NamedTemporaryFile') as temp_file:
+            result = decode_upload(upload, max_in_memory_bytes=1024)
+
+        self.assertIs(result, pcm)
+        self.assertEqual(bytes(decode.call_args[0][0]), b'RIFF' * 10)
+        temp_file.assert_not_called()
+
+    def test_large_upload_falls_back_to_temp_file(self):
+        upload = SimpleUploadedFile('note.wav', b'RIFF' * 10)
+        pcm = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        with mock.patch('tasks.audio.decode_audio_bytes') as decode, \
+                mock.patch('tasks.audio.load_audio', return_value=pcm) as load:
+            result = decode_upload(upload, max_in_memory_bytes=8)
+
+        self.assertIs(result, pcm)
+        decode.assert_not_called()
+        load.assert_called_once()
+
+
+class TaskQueryBudgetTests(TestCase):
+    """Görev listesinin sorgu sayısının görev sayısından bağımsız olduğunu doğrular."""
+
+    # ETag doğrulayıcıları, sayfalama sayımı, görevler, kategori, etiketler,
+    # alt görevler, yorumlar
+    QUERY_BUDGET = 7
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='owner@example.com', password='pass')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _create_tasks(self, count):
+        start = Task.objects.count()
+        for i in range(start, start + count):
+            category = Category.objects.create(name=f'Kategori {i}', created_by=self.user)
+            tag = Tag.objects.create(name=f'Etiket {i}', created_by=self.user)
+            task = Task.objects.create(
+                title=f'Görev {i}', description='', category=category,
+                created_by=self.user, assigned_to=self.other
+            )
+            task.tags.add(tag)
+            Subtask.objects.create(parent_task=task, title='Alt görev',
+                                   created_by=self.user, assigned_to=self.other)
+            TaskComment.objects.create(task=task, user=self.other, content='Yorum')
+
+    def test_list_query_count_is_constant(self):
+        self._create_tasks(2)
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            response = self.client.get('/api/tasks/')
+        self.assertEqual(len(response.data['results']), 2)
+
+        self._create_tasks(8)
+        with self.assertNumQueries(self.QUERY_BUDGET):
+            response = self.client.get('/api/tasks/')
+        self.assertEqual(len(response.data['results']), 10)
+        self.assertEqual(response.data['results'][0]['category_detail']['task_count'], 1)
+
+    def test_retrieve_query_count(self):
+        self._create_tasks(1)
+        task = Task.objects.get()
+        with self.assertNumQueries(self.QUERY_BUDGET - 1):
+            self.client.get(f'/api/tasks/{task.pk}/')
+
+
+class TaskSparseFieldsetTests(TestCase):
+    """Kompakt görünüm ve seyrek alan kümeleri testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='owner@example.com', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        for i in range(3):
+            task = Task.objects.create(title=f'Görev {i}', description='Uzun açıklama',
+                                       created_by=self.user, assigned_to=self.user)
+            Subtask.objects.create(parent_task=task, title='Alt görev', created_by=self.user)
+
+    def test_compact_view_returns_board_fields_only(self):
+        # ETag doğrulayıcıları, sayfalama sayımı ve görevler; ilişki yüklenmez
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/tasks/?view=compact')
+        self.assertEqual(set(response.data['results'][0]),
+                         {'id', 'title', 'status', 'priority', 'due_date', 'position'})
+
+    def test_fields_and_expand(self):
+        response = self.client.get('/api/tasks/?fields=id,title&expand=subtasks')
+        self.assertEqual(set(response.data['results'][0]), {'id', 'title', 'subtasks'})
+        self.assertEqual(len(response.data['results'][0]['subtasks']), 1)
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get('/api/tasks/?fields=id,secret')
+        self.assertEqual(response.status_code, 400)
+
+
+class VisibilityTests(TestCase):
+    """Görev, alt görev ve yorum görünürlük katmanının testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        self.own = Task.objects.create(title='Kendi', description='',
+                                       created_by=self.user, assigned_to=self.user)
+        self.assigned = Task.objects.create(title='Atanan', description='',
+                                            created_by=self.other, assigned_to=self.user)
+        self.hidden = Task.objects.create(title='Gizli', description='',
+                                          created_by=self.other, assigned_to=self.other)
+
+    def test_tasks(self):
+        self.assertEqual(set(Task.objects.visible_to(self.user)), {self.own, self.assigned})
+
+    def test_subtasks(self):
+        via_parent = Subtask.objects.create(parent_task=self.own, title='a', created_by=self.other)
+        assigned = Subtask.objects.create(parent_task=self.hidden, title='b',
+                                          created_by=self.other, assigned_to=self.user)
+        Subtask.objects.create(parent_task=self.hidden, title='c', created_by=self.other)
+        self.assertEqual(set(Subtask.objects.visible_to(self.user)), {via_parent, assigned})
+
+    def test_comments(self):
+        on_assigned = TaskComment.objects.create(task=self.assigned, user=self.other, content='a')
+        own = TaskComment.objects.create(task=self.hidden, user=self.user, content='b')
+        TaskComment.objects.create(task=self.hidden, user=self.other, content='c')
+        self.assertEqual(set(TaskComment.objects.visible_to(self.user)), {on_assigned, own})
+
+
+class KeysetPaginationTests(TestCase):
+    """Cursor (keyset) sayfalama testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        now = timezone.now()
+        for i in range(25):
+            Task.objects.create(
+                title=f'Görev {i}', description='',
+                created_by=self.user, assigned_to=self.user,
+                # Aynı bitiş tarihleri ve boş değerler sıralama bağlarını sınar
+                due_date=None if i % 5 == 0 else now + timedelta(days=i % 3),
+            )
+
+    def _walk(self, url, link='next'):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(task['id'] for task in response.data['results'])
+            url = response.data[link]
+        return ids, response
+
+    def test_every_task_is_visited_once_for_each_ordering(self):
+        for ordering in ['-created_at', 'due_date', '-due_date', 'priority']:
+            ids, _ = self._walk(f'/api/tasks/?view=compact&ordering={ordering}&page_size=4')
+            self.assertEqual(len(ids), 25, ordering)
+            self.assertEqual(len(set(ids)), 25, ordering)
+
+    def test_previous_link_returns_to_earlier_page(self):
+        first = self.client.get('/api/tasks/?view=compact&ordering=due_date&page_size=4')
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+        self.assertEqual(back.data['results'], first.data['results'])
+        self.assertIsNone(back.data['previous'])
+
+    def test_count_can_be_skipped(self):
+        response = self.client.get('/api/tasks/?view=compact')
+        self.assertEqual(response.data['count'], 25)
+        # ETag doğrulayıcıları ve görevler
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/tasks/?view=compact&count=false')
+        self.assertNotIn('count', response.data)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get('/api/tasks/?cursor=bozuk')
+        self.assertEqual(response.status_code, 404)
+
+        # Çözülebilen fakat kimliği geçersiz cursor da 404 döner
+        payload = json.dumps({'v': timezone.now().isoformat(), 'p': 'bozuk', 'r': 0})
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        for url in ('/api/tasks/', '/api/tasks/my_tasks/'):
+            response = self.client.get(url, {'cursor': cursor})
+            self.assertEqual(response.status_code, 404)
+            self.assertEqual(response.data['detail'], 'Geçersiz cursor.')
+
+
+class MyTasksTests(TestCase):
+    """my_tasks uç noktasının filtre ve sayfalama testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        for i in range(12):
+            Task.objects.create(
+                title=f'Görev {i}', description='',
+                status='done' if i % 3 == 0 else 'todo',
+                created_by=self.other, assigned_to=self.user,
+            )
+        # Kullanıcının oluşturduğu ama başkasına atanmış görev listede yer almaz
+        Task.objects.create(title='Başkası', description='', created_by=self.user, assigned_to=self.other)
+
+    def test_paginates_assigned_tasks(self):
+        response = self.client.get('/api/tasks/my_tasks/?view=compact&page_size=5')
+        self.assertEqual(response.data['count'], 12)
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertIsNotNone(response.data['next'])
+
+    def test_filters_and_search(self):
+        response = self.client.get('/api/tasks/my_tasks/?status=done&ordering=-due_date')
+        self.assertEqual(response.data['count'], 4)
+        self.assertTrue(all(task['status'] == 'done' for task in response.data['results']))
+
+        response = self.client.get('/api/tasks/my_tasks/?search=Başkası')
+        self.assertEqual(response.data['count'], 0)
+
+
+class TaskSearchTests(TestCase):
+    """Tam metin arama testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _task(self, title, description=''):
+        return Task.objects.create(
+            title=title, description=description,
+            created_by=self.user, assigned_to=self.user
+        )
+
+    def _search(self, text, **params):
+        response = self.client.get('/api/tasks/', {'search': text, 'view': 'compact', **params})
+        self.assertEqual(response.status_code, 200)
+        return [task['title'] for task in response.data['results']]
+
+    def test_turkish_normalization(self):
+        self.assertEqual(search.turkish_lower('IŞIK İzmir'), 'ışık izmir')
+        self._task('Faturaları öde')
+        self._task('IŞIKLARI kontrol et')
+        self._task('Alışveriş')
+        self.assertEqual(self._search('fatura'), ['Faturaları öde'])
+        self.assertEqual(self._search('ışıklar'), ['IŞIKLARI kontrol et'])
+        self.assertEqual(self._search('faturanın öde'), ['Faturaları öde'])
+
+    def test_search_follows_assignment(self):
+        other = User.objects.create_user(email='other@example.com', password='pass')
+        task = Task.objects.create(
+            title='Rapor', description='', created_by=other, assigned_to=other
+        )
+        self.assertEqual(self._search('rapor'), [])
+        task.assigned_to = self.user
+        task.save(update_fields=['assigned_to'])
+        self.assertEqual(self._search('rapor'), ['Rapor'])
+
+    def test_results_are_ranked(self):
+        self._task('Alışveriş', 'rapor için kağıt al')
+        self._task('Rapor yaz', 'aylık rapor taslağı')
+        self._task('Spor')
+        self.assertEqual(self._search('rapor'), ['Rapor yaz', 'Alışveriş'])
+        self.assertEqual(
+            self._search('rapor', ordering='created_at'),
+            ['Alışveriş', 'Rapor yaz']
+        )
+
+    def test_ranked_pages_follow_cursor(self):
+        for i in range(7):
+            self._task(f'Rapor {i}', 'rapor ' * i)
+        url = '/api/tasks/?search=rapor&view=compact&page_size=3'
+        titles = []
+        while url:
+            response = self.client.get(url)
+            titles.extend(task['title'] for task in response.data['results'])
+            url = response.data['next']
+        self.assertEqual(sorted(titles), [f'Rapor {i}' for i in range(7)])
+
+    def test_index_follows_save_and_delete(self):
+        task = self._task('Fatura öde')
+        task.title = 'Kira öde'
+        task.save()
+        self.assertEqual(self._search('fatura'), [])
+        self.assertEqual(self._search('kira'), ['Kira öde'])
+
+        task.delete()
+        self.assertEqual(self._search('kira'), [])
+        self.assertFalse(TaskSearchDocument.objects.exists())
+
+
+class BulkTaskOperationTests(TestCase):
+    """Toplu görev işlemleri testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.category = Category.objects.create(name='İş', created_by=self.user)
+        self.tag = Tag.objects.create(name='acil', created_by=self.user)
+
+    def _task(self, **kwargs):
+        kwargs.setdefault('created_by', self.user)
+        kwargs.setdefault('assigned_to', self.user)
+        return Task.objects.create(title='Görev', description='', **kwargs)
+
+    def _bulk(self, operations):
+        return self.client.post('/api/tasks/bulk/', {'operations': operations}, format='json')
+
+    def test_moving_many_cards_costs_a_handful_of_queries(self):
+        tasks = [self._task() for _ in range(200)]
+        operations = [{'op': 'status', 'id': str(task.pk), 'status': 'done'} for task in tasks]
+        # Değişiklik günlüğü ve bildirim kuyruğu SQLite'ın değişken sınırı
+        # nedeniyle ikişer INSERT'e bölünür; pano sayaçları tek sorguda güncellenir
+        with self.assertNumQueries(10):
+            response = self._bulk(operations)
+        self.assertEqual(response.data['succeeded'], 200)
+        self.assertEqual(Task.objects.filter(status='done', completed_at__isnull=False).count(), 200)
+
+    def test_status_op_skips_tasks_already_in_that_status(self):
+        completed_at = timezone.now() - timedelta(days=3)
+        task = self._task(status='done', completed_at=completed_at)
+        updated_at = Task.objects.get(pk=task.pk).updated_at
+        open_task = self._task()
+
+        response = self._bulk([
+            {'op': 'status', 'id': str(task.pk), 'status': 'done'},
+            {'op': 'status', 'id': str(open_task.pk), 'status': 'todo'},
+        ])
+
+        self.assertEqual(response.data['succeeded'], 2)
+        task.refresh_from_db()
+        self.assertEqual(task.completed_at, completed_at)
+        self.assertEqual(task.updated_at, updated_at)
+        self.assertIsNone(Task.objects.get(pk=open_task.pk).completed_at)
+        done_key = f'done:{timezone.localdate(completed_at)}'
+        self.assertEqual(TaskStatsCounter.objects.get(user=self.user, key=done_key).value, 1)
+
+    def test_mixed_operations_with_per_item_results(self):
+        existing = self._task()
+        removed = self._task()
+        foreign = self._task(created_by=self.other, assigned_to=self.other)
+        response = self._bulk([
+            {'op': 'create', 'data': {
+                'title': 'Yeni rapor', 'description': 'aylık',
+                'assigned_to': str(self.user.pk),
+                'category': str(self.category.pk), 'tags': [str(self.tag.pk)],
+            }},
+            {'op': 'update', 'id': str(existing.pk), 'data': {'title': 'Fatura', 'priority': 4}},
+            {'op': 'delete', 'id': str(removed.pk)},
+            {'op': 'status', 'id': str(foreign.pk), 'status': 'done'},
+            {'op': 'create', 'data': {'title': 'Eksik'}},
+            {'op': 'rename'},
+        ])
+        self.assertEqual(response.status_code, 200)
+        results = response.data['results']
+        self.assertEqual([r['success'] for r in results], [True, True, True, False, False, False])
+        self.assertIn('assigned_to', results[4]['errors'])
+        self.assertEqual(response.data['failed'], 3)
+
+        created = Task.objects.get(pk=results[0]['id'])
+        self.assertEqual(created.created_by, self.user)
+        self.assertEqual(list(created.tags.all()), [self.tag])
+        existing.refresh_from_db()
+        self.assertEqual((existing.title, existing.priority), ('Fatura', 4))
+        self.assertFalse(Task.objects.filter(pk=removed.pk).exists())
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.status, 'todo')
+
+        # Toplu işlemler arama dizinini de günceller
+        response = self.client.get('/api/tasks/', {'search': 'fatura rapor'})
+        self.assertEqual(response.data['results'], [])
+        response = self.client.get('/api/tasks/', {'search': 'fatura'})
+        self.assertEqual([t['id'] for t in response.data['results']], [str(existing.pk)])
+
+    def test_invalid_related_object_is_reported(self):
+        response = self._bulk([{'op': 'create', 'data': {
+            'title': 'X', 'description': '', 'assigned_to': str(self.user.pk),
+            'category': '00000000-0000-0000-0000-000000000000',
+        }}])
+        self.assertFalse(response.data['results'][0]['success'])
+        self.assertIn('category', response.data['results'][0]['errors'])
+        self.assertFalse(Task.objects.filter(title='X').exists())
+
+    def test_operation_list_is_required(self):
+        self.assertEqual(self._bulk([]).status_code, 400)
+
+
+class KanbanTests(TestCase):
+    """Durum geçişleri ve Kanban sıralaması testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.tasks = [
+            Task.objects.create(title=f'Kart {i}', description='', created_by=self.user, assigned_to=self.user)
+            for i in range(4)
+        ]
+
+    def _board(self, status='todo'):
+        response = self.client.get('/api/tasks/', {'view': 'compact', 'ordering': 'position', 'status': status})
+        return [task['title'] for task in response.data['results']]
+
+    def _move(self, task, **data):
+        data = {key: str(value.pk) if isinstance(value, Task) else value for key, value in data.items()}
+        return self.client.post(f'/api/tasks/{task.pk}/move/', data, format='json')
+
+    def test_status_transition_is_a_single_scoped_update(self):
+        task = self.tasks[0]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(f'/api/tasks/{task.pk}/mark_complete/')
+        self.assertEqual(response.status_code, 200)
+        # Eski değerler ve sahipler, tek UPDATE, değişiklik günlüğü, bildirim
+        # kuyruğu ve pano sayaçları
+        updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(len(queries), 5)
+        self.assertNotIn('ai_tags', updates[0])
+        task.refresh_from_db()
+        completed_at = task.completed_at
+        self.assertEqual(task.status, 'done')
+
+        # Zaten tamamlanmış görevde tamamlanma zamanı değişmez
+        self.client.post(f'/api/tasks/{task.pk}/mark_complete/')
+        task.refresh_from_db()
+        self.assertEqual(task.completed_at, completed_at)
+
+        self.client.post(f'/api/tasks/{task.pk}/mark_in_progress/')
+        task.refresh_from_db()
+        self.assertEqual(task.status, 'in_progress')
+
+    def test_status_transition_of_invisible_task_is_404(self):
+        other = User.objects.create_user(email='other@example.com', password='pass')
+        task = Task.objects.create(title='X', description='', created_by=other, assigned_to=other)
+        self.assertEqual(self.client.post(f'/api/tasks/{task.pk}/mark_complete/').status_code, 404)
+        self.assertEqual(self.client.post('/api/tasks/bozuk/mark_complete/').status_code, 404)
+
+    def test_move_updates_only_the_moved_card(self):
+        first, second, third, fourth = self.tasks
+        self.assertEqual(self._board(), ['Kart 0', 'Kart 1', 'Kart 2', 'Kart 3'])
+        positions = {task.pk: task.position for task in self.tasks}
+
+        # Komşular ve sahipler, UPDATE, değişiklik günlüğü kaydı
+        with self.assertNumQueries(3):
+            self._move(fourth, after=first, before=second)
+        self.assertEqual(self._board(), ['Kart 0', 'Kart 3', 'Kart 1', 'Kart 2'])
+        self._move(first, after=third)
+        self._move(third, before=fourth)
+        self.assertEqual(self._board(), ['Kart 2', 'Kart 3', 'Kart 1', 'Kart 0'])
+
+        unchanged = Task.objects.filter(pk=second.pk).values_list('position', flat=True).get()
+        self.assertEqual(unchanged, positions[second.pk])
+
+    def test_move_to_another_column(self):
+        response = self._move(self.tasks[1], status='done')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._board('done'), ['Kart 1'])
+        self.assertIsNotNone(Task.objects.get(pk=self.tasks[1].pk).completed_at)
+        self.assertEqual(response.data['status'], 'done')
+
+        # Yalnızca sıra değişirse yanıt görevin geçerli durumunu döndürür
+        response = self._move(self.tasks[1])
+        self.assertEqual(response.data['status'], 'done')
+
+    def test_invalid_moves(self):
+        first, second = self.tasks[:2]
+        self.assertEqual(self._move(first, after=second, before=first).status_code, 400)
+        self.assertEqual(self._move(first, after='00000000-0000-0000-0000-000000000000').status_code, 400)
+        self.assertEqual(self._move(first, status='arşiv').status_code, 400)
+
+    def test_long_keys_respace_neighbours(self):
+        other = User.objects.create_user(email='other@example.com', password='pass')
+        # Başka kullanıcının görevi de aynı sıralamada yer alır
+        Task.objects.create(title='Gizli', description='', created_by=other, assigned_to=other)
+        self.tasks += [
+            Task.objects.create(title=f'Kart {i}', description='', created_by=self.user, assigned_to=self.user)
+            for i in range(4, 8)
+        ]
+        order = list(Task.objects.order_by('position').values_list('pk', flat=True))
+        board = [task.pk for task in self.tasks]
+
+        with mock.patch.object(ranking, 'MAX_KEY_LENGTH', 24), \
+                mock.patch.object(TaskViewSet, 'position_respace_window', 2):
+            # Son kart her seferinde ilk iki kartın arasına taşınır
+            for _ in range(80):
+                moved, after, before = board[-1], board[0], board[1]
+                response = self.client.post(f'/api/tasks/{moved}/move/',
+                                            {'after': str(after), 'before': str(before)}, format='json')
+                self.assertEqual(response.status_code, 200)
+                board.insert(1, board.pop())
+                order.remove(moved)
+                order.insert(order.index(after) + 1, moved)
+
+        positions = dict(Task.objects.values_list('pk', 'position'))
+        self.assertLessEqual(max(len(position) for position in positions.values()), 24)
+        self.assertEqual(sorted(positions, key=positions.get), order)
+        titles = dict(Task.objects.values_list('pk', 'title'))
+        self.assertEqual(self._board(), [titles[pk] for pk in board])
+
+    def test_keys_stay_ordered(self):
+        keys = sorted(ranking.key_for_time() for _ in range(5))
+        for _ in range(100):
+            keys.insert(1, ranking.key_between(keys[0], keys[1]))
+        self.assertEqual(keys, sorted(keys))
+        self.assertLess(ranking.key_between(None, keys[0]), keys[0])
+        self.assertGreater(ranking.key_between(keys[-1], None), keys[-1])
+        spread = ranking.keys_between(keys[0], keys[-1], 50)
+        self.assertEqual(spread, sorted(spread))
+        self.assertTrue(keys[0] < spread[0] and spread[-1] < keys[-1])
+
+
+class ResponseCacheTests(TestCase):
+    """Kullanıcı başına yanıt önbelleği ve geçersiz kılma testleri."""
+
+    def setUp(self):
+        self.owner = User.objects.create_user(email='owner@example.com', password='pass')
+        self.assignee = User.objects.create_user(email='assignee@example.com', password='pass')
+        self.category = Category.objects.create(name='İş', created_by=self.owner)
+        self.task = Task.objects.create(
+            title='Rapor', description='', created_by=self.owner,
+            assigned_to=self.assignee, category=self.category
+        )
+        self.owner_client = APIClient()
+        self.owner_client.force_authenticate(self.owner)
+        self.client = APIClient()
+        self.client.force_authenticate(self.assignee)
+        response_cache.get_stats().reset()
+
+    def _titles(self, client=None, **params):
+        response = (client or self.client).get('/api/tasks/', params)
+        self.assertEqual(response.status_code, 200)
+        return [task['title'] for task in response.data['results']]
+
+    def test_repeated_request_is_served_from_cache(self):
+        first = self.client.get('/api/tasks/', {'view': 'compact', 'ordering': 'created_at'})
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/tasks/', {'ordering': 'created_at', 'view': 'compact'})
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(response_cache.get_stats().stats()['hit_ratio'], 0.5)
+
+    def test_query_parameters_and_users_have_separate_entries(self):
+        self._titles()
+        self.assertEqual(self._titles(status='done'), [])
+        self.assertEqual(self._titles(self.owner_client), ['Rapor'])
+        self.assertEqual(response_cache.get_stats().stats()['hits'], 0)
+
+    def test_writes_by_another_user_invalidate(self):
+        self.assertEqual(self._titles(), ['Rapor'])
+        self.owner_client.patch(f'/api/tasks/{self.task.pk}/', {'title': 'Sunum'}, format='json')
+        self.assertEqual(self._titles(), ['Sunum'])
+
+        detail = f'/api/tasks/{self.task.pk}/'
+        self.assertEqual(self.client.get(detail).data['comments'], [])
+        TaskComment.objects.create(task=self.task, user=self.owner, content='Bitti mi?')
+        self.assertEqual(len(self.client.get(detail).data['comments']), 1)
+
+        self.category.name = 'Ev'
+        self.category.save()
+        self.assertEqual(self.client.get(detail).data['category_detail']['name'], 'Ev')
+
+    def test_signal_free_updates_invalidate(self):
+        self.assertEqual(self._titles(status='done'), [])
+        self.owner_client.post(f'/api/tasks/{self.task.pk}/mark_complete/')
+        self.assertEqual(self._titles(status='done'), ['Rapor'])
+
+        self.owner_client.post('/api/tasks/bulk/', {'operations': [
+            {'op': 'update', 'id': str(self.task.pk), 'data': {'title': 'Toplu'}},
+        ]}, format='json')
+        self.assertEqual(self._titles(status='done'), ['Toplu'])
+
+    def test_reassignment_invalidates_previous_assignee(self):
+        self.assertEqual(self._titles(), ['Rapor'])
+        self.owner_client.patch(
+            f'/api/tasks/{self.task.pk}/', {'assigned_to': str(self.owner.pk)}, format='json'
+        )
+        self.assertEqual(self._titles(), [])
+
+    def test_category_counts_follow_task_changes(self):
+        response = self.owner_client.get('/api/categories/')
+        self.assertEqual(response.data['results'][0]['task_count'], 1)
+        self.task.delete()
+        response = self.owner_client.get('/api/categories/')
+        self.assertEqual(response.data['results'][0]['task_count'], 0)
+
+    def test_file_based_backend(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        caches = {
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+            'responses': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': location,
+            },
+        }
+        with override_settings(CACHES=caches):
+            self.assertEqual(self._titles(), ['Rapor'])
+            with self.assertNumQueries(0):
+                self.assertEqual(self._titles(), ['Rapor'])
+            self.task.title = 'Sunum'
+            self.task.save()
+            self.assertEqual(self._titles(), ['Sunum'])
+
+    def test_stats_endpoint_is_admin_only(self):
+        self.assertEqual(self.client.get('/api/response-cache/stats/').status_code, 403)
+        admin = User.objects.create_superuser(email='admin@example.com', password='pass')
+        self.client.force_authenticate(admin)
+        self.assertIn('hit_ratio', self.client.get('/api/response-cache/stats/').data)
+
+
+class ConditionalGetTests(TestCase):
+    """ETag / Last-Modified ile koşullu GET testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.task = Task.objects.create(title='Rapor', description='', created_by=self.user, assigned_to=self.user)
+        self.url = f'/api/tasks/{self.task.pk}/'
+
+    def _not_modified(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+    def test_unchanged_resource_returns_304_without_serializing(self):
+        for url in (self.url, '/api/tasks/', '/api/tasks/my_tasks/'):
+            response = self.client.get(url)
+            self.assertTrue(response['ETag'].startswith('"'))
+            self.assertIn('Last-Modified', response)
+            with mock.patch('tasks.serializers.TaskSerializer.to_representation') as serialize:
+                response = self._not_modified(url, response)
+            self.assertEqual(response.status_code, 304)
+            self.assertIn('ETag', response)
+            serialize.assert_not_called()
+
+    def test_304_without_response_cache(self):
+        response = self.client.get(self.url)
+        with override_settings(RESPONSE_CACHE={'ENABLED': False}):
+            # Doğrulayıcılar tek sorguda hesaplanır
+            with self.assertNumQueries(1):
+                self.assertEqual(self._not_modified(self.url, response).status_code, 304)
+
+    def test_if_modified_since(self):
+        response = self.client.get(self.url)
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_category_task_count_changes_the_etag(self):
+        other = User.objects.create_user(email='other@example.com', password='pass')
+        category = Category.objects.create(name='Ortak', created_by=other)
+        self.task.category = category
+        self.task.save()
+        responses = {url: self.client.get(url) for url in (self.url, '/api/tasks/')}
+
+        # Başka kullanıcının aynı kategorideki yeni görevi sayıyı değiştirir
+        Task.objects.create(title='Diğer', description='', category=category, created_by=other, assigned_to=other)
+        for url, response in responses.items():
+            changed = self._not_modified(url, response)
+            self.assertEqual(changed.status_code, 200)
+            data = changed.data['results'][0] if 'results' in changed.data else changed.data
+            self.assertEqual(data['category_detail']['task_count'], 2)
+
+    def test_child_changes_change_the_etag(self):
+        response = self.client.get(self.url)
+        comment = TaskComment.objects.create(task=self.task, user=self.user, content='Yorum')
+        changed = self._not_modified(self.url, response)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], response['ETag'])
+
+        # Silme en büyük zamanı değiştirmese de ETag değişir
+        comment.delete()
+        self.assertEqual(self._not_modified(self.url, changed).status_code, 200)
+
+        tag = Tag.objects.create(name='Acil', created_by=self.user)
+        self.task.tags.add(tag)
+        response = self.client.get(self.url)
+        tag.name = 'Önemli'
+        tag.save()
+        self.assertEqual(self._not_modified(self.url, response).status_code, 200)
+
+    def test_representations_have_distinct_etags(self):
+        full = self.client.get(self.url)
+        compact = self.client.get(self.url, {'view': 'compact'})
+        self.assertNotEqual(full['ETag'], compact['ETag'])
+        other = User.objects.create_user(email='other@example.com', password='pass')
+        self.task.assigned_to = other
+        self.task.save()
+        self.client.force_authenticate(other)
+        self.assertNotEqual(self.client.get(self.url)['ETag'], full['ETag'])
+
+    def test_list_validators_cover_only_the_page(self):
+        newer = [
+            Task.objects.create(title=f'Görev {i}', description='', created_by=self.user, assigned_to=self.user)
+            for i in range(3)
+        ]
+        url = '/api/tasks/?page_size=2&count=false'
+        response = self.client.get(url)
+        self.assertEqual(len(response.data['results']), 2)
+
+        # Sayfa dışındaki görev doğrulayıcıları etkilemez; sorgu sayfayla sınırlıdır
+        Subtask.objects.create(parent_task=self.task, title='Alt görev', created_by=self.user)
+        self.task.title = 'Yeni başlık'
+        self.task.save()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self._not_modified(url, response).status_code, 304)
+        self.assertIn('LIMIT 3', queries.captured_queries[0]['sql'])
+
+        # Toplam sayı yanıtta yer alıyorsa sayfa dışındaki silme de ETag'i değiştirir
+        counted = self.client.get('/api/tasks/?page_size=2')
+        newer[0].delete()
+        self.assertEqual(self._not_modified('/api/tasks/?page_size=2', counted).status_code, 200)
+
+        # Sayfadan çıkan görev (yerine başkası girse de) ETag'i değiştirir
+        newer[2].delete()
+        self.assertEqual(self._not_modified(url, response).status_code, 200)
+
+    def test_missing_task_is_404(self):
+        self.assertEqual(self.client.get('/api/tasks/bozuk/').status_code, 404)
+        self.assertEqual(self.client.get('/api/tasks/00000000-0000-0000-0000-000000000000/').status_code, 404)
+
+
+class SyncTests(TestCase):
+    """Değişiklik günlüğü ve /tasks/sync/ testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.cursor = self._sync(0).data['cursor']
+
+    def _sync(self, since, **params):
+        return self.client.get('/api/tasks/sync/', {'since': since, **params})
+
+    def _task(self, **kwargs):
+        kwargs.setdefault('created_by', self.user)
+        kwargs.setdefault('assigned_to', self.user)
+        return Task.objects.create(title='Görev', description='Açıklama', **kwargs)
+
+    def test_created_updated_and_deleted(self):
+        kept = self._task()
+        removed = self._task()
+        data = self._sync(self.cursor).data
+        self.assertEqual({t['id'] for t in data['tasks']['created']}, {str(kept.pk), str(removed.pk)})
+        self.assertNotIn('subtasks', data['tasks']['created'][0])
+        cursor = data['cursor']
+
+        kept.title = 'Yeni'
+        kept.save()
+        Subtask.objects.create(parent_task=kept, title='Alt', created_by=self.user)
+        comment = TaskComment.objects.create(task=kept, user=self.other, content='Yorum')
+        removed_id = str(removed.pk)
+        removed.delete()
+
+        data = self._sync(cursor).data
+        self.assertEqual([t['title'] for t in data['tasks']['updated']], ['Yeni'])
+        self.assertEqual(data['tasks']['deleted'], [removed_id])
+        self.assertEqual(len(data['subtasks']['created']), 1)
+        self.assertEqual(data['comments']['created'][0]['id'], str(comment.pk))
+
+        # Yeni değişiklik yoksa boş döner ve cursor ilerlemez
+        again = self._sync(data['cursor']).data
+        self.assertEqual(again['cursor'], data['cursor'])
+        self.assertEqual(again['tasks'], {'created': [], 'updated': [], 'deleted': []})
+
+    def test_only_own_changes_in_o_changes(self):
+        for _ in range(3):
+            self._task(created_by=self.other, assigned_to=self.other)
+        mine = self._task()
+        with self.assertNumQueries(3):
+            # Günlük, eski kayıt kontrolü ve değişen görevler; alt görev ve
+            # yorum değişikliği olmadığından onlar için sorgu yapılmaz
+            data = self._sync(self.cursor, view='compact').data
+        self.assertEqual([t['id'] for t in data['tasks']['created']], [str(mine.pk)])
+
+    def test_reassignment_leaves_a_tombstone(self):
+        task = self._task()
+        cursor = self._sync(self.cursor).data['cursor']
+        self.client.patch(f'/api/tasks/{task.pk}/', {'assigned_to': str(self.other.pk)}, format='json')
+        self.client.force_authenticate(self.other)
+        self.assertEqual(len(self._sync(cursor).data['tasks']['updated']), 1)
+
+        task = Task.objects.get(pk=task.pk)
+        task.created_by = self.other
+        task.save()
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self._sync(cursor).data['tasks']['deleted'], [str(task.pk)])
+
+    def test_signal_free_updates_are_logged(self):
+        task = self._task()
+        cursor = self._sync(self.cursor).data['cursor']
+        self.client.post(f'/api/tasks/{task.pk}/mark_complete/')
+        self.client.post('/api/tasks/bulk/', {'operations': [
+            {'op': 'create', 'data': {'title': 'Toplu', 'description': 'Açıklama', 'assigned_to': str(self.user.pk)}},
+        ]}, format='json')
+        data = self._sync(cursor).data
+        self.assertEqual(data['tasks']['updated'][0]['status'], 'done')
+        self.assertEqual([t['title'] for t in data['tasks']['created']], ['Toplu'])
+
+    def test_paging_and_expired_cursor(self):
+        for _ in range(3):
+            self._task()
+        with override_settings(SYNC={'PAGE_SIZE': 2}):
+            first = self._sync(self.cursor).data
+            self.assertTrue(first['has_more'])
+            second = self._sync(first['cursor']).data
+        self.assertFalse(second['has_more'])
+        self.assertEqual(len(first['tasks']['created']) + len(second['tasks']['created']), 3)
+
+        ChangeLogEntry.objects.filter(id__lte=first['cursor']).delete()
+        response = self._sync(self.cursor)
+        self.assertEqual(response.status_code, 410)
+        self.assertEqual(response.data['cursor'], second['cursor'])
+        self.assertEqual(self._sync('x').status_code, 400)
+
+
+class RecordingBroker(InProcessBroker):
+    """Yayınlanan olayları da kaydeden yerel yayıncı."""
+
+    def __init__(self, queue_size=100):
+        super().__init__(queue_size)
+        self.events = []
+
+    def publish(self, user_ids, event):
+        self.events.append((set(user_ids), event))
+        super().publish(user_ids, event)
+
+
+@override_settings(REALTIME={'BROKER': 'tasks.tests.RecordingBroker', 'QUEUE_SIZE': 2})
+class RealtimeTests(TestCase):
+    """Anlık görev olaylarının yayını ve WebSocket/SSE akışlarının testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass', firebase_uid='uid-1')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        self.task = Task.objects.create(
+            title='Görev', description='Açıklama', created_by=self.user, assigned_to=self.other
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.broker = realtime.get_broker()
+
+    def _published(self, action):
+        with self.captureOnCommitCallbacks(execute=True):
+            action()
+        events, self.broker.events = self.broker.events, []
+        return events
+
+    def _mark_complete(self):
+        self.client.post(f'/api/tasks/{self.task.pk}/mark_complete/')
+
+    def test_status_changes_are_published_to_owners(self):
+        owners = {self.user.pk, self.other.pk}
+        self.assertEqual(self._published(self._mark_complete), [
+            (owners, {'type': 'task.status', 'task': str(self.task.pk), 'status': 'done'})
+        ])
+        # Durum değişmediyse yayın yapılmaz
+        self.assertEqual(self._published(self._mark_complete), [])
+        self.assertEqual(self._published(lambda: self.client.post(
+            f'/api/tasks/{self.task.pk}/move/', {'status': 'done'}, format='json'
+        )), [])
+
+        task = Task.objects.get(pk=self.task.pk)
+        task.title = 'Yeni'
+        self.assertEqual(self._published(task.save), [])
+        task.status = 'review'
+        events = self._published(task.save)
+        self.assertEqual([event['status'] for _, event in events], ['review'])
+
+    def test_comments_and_subtask_completions_are_published(self):
+        third = User.objects.create_user(email='third@example.com', password='pass')
+        events = self._published(
+            lambda: TaskComment.objects.create(task=self.task, user=third, content='Yorum')
+        )
+        self.assertEqual(events[0][0], {self.user.pk, self.other.pk, third.pk})
+        self.assertEqual(events[0][1]['type'], 'comment.created')
+        self.assertEqual(events[0][1]['content'], 'Yorum')
+
+        subtask = Subtask.objects.create(parent_task=self.task, title='Alt', created_by=third)
+        self.assertEqual(self._published(subtask.save), [])
+        subtask.is_completed = True
+        events = self._published(subtask.save)
+        self.assertEqual(events, [(
+            {self.user.pk, self.other.pk, third.pk},
+            {'type': 'subtask.completed', 'task': str(self.task.pk), 'subtask': str(subtask.pk)},
+        )])
+
+    async def test_broker_fans_out_to_user_connections(self):
+        broker = realtime.InProcessBroker(queue_size=2)
+        first, second, stranger = broker.subscribe(1), broker.subscribe(1), broker.subscribe(2)
+        await sync_to_async(broker.publish, thread_sensitive=False)([1], {'type': 'ping'})
+        self.assertEqual(await first.get(1), {'type': 'ping'})
+        self.assertEqual(await second.get(1), {'type': 'ping'})
+        self.assertIsNone(await stranger.get(0.01))
+
+        # Kuyruğu dolan bağlantı resync'e zorlanır
+        for _ in range(3):
+            broker.publish([2], {'type': 'ping'})
+        await asyncio.sleep(0)
+        with self.assertRaises(realtime.SubscriptionOverflow):
+            await stranger.get(1)
+        second.close()
+        self.assertEqual(broker.stats()['connections'], 2)
+        self.assertEqual(broker.stats()['overflows'], 1)
+
+    async def test_websocket_streams_events(self):
+        from backend.asgi import application
+
+        rejected = ApplicationCommunicator(application, {'type': 'websocket', 'path': '/ws/tasks/'})
+        await rejected.send_input({'type': 'websocket.connect'})
+        self.assertEqual((await rejected.receive_output(1))['code'], realtime.CLOSE_UNAUTHORIZED)
+
+        communicator = ApplicationCommunicator(application, {
+            'type': 'websocket', 'path': '/ws/tasks/', 'query_string': b'token=token-1', 'headers': [],
+        })
+        token_cache.clear()
+        user_cache.clear()
+        self.addCleanup(token_cache.clear)
+        self.addCleanup(user_cache.clear)
+        decoded = {'uid': 'uid-1', 'exp': time.time() + 3600}
+        with mock.patch('backend.token_verifiers.auth.verify_id_token', return_value=decoded):
+            await communicator.send_input({'type': 'websocket.connect'})
+            self.assertEqual((await communicator.receive_output(1))['type'], 'websocket.accept')
+
+        await sync_to_async(self._published)(self._mark_complete)
+        message = await communicator.receive_output(1)
+        self.assertEqual(json.loads(message['text']), {
+            'type': 'task.status', 'task': str(self.task.pk), 'status': 'done'
+        })
+        await communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        await communicator.wait(1)
+        self.assertEqual(self.broker.stats()['connections'], 0)
+
+    async def test_sse_streams_events(self):
+        self.assertEqual((await self.async_client.get('/api/tasks/events/')).status_code, 401)
+
+        await self.async_client.aforce_login(self.other)
+        response = await self.async_client.get('/api/tasks/events/')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b': connected\n\n')
+
+        await sync_to_async(self._published)(self._mark_complete)
+        chunk = (await anext(stream)).decode()
+        self.assertTrue(chunk.startswith('event: task.status\n'))
+
+        # İstemci ayrıldığında ASGI işleyicisi akışı iptal eder
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+        self.assertEqual(self.broker.stats()['connections'], 0)
+
+
+# ASGI girişindeki gibi async okuma uçlarını içeren URL yapılandırması
+urlpatterns = [
+    path('api/', include([*tasks_urls.async_urlpatterns, *tasks_urls.urlpatterns])),
+]
+
+
+@override_settings(ROOT_URLCONF='tasks.tests', RESPONSE_CACHE={'ENABLED': False})
+class AsyncReadTests(TestCase):
+    """Görev ve kategori okuma uçlarının async görünümlerinin testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        category = Category.objects.create(name='İş', created_by=self.user)
+        tag = Tag.objects.create(name='acil', created_by=self.user)
+        self.task = Task.objects.create(
+            title='Rapor', description='Açıklama', category=category,
+            created_by=self.user, assigned_to=self.other, priority=3
+        )
+        self.task.tags.add(tag)
+        Subtask.objects.create(parent_task=self.task, title='Alt', created_by=self.user)
+        TaskComment.objects.create(task=self.task, user=self.other, content='Yorum')
+        for index in range(3):
+            Task.objects.create(
+                title=f'Görev {index}', description='Açıklama', created_by=self.user,
+                assigned_to=self.user, status='done' if index else 'todo'
+            )
+        self.client.force_login(self.user)
+
+    async def _get(self, url, **headers):
+        await self.async_client.aforce_login(self.user)
+        return await self.async_client.get(url, headers=headers)
+
+    async def test_responses_match_sync_views(self):
+        urls = [
+            '/api/tasks/',
+            '/api/tasks/?view=compact&status=done',
+            '/api/tasks/?fields=id,title,tags_detail&ordering=-priority&page_size=2',
+            '/api/tasks/?search=rapor',
+            '/api/tasks/my_tasks/?count=false',
+            f'/api/tasks/{self.task.pk}/',
+            f'/api/tasks/{self.task.pk}/?expand=comments&view=compact',
+            '/api/categories/',
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                # Senkron görünüme devredilmeden yanıtlanır
+                with mock.patch('tasks.async_views.sync_to_async', side_effect=AssertionError):
+                    response = await self._get(url)
+                with override_settings(ROOT_URLCONF='backend.urls'):
+                    expected = await sync_to_async(self.client.get)(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), expected.json())
+                self.assertEqual(response['ETag'] if 'ETag' in expected else None, expected.get('ETag'))
+
+        # Cursor bağlantıları da async sayfalamayla izlenir
+        page = (await self._get('/api/tasks/?page_size=2')).json()
+        rest = (await self._get(page['next'])).json()
+        self.assertEqual(len(page['results']) + len(rest['results']), 4)
+        self.assertIsNone(rest['next'])
+
+    async def test_unsupported_requests_fall_back_to_sync_views(self):
+        self.assertEqual((await self.async_client.get('/api/tasks/')).status_code, 403)
+        response = await self._get(f'/api/tasks/?category={self.task.category_id}')
+        self.assertEqual([task['id'] for task in response.json()['results']], [str(self.task.pk)])
+        self.assertEqual((await self._get('/api/tasks/?fields=nope')).status_code, 400)
+        self.assertEqual((await self._get('/api/tasks/00000000-0000-0000-0000-000000000000/')).status_code, 404)
+        response = await self._get('/api/tasks/', accept='text/html')
+        self.assertTrue(response['Content-Type'].startswith('text/html'))
+
+        response = await self.async_client.post(
+            '/api/tasks/',
+            {'title': 'Yeni', 'description': 'Açıklama', 'assigned_to': str(self.user.pk)},
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 201)
+
+    async def test_permissions_and_throttles_are_enforced(self):
+        class DenyAll(permissions.BasePermission):
+            def has_permission(self, request, view):
+                return False
+
+        class QueriesDatabase(permissions.BasePermission):
+            def has_permission(self, request, view):
+                return User.objects.filter(pk=request.user.pk, is_active=True).exists()
+
+        class NoRequests(throttling.BaseThrottle):
+            def allow_request(self, request, view):
+                return False
+
+        url = f'/api/tasks/{self.task.pk}/'
+        with mock.patch.object(TaskViewSet, 'permission_classes', [DenyAll]):
+            self.assertEqual((await self._get(url)).status_code, 403)
+            self.assertEqual((await self._get('/api/tasks/')).status_code, 403)
+        with mock.patch.object(TaskViewSet, 'throttle_classes', [NoRequests]):
+            self.assertEqual((await self._get('/api/tasks/')).status_code, 429)
+        # Async bağlamda sorgu yapamayan izinler senkron görünümde denetlenir
+        with mock.patch.object(TaskViewSet, 'permission_classes', [QueriesDatabase]):
+            self.assertEqual((await self._get(url)).status_code, 200)
+
+    async def test_errors_are_rendered_without_counting_twice(self):
+        calls = []
+
+        class CountingThrottle(throttling.BaseThrottle):
+            def allow_request(self, request, view):
+                calls.append(request.path)
+                return True
+
+        class QueriesDatabase(permissions.BasePermission):
+            def has_object_permission(self, request, view, obj):
+                return User.objects.filter(pk=request.user.pk, is_active=True).exists()
+
+        urls = ['/api/tasks/00000000-0000-0000-0000-000000000000/', '/api/tasks/bozuk/', '/api/categories/?page=99']
+        for url in urls:
+            with self.subTest(url=url):
+                with mock.patch.object(TaskViewSet, 'throttle_classes', [CountingThrottle]), \
+                        mock.patch.object(CategoryViewSet, 'throttle_classes', [CountingThrottle]):
+                    # 404 yanıtları senkron görünüme devredilmeden üretilir
+                    with mock.patch('tasks.async_views.sync_to_async', side_effect=AssertionError):
+                        response = await self._get(url)
+                    self.assertEqual(len(calls), 1)
+                    with override_settings(ROOT_URLCONF='backend.urls'):
+                        expected = await sync_to_async(self.client.get)(url)
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json(), expected.json())
+                calls.clear()
+
+        # Sınırlamadan sonra senkron görünüme devredilen istek bir kez sayılır
+        with mock.patch.object(TaskViewSet, 'throttle_classes', [CountingThrottle]), \
+                mock.patch.object(TaskViewSet, 'permission_classes', [QueriesDatabase]):
+            self.assertEqual((await self._get(f'/api/tasks/{self.task.pk}/')).status_code, 200)
+        self.assertEqual(len(calls), 1)
+
+    async def test_conditional_get_and_shared_response_cache(self):
+        url = f'/api/tasks/{self.task.pk}/'
+        response = await self._get(url)
+        not_modified = await self._get(url, if_none_match=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+
+        with override_settings(RESPONSE_CACHE={'ENABLED': True}):
+            await sync_to_async(self.client.get)('/api/tasks/')
+            with mock.patch('tasks.serializers.TaskSerializer.to_representation') as serialize:
+                cached = await self._get('/api/tasks/')
+            serialize.assert_not_called()
+        self.assertEqual(cached.json()['count'], 4)
+
+
+class RecordingSender:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, reminders):
+        self.sent.extend((reminder.task_id, reminder.kind, reminder.user_id) for reminder in reminders)
+
+
+class ReminderSchedulerTests(TestCase):
+    """Hatırlatma zamanlayıcısının testleri."""
+
+    def setUp(self):
+        self.now = timezone.now().replace(microsecond=0)
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        self.task = self._task(reminder_date=self.now + timedelta(minutes=1))
+
+    def _task(self, **fields):
+        fields.setdefault('assigned_to', self.user)
+        return Task.objects.create(title='Görev', description='Açıklama', created_by=self.user, **fields)
+
+    def _scheduler(self):
+        sender = RecordingSender()
+        scheduler = ReminderScheduler(sender=sender, clock=lambda: self.now)
+        scheduler.start()
+        return scheduler, sender
+
+    def _at(self, scheduler, minutes):
+        return scheduler.tick(self.now + timedelta(minutes=minutes))
+
+    def test_due_reminders_are_sent_once(self):
+        due = self._task(due_date=self.now + timedelta(minutes=2))
+        self._task(reminder_date=self.now + timedelta(minutes=1), status='done')
+        muted = User.objects.create_user(email='muted@example.com', notification_enabled=False)
+        self._task(reminder_date=self.now + timedelta(minutes=1), assigned_to=muted)
+        self._task(reminder_date=self.now + timedelta(days=1))
+
+        scheduler, sender = self._scheduler()
+        self.assertEqual(len(scheduler), 3)
+        self.assertEqual(self._at(scheduler, 0), 0)
+        self.assertEqual(self._at(scheduler, 1), 1)
+        self.assertEqual(self._at(scheduler, 2), 1)
+        self.assertEqual(sender.sent, [
+            (self.task.pk, 'reminder', self.user.pk), (due.pk, 'due', self.user.pk)
+        ])
+
+        # Yeniden başlatmada gönderilmiş olanlar tekrarlanmaz
+        restarted, sender = self._scheduler()
+        self.assertEqual(self._at(restarted, 5), 0)
+        self.assertEqual(sender.sent, [])
+        self.assertEqual(ReminderDelivery.objects.count(), 2)
+
+    def test_edits_are_picked_up_from_the_change_log(self):
+        scheduler, sender = self._scheduler()
+        self.task.reminder_date = self.now + timedelta(minutes=3)
+        self.task.save()
+        added = self._task(reminder_date=self.now + timedelta(minutes=2))
+        cancelled = self._task(reminder_date=self.now + timedelta(minutes=2))
+        Task.objects.filter(pk=cancelled.pk).update(status='cancelled')
+        task_updated(cancelled.pk, updates={'status': 'cancelled'})
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self._at(scheduler, 1), 0)
+        # Yalnızca değişen görevler okunur; tablo taranmaz
+        self.assertTrue(all('reminder_date" >' not in query['sql'] for query in queries.captured_queries))
+
+        self.assertEqual(self._at(scheduler, 2), 1)
+        self.assertEqual(self._at(scheduler, 3), 1)
+        self.assertEqual(sender.sent, [
+            (added.pk, 'reminder', self.user.pk), (self.task.pk, 'reminder', self.user.pk)
+        ])
+
+    def test_window_is_loaded_incrementally(self):
+        later = self._task(reminder_date=self.now + timedelta(minutes=30))
+        scheduler, sender = self._scheduler()
+        self.assertEqual(len(scheduler), 1)
+        self.assertEqual(self._at(scheduler, 1), 1)
+        self.assertEqual(self._at(scheduler, 30), 1)
+        self.assertEqual(sender.sent[-1], (later.pk, 'reminder', self.user.pk))
+
+
+class FakeNotificationSender:
+    def __init__(self):
+        self.sent = []
+        self.fail = set()
+
+    def send(self, notifications):
+        self.sent.extend(notifications)
+        return [
+            (notification, 'ulaşılamadı') for notification in notifications
+            if notification.user_id in self.fail
+        ]
+
+
+class NotificationDispatcherTests(TestCase):
+    """Durum bildirimi kuyruğunun ve toplu dağıtıcının testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        self.task = Task.objects.create(
+            title='Rapor', description='Açıklama', created_by=self.user, assigned_to=self.other
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.sender = FakeNotificationSender()
+        self.dispatcher = NotificationDispatcher(sender=self.sender)
+
+    def _after(self, seconds):
+        return timezone.now() + timedelta(seconds=seconds)
+
+    def test_status_changes_are_queued_and_coalesced(self):
+        self.client.post(f'/api/tasks/{self.task.pk}/mark_in_progress/')
+        self.client.patch(f'/api/tasks/{self.task.pk}/', {'status': 'review'}, format='json')
+        self.client.post(f'/api/tasks/{self.task.pk}/mark_complete/')
+        self.client.patch(f'/api/tasks/{self.task.pk}/', {'title': 'Yeni'}, format='json')
+        self.assertEqual(NotificationOutbox.objects.count(), 6)
+        self.assertEqual(self.sender.sent, [])
+
+        # Birleştirme penceresi dolmadan gönderilmez
+        self.assertEqual(self.dispatcher.dispatch(), 0)
+        # Hazır satırlar, birleştirilecek satırlar, silme ve boş son tur
+        with self.assertNumQueries(4):
+            self.assertEqual(self.dispatcher.dispatch(self._after(60)), 2)
+        self.assertEqual(
+            {(n.user_id, n.status, n.changes) for n in self.sender.sent},
+            {(self.user.pk, 'done', 3), (self.other.pk, 'done', 3)}
+        )
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+    def test_disabled_notifications_are_dropped(self):
+        User.objects.filter(pk=self.other.pk).update(notification_enabled=False)
+        self.client.post(f'/api/tasks/{self.task.pk}/mark_complete/')
+        self.assertEqual(self.dispatcher.dispatch(self._after(60)), 1)
+        self.assertEqual([n.user_id for n in self.sender.sent], [self.user.pk])
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+    def test_failed_notifications_are_retried_with_backoff(self):
+        self.sender.fail = {self.other.pk}
+        self.client.post(f'/api/tasks/{self.task.pk}/mark_complete/')
+        self.assertEqual(self.dispatcher.dispatch(self._after(60)), 1)
+        entry = NotificationOutbox.objects.get()
+        self.assertEqual((entry.user_id, entry.attempts, entry.last_error), (self.other.pk, 1, 'ulaşılamadı'))
+
+        # Bekleme süresi her denemede iki katına çıkar
+        self.assertEqual(self.dispatcher.dispatch(self._after(60 + 20)), 0)
+        self.assertEqual(len(self.sender.sent), 2)
+        self.assertEqual(self.dispatcher.dispatch(self._after(60 + 31)), 0)
+        self.assertEqual(NotificationOutbox.objects.get().attempts, 2)
+
+        self.sender.fail = set()
+        self.assertEqual(self.dispatcher.dispatch(self._after(60 + 31 + 50)), 0)
+        self.assertEqual(self.dispatcher.dispatch(self._after(60 + 31 + 61)), 1)
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+
+class TaskStatsTests(TestCase):
+    """Pano istatistiklerinin artımlı güncellenmesinin testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        self.category = Category.objects.create(name='İş', created_by=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _counters(self):
+        return {
+            (user_id, key): value
+            for user_id, key, value in TaskStatsCounter.objects.values_list('user_id', 'key', 'value')
+            if value
+        }
+
+    def _create(self, **data):
+        data = {'title': 'Görev', 'description': 'Açıklama', 'assigned_to': str(self.user.pk), **data}
+        response = self.client.post('/api/tasks/', data, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response.data['id']
+
+    def test_counters_follow_every_write_path(self):
+        now = timezone.now()
+        first = self._create(category=str(self.category.pk), due_date=now - timedelta(days=2))
+        second = self._create(priority=4, estimated_time='01:30:00')
+        third = self._create(due_date=now + timedelta(days=3))
+
+        self.client.patch(f'/api/tasks/{second}/', {'assigned_to': str(self.other.pk), 'actual_time': '00:45:00'}, format='json')
+        self.client.post(f'/api/tasks/{first}/mark_in_progress/')
+        self.client.post(f'/api/tasks/{first}/mark_complete/')
+        self.client.post(f'/api/tasks/{third}/move/', {'status': 'review'}, format='json')
+        self.client.post('/api/tasks/bulk/', {'operations': [
+            {'op': 'status', 'id': second, 'status': 'cancelled'},
+            {'op': 'update', 'id': third, 'data': {'priority': 1}},
+            {'op': 'create', 'data': {'title': 'Yeni', 'description': 'Açıklama', 'assigned_to': str(self.user.pk)}},
+        ]}, format='json')
+        self.client.delete(f'/api/tasks/{third}/')
+        self._create(category=str(self.category.pk))
+        self.category.delete()
+
+        incremental = self._counters()
+        self.assertEqual(incremental[(self.user.pk, 'status:done')], 1)
+        self.assertEqual(incremental[(self.other.pk, 'status:cancelled')], 1)
+        self.assertEqual(incremental[(self.user.pk, 'actual_time')], 45 * 60)
+        stats.rebuild()
+        self.assertEqual(incremental, self._counters())
+
+        # Kullanıcı silindiğinde görevleriyle birlikte sayaçları da silinir
+        self.other.delete()
+        self.assertFalse(TaskStatsCounter.objects.filter(user_id=self.other.pk).exists())
+
+    def test_dashboard_is_read_from_counters(self):
+        now = timezone.now()
+        self._create(due_date=now - timedelta(days=2), priority=3, estimated_time='02:00:00')
+        self._create(due_date=now + timedelta(days=2), category=str(self.category.pk))
+        done = self._create(due_date=now - timedelta(days=1))
+        self.client.post(f'/api/tasks/{done}/mark_complete/')
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/tasks/stats/')
+        data = response.data
+        self.assertEqual(data['total'], 3)
+        self.assertEqual(data['by_status']['todo'], 2)
+        self.assertEqual(data['by_status']['done'], 1)
+        self.assertEqual(data['by_priority'][3], 1)
+        self.assertEqual(data['by_category'], {str(self.category.pk): 1})
+        self.assertEqual(data['overdue'], 1)
+        self.assertEqual(data['completed_this_week'], 1)
+        self.assertEqual(data['estimated_time'], '02:00:00')
+
+        # Diğer kullanıcı yalnızca gördüğü görevleri sayar
+        other_client = APIClient()
+        other_client.force_authenticate(self.other)
+        self.assertEqual(other_client.get('/api/tasks/stats/').data['total'], 0)
+
+    def test_zero_counters_are_pruned(self):
+        kept = self._create(category=str(self.category.pk))
+        removed = self._create(priority=4, due_date=timezone.now() + timedelta(days=1))
+        self.client.delete(f'/api/tasks/{removed}/')
+        self.assertTrue(TaskStatsCounter.objects.filter(value=0).exists())
+        before = self._counters()
+
+        call_command('prune_task_stats', stdout=io.StringIO())
+
+        self.assertFalse(TaskStatsCounter.objects.filter(value=0).exists())
+        self.assertEqual(self._counters(), before)
+        # Silinen sayaç sonraki artışta yeniden oluşur
+        self.client.post(f'/api/tasks/{kept}/move/', {'status': 'review'}, format='json')
+        self.assertEqual(self._counters()[(self.user.pk, 'status:review')], 1)
+
+
+class AnalyticsTests(TestCase):
+    """Günlük verimlilik özetleri ve aralık analizinin testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.other = User.objects.create_user(email='other@example.com', password='pass')
+        self.today = timezone.localdate()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _done(self, days_ago, lead_hours, estimated=None, actual=None, user=None, status='done'):
+        user = user or self.user
+        completed_at = timezone.make_aware(
+            timezone.datetime.combine(self.today - timedelta(days=days_ago), timezone.datetime.min.time())
+        ) + timedelta(hours=1)
+        task = Task.objects.create(
+            title='Görev', description='Açıklama', created_by=user, assigned_to=user, status=status,
+            completed_at=completed_at, estimated_time=estimated, actual_time=actual,
+        )
+        Task.objects.filter(pk=task.pk).update(created_at=completed_at - timedelta(hours=lead_hours))
+        return lead_hours * 3600
+
+    def test_rollup_and_range_summary(self):
+        leads = [self._done(days_ago, hours) for days_ago, hours in [(3, 1), (3, 4), (2, 10), (2, 30), (1, 100)]]
+        self._done(2, 2, estimated=timedelta(hours=2), actual=timedelta(hours=3))
+        self._done(1, 2, estimated=timedelta(hours=1), actual=timedelta(hours=1))
+        self._done(0, 5)
+        self._done(2, 1, status='review')
+        self._done(2, 1, user=self.other)
+        leads += [2 * 3600, 2 * 3600, 5 * 3600]
+
+        self.assertEqual(analytics.rollup(self.today - timedelta(days=3), self.today - timedelta(days=1)), (8, 4))
+        # Yeniden özetleme aynı satırları üretir
+        self.assertEqual(analytics.rollup(self.today - timedelta(days=3), self.today - timedelta(days=1)), (8, 4))
+        row = DailyProductivity.objects.get(user=self.user, day=self.today - timedelta(days=2))
+        self.assertEqual((row.completed, row.lead_time_total, row.estimated_count), (3, 42 * 3600, 1))
+
+        with self.assertNumQueries(2):
+            result = analytics.productivity(self.user, self.today - timedelta(days=6), self.today)
+        self.assertEqual(result['completed'], 8)
+        self.assertEqual([day['completed'] for day in result['days']], [0, 0, 0, 2, 3, 2, 1])
+        self.assertEqual(result['lead_time']['mean'], round(sum(leads) / 8, 1))
+        for key, q in (('p50', 50), ('p90', 90)):
+            expected = np.percentile(leads, q, method='inverted_cdf')
+            self.assertLess(abs(result['lead_time'][key] / expected - 1), 0.25)
+        accuracy = result['estimate_accuracy']
+        self.assertEqual((accuracy['tasks'], accuracy['estimated_time'], accuracy['actual_time']), (2, 3 * 3600, 4 * 3600))
+        self.assertEqual(accuracy['ratio'], 1.333)
+        self.assertGreater(result['throughput']['trend'], 0)
+
+        # Özetlenmemiş geçmiş günler okunmaz
+        self.assertEqual(analytics.productivity(self.user, self.today - timedelta(days=10), self.today - timedelta(days=4))['completed'], 0)
+
+    def test_analytics_endpoint(self):
+        self._done(1, 3)
+        analytics.rollup(self.today - timedelta(days=1), self.today)
+        response = self.client.get('/api/tasks/analytics/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['days']), 30)
+        self.assertEqual(response.data['completed'], 1)
+
+        start = (self.today - timedelta(days=1)).isoformat()
+        response = self.client.get(f'/api/tasks/analytics/?start={start}&end={start}')
+        self.assertEqual((response.data['completed'], response.data['lead_time']['p50'] is not None), (1, True))
+        for query in ('start=dün', f'start={self.today}&end={start}', 'start=2000-01-01'):
+            self.assertEqual(self.client.get(f'/api/tasks/analytics/?{query}').status_code, 400)
+
+
+class RecordingClient(StubClient):
+    """İstekleri kaydeden, istenirse hata veren yerel model istemcisi."""
+
+    def __init__(self, error=None):
+        super().__init__()
+        self.prompts = []
+        self.error = error
+
+    def generate(self, prompt):
+        self.prompts.append(prompt)
+        if self.error:
+            raise self.error
+        return super().generate(prompt)
+
+
+class EnrichmentTests(TestCase):
+    """AI zenginleştirme hattının testleri."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='user@example.com', password='pass')
+        self.config = {**get_enrichment_settings(), 'BATCH_SIZE': 2, 'CONCURRENCY': 1}
+
+    def _task(self, title, description='Rapor hazırlanacak. Ekler sonra.'):
+        return Task.objects.create(title=title, description=description, created_by=self.user, assigned_to=self.user)
+
+    def _pipeline(self, client):
+        return EnrichmentPipeline(client=client, config=self.config)
+
+    def test_batched_cached_and_rerun_only_on_content_change(self):
+        tasks = [self._task(f'Görev {i}') for i in range(3)] + [self._task('Görev 0'), self._task('Fatura', '')]
+        updated_at = Task.objects.get(pk=tasks[0].pk).updated_at
+        client = RecordingClient()
+        pipeline = self._pipeline(client)
+        self.assertEqual(pipeline.run_once(), 5)
+        # Aynı içerikli iki görev tek kez sorulur; 4 içerik, 2'şerli 2 istek
+        self.assertEqual(len(client.prompts), 2)
+        self.assertEqual(EnrichmentCache.objects.count(), 4)
+        task = Task.objects.get(pk=tasks[0].pk)
+        self.assertEqual(task.ai_summary, 'Rapor hazırlanacak.')
+        self.assertIn('rapor', task.ai_tags['tags'])
+        self.assertIn('Görev 0', task.ai_suggestions)
+        self.assertEqual(task.updated_at, updated_at)
+        self.assertEqual(Task.objects.get(pk=tasks[4].pk).ai_summary, 'Fatura')
+        self.assertTrue(ChangeLogEntry.objects.filter(object_id=task.pk, user=self.user).exists())
+        stats = pipeline.stats.as_dict()
+        self.assertEqual((stats['tasks'], stats['requests'], stats['failed']), (5, 2, 0))
+        self.assertGreater(stats['tokens_per_task'], 0)
+
+        # İçerik değişmediyse yeniden çalışmaz; değişen görev tek istekle
+        # işlenir, önbellekteki içerik modele gönderilmez
+        with self.assertNumQueries(1):
+            self.assertEqual(pipeline.run_once(), 0)
+        tasks[1].title = 'Görev 1 güncellendi'
+        tasks[1].save()
+        self._task('Görev 2')
+        self.assertEqual(pipeline.run_once(), 2)
+        self.assertEqual(len(client.prompts), 3)
+        self.assertEqual(pipeline.stats.cached, 1)
+        self.assertIn('güncellendi', Task.objects.get(pk=tasks[1].pk).ai_suggestions)
+
+    def test_failed_requests_and_concurrent_edits_are_not_written(self):
+        task = self._task('Sunum')
+        pipeline = self._pipeline(RecordingClient(error=RuntimeError('kota aşıldı')))
+        self.assertEqual(pipeline.run_once(), 0)
+        self.assertEqual((pipeline.stats.failed, pipeline.stats.last_error), (1, 'RuntimeError: kota aşıldı'))
+        self.assertEqual(Task.objects.get(pk=task.pk).ai_content_hash, '')
+
+        # Okunduktan sonra açıklaması değişen görevin eski içerik sonucu yazılmaz
+        pipeline = self._pipeline(RecordingClient())
+        [rows] = pipeline._stale()
+        Task.objects.filter(pk=task.pk).update(description='Yeni açıklama')
+        self.assertEqual(pipeline.enrich(rows), 0)
+        self.assertEqual(Task.objects.get(pk=task.pk).ai_summary, '')
+        self.assertEqual(self._pipeline(RecordingClient()).run_once(), 1)
+        self.assertEqual(Task.objects.get(pk=task.pk).ai_summary, 'Yeni açıklama')
@@ -0,0 +1,162 @@
+"""
+Ses içeriğine göre adreslenen (content-addressed) transkript önbelleği.
+
+Anahtar; yüklenen ses parçalarının akan (streaming) SHA-256 özeti, dil ve
+model boyutundan üretilir. Transkriptler diskte saklanır ve toplam boyut
+bütçeyi aşınca en az kullanılanlar (LRU) silinir.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from .transcription import get_transcription_settings
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+class AudioHasher:
+    """Ses parçalarını geldikçe özetleyen yardımcı sınıf."""
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+
+    def update(self, chunk):
+        self._hash.update(chunk)
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+
+def hash_file(path):
+    """Dosyayı parça parça okuyarak SHA-256 özetini döndürür."""
+    hasher = AudioHasher()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def hash_upload(uploaded_file):
+    """Yüklenen dosyanın parçalarını okuyarak SHA-256 özetini döndürür."""
+    hasher = AudioHasher()
+    for chunk in uploaded_file.chunks():
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class TranscriptCache:
+    """
+    Disk tabanlı, boyut bütçeli LRU transkript önbelleği.
+
+    Erişim sırası bellekte bir OrderedDict ile tutulur; dizin ilk kullanımda
+    dosya değiştirilme zamanlarına göre taranarak yeniden kurulur.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = None  # anahtar -> bayt boyutu (en eski başta)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(audio_hash, language, model_size):
+        return hashlib.sha256(
+            f'{audio_hash}:{language}:{model_size}'.encode('utf-8')
+        ).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f'{key}.txt')
+
+    def _load_index(self):
+        if self._entries is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith('.txt'):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def get(self, key):
+        """Önbellekteki transkripti döndürür; yoksa None."""
+        with self._lock:
+            self._load_index()
+            path = self._path(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except FileNotFoundError:
+                self._forget(key)
+                self.misses += 1
+                return None
+            # Diskteki zaman damgası, yeniden başlatmalarda LRU sırasını korur
+            os.utime(path)
+            self._entries[key] = self._entries.pop(key, len(text.encode('utf-8')))
+            self.hits += 1
+            return text
+
+    def set(self, key, text):
+        """Transkripti kaydeder ve bütçe aşıldıysa eski kayıtları siler."""
+        data = text.encode('utf-8')
+        with self._lock:
+            self._load_index()
+            path = self._path(key)
+            tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._forget(key)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def _forget(self, key):
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        """İsabet/ıska sayaçlarını ve doluluk bilgisini döndürür."""
+        with self._lock:
+            self._load_index()
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'size_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Ayarlara göre oluşturulmuş, süreç genelinde tek önbelleği döndürür."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            config = get_transcription_settings()
+            _cache = TranscriptCache(config['CACHE_DIR'], config['CACHE_MAX_BYTES'])
+        return _cache
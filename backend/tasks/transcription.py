@@ -0,0 +1,158 @@
+"""
+Whisper tabanlı ses tanıma motoru.
+
+Model ağırlıkları her istekte yeniden yüklenmesin diye kalıcı bir işçi
+(worker) süreç havuzu kullanılır. Her işçi süreci başlarken modeli bir kez
+yükler, ardından kuyruktan gelen işleri bellekte işleyip sonucu döndürür.
+"""
+import multiprocessing
+import os
+import threading
+from collections import deque
+
+from django.conf import settings
+
+DEFAULT_TRANSCRIPTION_SETTINGS = {
+    'MODEL': 'small',
+    'POOL_SIZE': 1,
+    'JOB_TIMEOUT': 300,
+    'JOB_STALE_SECONDS': 900,
+    'CACHE_MAX_BYTES': 50 * 1024 * 1024,
+    'STREAM_SEGMENT_SECONDS': 30,
+    'MAX_IN_MEMORY_BYTES': 25 * 1024 * 1024,
+}
+
+# İşçi süreç içinde yüklenen model (her süreçte bir kez)
+_worker_model = None
+_worker_load_error = None
+
+
+def get_transcription_settings():
+    """Varsayılan değerlerle birleştirilmiş TRANSCRIPTION ayarlarını döndürür."""
+    config = dict(DEFAULT_TRANSCRIPTION_SETTINGS)
+    config.update(getattr(settings, 'TRANSCRIPTION', {}))
+    config.setdefault('CACHE_DIR', os.path.join(settings.BASE_DIR, 'transcript_cache'))
+    return config
+
+
+def _init_worker(model_size):
+    """İşçi süreç başlatıcısı: Whisper modelini bir kez belleğe yükler."""
+    global _worker_model, _worker_load_error
+    try:
+        import whisper
+        _worker_model = whisper.load_model(model_size)
+    except Exception as e:
+        # Hata işlerde raporlanır; havuzun sürekli yeniden başlamasını önler
+        _worker_load_error = f'{type(e).__name__}: {e}'
+
+
+def _run_job(audio, language):
+    """İşçi süreçte tek bir dönüştürme işini çalıştırır."""
+    if _worker_model is None:
+        raise RuntimeError(f'Whisper modeli yüklenemedi: {_worker_load_error}')
+    result = _worker_model.transcribe(audio, language=language, fp16=False)
+    return result.get('text', '').strip()
+
+
+class TranscriptionTimeout(Exception):
+    """Dönüştürme işi belirlenen sürede tamamlanmadığında fırlatılır."""
+
+
+class TranscriptionEngine:
+    """
+    Whisper modelini bellekte tutan işçi süreç havuzu.
+
+    Havuz ilk işte tembel (lazy) olarak başlatılır. Zaman aşımına uğrayan
+    bir iş işçiyi meşgul bırakacağı için havuz sonlandırılıp yeniden kurulur.
+    worker(audio, language) ve initializer(model_size) işçi süreçte çalışan
+    modül düzeyi fonksiyonlardır; testlerde sahteleri verilir.
+    """
+
+    def __init__(self, model_size='small', pool_size=1, job_timeout=300,
+                 worker=_run_job, initializer=_init_worker, start_method='spawn'):
+        self.model_size = model_size
+        self.pool_size = pool_size
+        self.job_timeout = job_timeout
+        self.worker = worker
+        self.initializer = initializer
+        self.start_method = start_method
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                # Django iş parçacıklarını kopyalamamak için varsayılan 'spawn'dır
+                context = multiprocessing.get_context(self.start_method)
+                self._pool = context.Pool(
+                    processes=self.pool_size,
+                    initializer=self.initializer,
+                    initargs=(self.model_size,),
+                )
+            return self._pool
+
+    def transcribe(self, audio, language='tr', timeout=None):
+        """
+        Ses dosyası yolunu veya 16 kHz PCM dizisini metne dönüştürür.
+        Süre aşılırsa TranscriptionTimeout fırlatır.
+        """
+        return next(self.transcribe_many([audio], language=language, timeout=timeout))
+
+    def transcribe_many(self, audios, language='tr', timeout=None):
+        """
+        Ses bölütlerini havuza gönderir ve sonuçları sırayla üretir. audios
+        bir üreteç olabilir: bölütler geldikçe gönderilir ve sıradaki sonuç
+        hazırsa sonraki bölüt beklenmeden üretilir. İlk bölütün metni,
+        diğerleri işlenirken hazır olur.
+        """
+        timeout = timeout or self.job_timeout
+        pool = self._get_pool()
+        pending = deque()
+        for audio in audios:
+            pending.append(pool.apply_async(self.worker, (audio, language)))
+            while pending and pending[0].ready():
+                yield self._result(pool, pending.popleft(), timeout)
+        while pending:
+            yield self._result(pool, pending.popleft(), timeout)
+
+    def _result(self, pool, async_result, timeout):
+        try:
+            return async_result.get(timeout=timeout)
+        except multiprocessing.TimeoutError:
+            self._reset(pool)
+            raise TranscriptionTimeout(
+                f'Dönüştürme {timeout} saniyede tamamlanamadı.'
+            )
+
+    def _reset(self, pool):
+        """Takılan işçileri sonlandırır; sonraki iş yeni bir havuz açar."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.terminate()
+
+    def shutdown(self):
+        """Havuzu kapatır ve işçi süreçlerinin bitmesini bekler."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Ayarlara göre oluşturulmuş, süreç genelinde tek motoru döndürür."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            config = get_transcription_settings()
+            _engine = TranscriptionEngine(
+                model_size=config['MODEL'],
+                pool_size=config['POOL_SIZE'],
+                job_timeout=config['JOB_TIMEOUT'],
+            )
+        return _engine
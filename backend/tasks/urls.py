@@ -1,13 +1,38 @@
-from django.urls import path, include
+from django.urls import include, path, re_path
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import async_views, views
 
 # Router oluştur
 router = DefaultRouter()
+router.register(r'categories', views.CategoryViewSet, basename='category')
+router.register(r'tags', views.TagViewSet, basename='tag')
 router.register(r'tasks', views.TaskViewSet, basename='task')
+router.register(r'subtasks', views.SubtaskViewSet, basename='subtask')
+router.register(r'comments', views.TaskCommentViewSet, basename='task-comment')
+router.register(r'transcription-jobs', views.TranscriptionJobViewSet, basename='transcription-job')
+
+
+def _router_view(name):
+    """Router'ın ürettiği senkron görünüm; async görünümler buna devreder."""
+    return next(pattern.callback for pattern in router.urls if pattern.name == name)
+
+
+# Sık okunan uçların async görünümleri (bkz. tasks.async_views)
+async_urlpatterns = [
+    path('tasks/', async_views.task_list(_router_view('task-list'))),
+    path('tasks/my_tasks/', async_views.my_tasks(_router_view('task-my-tasks'))),
+    re_path(r'^tasks/(?P<pk>[0-9a-fA-F-]{36})/$', async_views.task_detail(_router_view('task-detail'))),
+    path('categories/', async_views.category_list(_router_view('category-list'))),
+]
 
 # URL patterns
 urlpatterns = [
+    # Router'ın tasks/<pk>/ kalıbından önce eşleşmelidir
+    path('tasks/events/', views.task_events, name='task-events'),
+    *(async_urlpatterns if async_views.get_async_read_settings()['ENABLED'] else []),
     path('', include(router.urls)),
     path('voice-to-text/', views.voice_to_text, name='voice-to-text'),
+    path('voice-to-text/cache-stats/', views.transcription_cache_stats, name='transcription-cache-stats'),
+    path('response-cache/stats/', views.response_cache_stats, name='response-cache-stats'),
+    path('realtime/stats/', views.realtime_stats, name='realtime-stats'),
 ] 
\ No newline at end of file
@@ -1,23 +1,57 @@
 from django.shortcuts import render
-from rest_framework import viewsets, permissions, filters, status
-from rest_framework.decorators import action, api_view, parser_classes
+from rest_framework import viewsets, mixins, permissions, filters, status
+from rest_framework.decorators import action, api_view, parser_classes, permission_classes
+from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
+from rest_framework.exceptions import NotFound, ValidationError
 from django.utils import timezone
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Category, Tag, Task, Subtask, TaskComment
+from .models import Category, Tag, Task, Subtask, TaskComment, TranscriptionJob
 from .serializers import (
     CategorySerializer, TagSerializer, TaskSerializer,
-    SubtaskSerializer, TaskCommentSerializer
+    SubtaskSerializer, TaskCommentSerializer, TranscriptionJobSerializer
 )
-from django.db import models
-import os
-import tempfile
-import subprocess
+from django.db import models, transaction
+from .transcription import get_engine, get_transcription_settings, TranscriptionTimeout
+from .transcript_cache import TranscriptCache, get_cache, hash_file, hash_upload
+from .audio import decode_upload, split_stream, stream_pcm, stream_upload, InMemoryAudioUploadHandler
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+from asgiref.sync import sync_to_async
+from .jobs import enqueue_job
+from .bulk import BulkTaskProcessor
+from . import ranking
+from .ranking import key_between
+from .pagination import KeysetPagination
+from .search import TaskSearchFilter
+from .conditional import task_validators
+from .response_cache import cache_response, get_stats as get_response_cache_stats
+from .changes import ChangeSet, changes_since, current_cursor, get_sync_settings, is_expired, task_updated
+from .stats import STATS_FIELDS, user_stats
+from .analytics import get_analytics_settings, productivity
+from .realtime import authenticate as authenticate_realtime, get_broker, sse_stream
 import json
+from datetime import date, timedelta
+from functools import wraps
 
 # Create your views here.
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class ThrottleOnceMixin:
+    """
+    Async okuma görünümünde sınırlaması uygulanıp senkron görünüme devredilen
+    istekleri (bkz. tasks.async_views) sınırlamaya ikinci kez saymaz.
+    """
+
+    def check_throttles(self, request):
+        if not getattr(request, 'throttles_checked', False):
+            super().check_throttles(request)
+
+
+class CategoryViewSet(ThrottleOnceMixin, viewsets.ModelViewSet):
     """
     Kategori işlemleri için ViewSet.
     
@@ -34,8 +68,18 @@ class CategoryViewSet(viewsets.ModelViewSet):
     ordering_fields = ['name', 'created_at']
 
     def get_queryset(self):
-        """Kullanıcıya ait kategorileri filtreler."""
-        return Category.objects.filter(created_by=self.request.user)
+        """Kullanıcıya ait kategorileri, görev sayılarıyla birlikte filtreler."""
+        return Category.objects.filter(created_by=self.request.user).annotate(
+            num_tasks=models.Count('tasks')
+        ).order_by('name')
+
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
 
 class TagViewSet(viewsets.ModelViewSet):
     """
@@ -50,7 +94,15 @@ class TagViewSet(viewsets.ModelViewSet):
         """Kullanıcıya ait etiketleri filtreler."""
         return Tag.objects.filter(created_by=self.request.user)
 
-class TaskViewSet(viewsets.ModelViewSet):
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+class TaskViewSet(ThrottleOnceMixin, viewsets.ModelViewSet):
     """
     Görev işlemleri için ViewSet.
     
@@ -58,13 +110,37 @@ class TaskViewSet(viewsets.ModelViewSet):
     - mark_complete: Görevi tamamlandı olarak işaretler
     - mark_in_progress: Görevi devam ediyor olarak işaretler
     - my_tasks: Kullanıcıya atanan görevleri listeler
+    - bulk: Oluşturma, güncelleme, durum değişikliği ve silme işlemlerini
+      toplu olarak uygular
+    - move: Görevi Kanban sütununda iki görev arasına (ve isteğe bağlı
+      olarak başka bir duruma) taşır
+    - sync: Bir cursor'dan bu yana oluşturulan, güncellenen ve silinen
+      görev, alt görev ve yorumları döndürür
+
+    Okuma isteklerinde yanıt alanları seçilebilir:
+    - ?view=compact: yalnızca id, title, status, priority, due_date, position
+    - ?fields=id,title,...: yalnızca belirtilen alanlar
+    - ?expand=subtasks,comments: kompakt/seyrek görünüme alan ekler
+
+    Listeler (created_at|due_date|priority, id) üzerinden cursor ile
+    sayfalanır; ?count=false toplam sayıyı atlar. ?search= tam metin
+    aramadır ve ?ordering= verilmezse sonuçlar ilgililiğe göre sıralanır.
+
+    Liste, detay ve my_tasks yanıtları kullanıcı ve sorgu parametrelerine
+    göre önbelleğe alınır; bkz. tasks.response_cache. Yanıtlar ETag ve
+    Last-Modified taşır, koşullu isteklere 304 döner.
     """
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = KeysetPagination
+    filter_backends = [DjangoFilterBackend, TaskSearchFilter, filters.OrderingFilter]
     filterset_fields = ['status', 'priority', 'category', 'tags']
     search_fields = ['title', 'description']
-    ordering_fields = ['created_at', 'due_date', 'priority']
+    ordering_fields = ['created_at', 'due_date', 'priority', 'position']
+    bulk_max_operations = 500
+    # Sıra anahtarları uzadığında taşınan kartın her iki yanında yeniden
+    # numaralanan en az kart sayısı
+    position_respace_window = 20
 
     def get_queryset(self):
         """
@@ -72,34 +148,363 @@ class TaskViewSet(viewsets.ModelViewSet):
         - Kullanıcının oluşturduğu görevler
         - Kullanıcıya atanan görevler
         """
+        queryset = Task.objects.visible_to(self.request.user)
+        return queryset.with_details(self.get_requested_fields())
+
+    def get_requested_fields(self):
+        """
+        ?fields=, ?view=compact ve ?expand= parametrelerinden serialize
+        edilecek alanları belirler. None tüm alanlar anlamına gelir.
+        """
+        if self.request.method != 'GET':
+            return None
+        params = self.request.query_params
+        if params.get('fields'):
+            fields = params['fields'].split(',')
+        elif params.get('view') == 'compact':
+            fields = list(TaskSerializer.COMPACT_FIELDS)
+        else:
+            return None
+        fields += params.get('expand', '').split(',')
+        fields = [f.strip() for f in fields if f.strip()]
+
+        unknown = set(fields) - set(TaskSerializer.Meta.fields)
+        if unknown:
+            raise ValidationError({'fields': f"Bilinmeyen alan(lar): {', '.join(sorted(unknown))}"})
+        return list(dict.fromkeys(fields))
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self.get_requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def perform_update(self, serializer):
+        # Durum değişikliğinin bildirim kaydı post_save sinyalinde yazılır;
+        # görevle aynı transaction'da olmalıdır
+        with transaction.atomic(savepoint=False):
+            serializer.save()
+
+    def get_validator_querysets(self):
+        """
+        Doğrulayıcıların hesaplandığı görevler ve toplam sayı sorgusu: detayda
+        tek görev, listede yalnızca istenen sayfa; toplam sayı yalnızca yanıtta
+        yer alıyorsa. Geçersiz UUID'de ValidationError.
+        """
         user = self.request.user
-        return Task.objects.filter(
-            models.Q(created_by=user) | models.Q(assigned_to=user)
-        ).distinct()
+        if self.action == 'retrieve':
+            return Task.objects.visible_to(user).filter(pk=self.kwargs['pk']), None
+        if self.action == 'my_tasks':
+            tasks = self.filter_queryset(Task.objects.filter(assigned_to=user))
+        else:
+            tasks = self.filter_queryset(Task.objects.visible_to(user))
+        total = tasks if self.paginator.include_count(self.request) else None
+        return self.paginator.page_queryset(tasks, self.request, view=self), total
+
+    def get_validators(self, variant):
+        """
+        Okunan görevlerin (detayda tek görev, listede istenen sayfa) ETag ve
+        Last-Modified değerleri; bkz. tasks.conditional.
+        """
+        try:
+            tasks, total = self.get_validator_querysets()
+            return task_validators(tasks, variant, total)
+        except DjangoValidationError:
+            # Geçersiz UUID; görünüm 404 döndürür
+            return None, None
+
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    def _update_visible_task(self, pk, changes, unless=None, owner_ids=None):
+        """
+        Kullanıcının görebildiği görevi tek bir koşullu UPDATE ile günceller;
+        yalnızca verilen alanlar yazılır. 'unless' koşulunu sağlayan satır
+        zaten hedef durumdadır ve değiştirilmez. Görev yoksa 404 döner.
+        Görevin sahipleri (owner_ids) bilinmiyorsa değişiklik bildirilmeden
+        önce sorgulanır. changes içindeki 'status' gerçek bir durum değişikliği
+        olmalıdır; sahiplere anlık olarak yayınlanır ve bildirim kuyruğuna
+        güncellemeyle aynı transaction'da yazılır. Durum değişikliğinde pano
+        sayaçlarının farkı için eski değerler ve sahipler UPDATE'ten önce
+        okunur; UPDATE okunan duruma koşulludur.
+        """
+        try:
+            tasks = Task.objects.visible_to(self.request.user).filter(pk=pk)
+            target = tasks.exclude(**unless) if unless else tasks
+            previous = None
+            with transaction.atomic(savepoint=False):
+                if 'status' in changes:
+                    row = target.select_for_update().values(
+                        *STATS_FIELDS, 'created_by_id', 'assigned_to_id'
+                    ).first()
+                    if row is None:
+                        updated = 0
+                    else:
+                        owner_ids = {row.pop('created_by_id'), row.pop('assigned_to_id')}
+                        previous = row
+                        updated = target.filter(status=row['status']).update(**changes)
+                else:
+                    updated = target.update(**changes)
+                if updated:
+                    # UPDATE sinyal göndermez; değişiklik burada bildirilir
+                    task_updated(pk, owner_ids, changes, previous)
+            if not updated and not tasks.exists():
+                raise NotFound()
+        except DjangoValidationError:
+            # Geçersiz UUID
+            raise NotFound()
+        return updated
 
     @action(detail=True, methods=['post'])
     def mark_complete(self, request, pk=None):
         """Görevi tamamlandı olarak işaretler."""
-        task = self.get_object()
-        task.status = 'done'
-        task.completed_at = timezone.now()
-        task.save()
+        now = timezone.now()
+        self._update_visible_task(
+            pk, {'status': 'done', 'completed_at': now, 'updated_at': now},
+            unless={'status': 'done'}
+        )
         return Response({'status': 'Görev tamamlandı olarak işaretlendi.'})
 
     @action(detail=True, methods=['post'])
     def mark_in_progress(self, request, pk=None):
         """Görevi devam ediyor olarak işaretler."""
-        task = self.get_object()
-        task.status = 'in_progress'
-        task.save()
+        self._update_visible_task(
+            pk, {'status': 'in_progress', 'updated_at': timezone.now()},
+            unless={'status': 'in_progress'}
+        )
         return Response({'status': 'Görev devam ediyor olarak işaretlendi.'})
 
+    @action(detail=True, methods=['post'])
+    def move(self, request, pk=None):
+        """
+        Görevi 'after' ve 'before' görevlerinin arasına taşır (biri boş
+        bırakılırsa sütunun başına/sonuna). 'status' verilirse görev o
+        sütuna geçer. Yalnızca bu görevin sıra anahtarı değişir; anahtar
+        çok uzadığında çevredeki görevler yeniden numaralanır.
+        """
+        after_id = request.data.get('after')
+        before_id = request.data.get('before')
+        new_status = request.data.get('status')
+        if new_status is not None and new_status not in dict(Task.STATUS_CHOICES):
+            raise ValidationError({'status': 'Geçersiz durum.'})
+
+        neighbour_ids = [value for value in (after_id, before_id) if value]
+        # Komşuların sırası ile taşınan görevin sahipleri ve durumu tek
+        # sorguda okunur
+        try:
+            rows = list(
+                Task.objects.visible_to(request.user)
+                .filter(pk__in=[pk, *neighbour_ids])
+                .values_list('pk', 'position', 'status', 'created_by_id', 'assigned_to_id')
+            )
+        except DjangoValidationError:
+            rows = []
+        positions = {str(key): position for key, position, _, _, _ in rows}
+        current_status, owner_ids = next(
+            ((task_status, set(users)) for key, _, task_status, *users in rows if str(key) == str(pk)),
+            (None, set())
+        )
+        if any(str(value) not in positions for value in neighbour_ids):
+            raise ValidationError({'detail': 'Komşu görev bulunamadı.'})
+
+        after = positions.get(str(after_id)) if after_id else None
+        before = positions.get(str(before_id)) if before_id else None
+        if after is not None and before is not None and after >= before:
+            raise ValidationError({'detail': "'after' görevi 'before' görevinden önce gelmelidir."})
+        position = key_between(after, before)
+
+        with transaction.atomic(savepoint=False):
+            if len(position) > ranking.MAX_KEY_LENGTH and str(pk) in positions:
+                position = self._respace_positions(pk, after, before)
+            now = timezone.now()
+            changes = {'position': position, 'updated_at': now}
+            if new_status is not None and new_status != current_status:
+                changes['status'] = new_status
+                if new_status == 'done':
+                    changes['completed_at'] = now
+            self._update_visible_task(pk, changes, owner_ids=owner_ids)
+        return Response({'id': pk, 'position': position, 'status': changes.get('status', current_status)})
+
+    def _crowded_positions(self, tasks):
+        """
+        Sıralı görevlerin başından en az position_respace_window görev ve
+        ardından gelen ilk kısa anahtar; görevler bitene kadar kısa anahtar
+        yoksa sınır None'dır.
+        """
+        rows = []
+        for row in tasks.values_list('pk', 'position', 'created_by_id', 'assigned_to_id').iterator(
+            chunk_size=self.position_respace_window + 1
+        ):
+            if len(rows) >= self.position_respace_window and len(row[1]) <= ranking.MAX_KEY_LENGTH // 2:
+                return rows, row[1]
+            rows.append(row)
+        return rows, None
+
+    def _respace_positions(self, pk, after, before):
+        """
+        after ile before arasına kısa bir anahtar sığmadığında çevredeki
+        görevleri sıraları korunarak eşit aralıklı anahtarlarla yeniden yazar
+        ve taşınan görevin anahtarını döndürür. Sıra anahtarları tüm
+        görevlerde ortak olduğundan görünürlüğe bakılmaz.
+        """
+        others = Task.objects.exclude(pk=pk)
+        lower, low = self._crowded_positions(
+            others.filter(position__lte=after).order_by('-position')
+        ) if after is not None else ([], None)
+        upper, high = self._crowded_positions(
+            others.filter(position__gte=before).order_by('position')
+        ) if before is not None else ([], None)
+
+        rows = lower[::-1] + [None] + upper
+        keys = ranking.keys_between(low, high, len(rows))
+        now = timezone.now()
+        Task.objects.bulk_update(
+            [Task(pk=row[0], position=key, updated_at=now) for row, key in zip(rows, keys) if row is not None],
+            ['position', 'updated_at'], batch_size=500,
+        )
+        # bulk_update sinyal göndermez; yeniden numaralanan görevler burada bildirilir
+        changes = ChangeSet()
+        changes.add_tasks((task_id, created_by_id, assigned_to_id) for task_id, _, created_by_id, assigned_to_id
+                          in lower + upper)
+        changes.commit()
+        return keys[len(lower)]
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        Toplu görev işlemleri. Gövde:
+        {"operations": [
+            {"op": "create", "data": {...}},
+            {"op": "update", "id": "...", "data": {...}},
+            {"op": "status", "id": "...", "status": "done"},
+            {"op": "delete", "id": "..."}
+        ]}
+        Geçerli işlemler tek transaction'da uygulanır; her işlem için sonuç
+        (başarılı/başarısız ve hatalar) istek sırasıyla döner.
+        """
+        operations = request.data.get('operations') if isinstance(request.data, dict) else None
+        if not isinstance(operations, list) or not operations:
+            raise ValidationError({'operations': 'İşlem listesi gereklidir.'})
+        if len(operations) > self.bulk_max_operations:
+            raise ValidationError({
+                'operations': f'En fazla {self.bulk_max_operations} işlem gönderilebilir.'
+            })
+
+        results = BulkTaskProcessor(request.user, request).run(operations)
+        failed = sum(not result['success'] for result in results)
+        return Response({
+            'results': results,
+            'succeeded': len(results) - failed,
+            'failed': failed,
+        })
+
     @action(detail=False)
+    def sync(self, request):
+        """
+        ?since=<cursor> sonrasındaki değişiklikler. Yanıt:
+        {"cursor": ..., "has_more": ...,
+         "tasks"|"subtasks"|"comments": {"created": [...], "updated": [...],
+                                         "deleted": [id, ...]}}
+        Görevler varsayılan olarak alt görev ve yorumları içermez; bunlar
+        kendi listeleriyle gelir. ?fields= / ?view= desteklenir. Cursor
+        budanmış kayıtlardan eskiyse 410 ve güncel cursor döner; istemci
+        tam senkronizasyon yapıp o cursor'dan devam etmelidir.
+        """
+        try:
+            since = int(request.query_params.get('since', 0))
+        except ValueError:
+            since = -1
+        if since < 0:
+            raise ValidationError({'since': 'Geçersiz cursor.'})
+        if is_expired(since):
+            return Response(
+                {'detail': 'Cursor süresi dolmuş; tam senkronizasyon gerekli.', 'cursor': current_cursor()},
+                status=status.HTTP_410_GONE
+            )
+
+        user = request.user
+        feed = changes_since(user, since, get_sync_settings()['PAGE_SIZE'])
+        fields = self.get_requested_fields() or [
+            name for name in TaskSerializer.Meta.fields if name not in ('subtasks', 'comments')
+        ]
+        sources = [
+            ('tasks', 'task', Task.objects.visible_to(user).with_details(fields),
+             lambda objects: self.get_serializer(objects, many=True, fields=fields)),
+            ('subtasks', 'subtask', Subtask.objects.visible_to(user).select_related('created_by', 'assigned_to'),
+             lambda objects: SubtaskSerializer(objects, many=True, context=self.get_serializer_context())),
+            ('comments', 'comment', TaskComment.objects.visible_to(user).select_related('user'),
+             lambda objects: TaskCommentSerializer(objects, many=True, context=self.get_serializer_context())),
+        ]
+
+        data = {'cursor': feed.cursor, 'has_more': feed.has_more}
+        for key, model, queryset, serializer in sources:
+            results = feed.objects[model]
+            live = [object_id for object_id, result in results.items() if result != 'deleted']
+            objects = list(queryset.filter(pk__in=live)) if live else []
+            found = {obj.pk for obj in objects}
+            group = {
+                'created': [],
+                'updated': [],
+                # Artık görünmeyen nesneler de silinmiş sayılır
+                'deleted': [str(object_id) for object_id in results if object_id not in found],
+            }
+            for obj, item in zip(objects, serializer(objects).data):
+                group[results[obj.pk]].append(item)
+            data[key] = group
+        return Response(data)
+
+    @action(detail=False)
+    @cache_response
     def my_tasks(self, request):
-        """Kullanıcıya atanan görevleri listeler."""
-        tasks = Task.objects.filter(assigned_to=request.user)
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        """
+        Kullanıcıya atanan görevleri listeler. Ana listeyle aynı filtre,
+        arama, sıralama ve cursor sayfalama parametrelerini destekler.
+        """
+        tasks = self.filter_queryset(
+            Task.objects.filter(assigned_to=request.user).with_details(
+                self.get_requested_fields()
+            )
+        )
+        page = self.paginate_queryset(tasks)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False)
+    def stats(self, request):
+        """
+        Görülen görevlerin pano istatistikleri: durum, öncelik ve kategori
+        başına sayılar, gecikmiş ve bu hafta tamamlanan görevler, tahmini ve
+        gerçek süre toplamları. Görevler listelenmeden sayaçlardan okunur.
+        """
+        return Response(user_stats(request.user))
+
+    @action(detail=False)
+    def analytics(self, request):
+        """
+        Kullanıcıya atanan ve tamamlanan görevlerin start..end (YYYY-AA-GG,
+        dahil) aralığındaki verimlilik analizi: günlük tamamlanan görev sayısı
+        ve eğilimi, tamamlanma süresi ve tahmin isabeti yüzdelikleri. Günlük
+        özetlerden okunur (bkz. tasks.analytics).
+        """
+        config = get_analytics_settings()
+        dates = {}
+        for name in ('start', 'end'):
+            value = request.query_params.get(name)
+            if value:
+                try:
+                    dates[name] = date.fromisoformat(value)
+                except ValueError:
+                    raise ValidationError({name: 'Geçersiz tarih; YYYY-AA-GG biçiminde olmalıdır.'})
+        end = dates.get('end') or timezone.localdate()
+        start = dates.get('start') or end - timedelta(days=config['DEFAULT_DAYS'] - 1)
+        if start > end:
+            raise ValidationError({'start': 'Başlangıç bitişten sonra olamaz.'})
+        if (end - start).days >= config['MAX_DAYS']:
+            raise ValidationError({'start': f"Aralık en fazla {config['MAX_DAYS']} gün olabilir."})
+        return Response(productivity(request.user, start, end))
 
 class SubtaskViewSet(viewsets.ModelViewSet):
     """
@@ -107,6 +512,8 @@ class SubtaskViewSet(viewsets.ModelViewSet):
     """
     serializer_class = SubtaskSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    ordering = ['created_at']
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['is_completed', 'parent_task']
 
@@ -116,12 +523,9 @@ class SubtaskViewSet(viewsets.ModelViewSet):
         - Kullanıcının oluşturduğu alt görevler
         - Kullanıcıya atanan alt görevler
         """
-        user = self.request.user
-        return Subtask.objects.filter(
-            models.Q(created_by=user) | 
-            models.Q(assigned_to=user) |
-            models.Q(parent_task__created_by=user)
-        ).distinct()
+        return Subtask.objects.visible_to(self.request.user).select_related(
+            'created_by', 'assigned_to'
+        )
 
 class TaskCommentViewSet(viewsets.ModelViewSet):
     """
@@ -129,6 +533,8 @@ class TaskCommentViewSet(viewsets.ModelViewSet):
     """
     serializer_class = TaskCommentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+    ordering = ['-created_at']
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['task']
 
@@ -139,68 +545,170 @@ class TaskCommentViewSet(viewsets.ModelViewSet):
         - Göreve atanmış ise tüm yorumlar
         - Kendi yazdığı yorumlar
         """
-        user = self.request.user
-        return TaskComment.objects.filter(
-            models.Q(task__created_by=user) |
-            models.Q(task__assigned_to=user) |
-            models.Q(user=user)
-        ).distinct()
+        return TaskComment.objects.visible_to(self.request.user).select_related('user')
+
+class TranscriptionJobViewSet(mixins.CreateModelMixin,
+                              mixins.RetrieveModelMixin,
+                              mixins.ListModelMixin,
+                              viewsets.GenericViewSet):
+    """
+    Asenkron ses-metin dönüştürme işleri için ViewSet.
+
+    create: Ses dosyasını alır, işi kuyruğa ekler ve iş kimliğini hemen döndürür
+    retrieve: İşin durumunu ve sonucunu getirir
+    """
+    serializer_class = TranscriptionJobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser, FormParser]
+
+    def get_queryset(self):
+        """Kullanıcının oluşturduğu işleri filtreler."""
+        return TranscriptionJob.objects.filter(created_by=self.request.user)
+
+    def create(self, request, *args, **kwargs):
+        """İşi oluşturur ve 202 Accepted ile döner."""
+        response = super().create(request, *args, **kwargs)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return response
+
+    def perform_create(self, serializer):
+        job = serializer.save()
+        enqueue_job(job)
+
+def _audio_cache_key(audio, language, audio_hash=None):
+    """Ses dosyası yolu veya yüklenen dosya için önbellek anahtarını üretir."""
+    if audio_hash is None:
+        audio_hash = hash_upload(audio) if isinstance(audio, UploadedFile) else hash_file(audio)
+    return TranscriptCache.make_key(audio_hash, language, get_transcription_settings()['MODEL'])
+
+def _to_model_input(audio):
+    """Yüklenen dosyaları, diske yazmadan PCM dizisine çözer."""
+    if isinstance(audio, UploadedFile):
+        return decode_upload(audio, get_transcription_settings()['MAX_IN_MEMORY_BYTES'])
+    return audio
+
+def _stream_model_input(audio):
+    """Yüklenen dosyaları ve ses dosyalarını ffmpeg ürettikçe PCM parçalarına çözer."""
+    if isinstance(audio, UploadedFile):
+        return stream_upload(audio, get_transcription_settings()['MAX_IN_MEMORY_BYTES'])
+    if isinstance(audio, str):
+        return stream_pcm(audio)
+    return [audio]
 
 # Ses dosyasını metne dönüştüren fonksiyon
-def convert_audio_to_text(audio_file_path, language='tr'):
+def convert_audio_to_text(audio, language='tr', audio_hash=None):
     """
-    Whisper API kullanarak ses dosyasını metne dönüştürür
+    Kalıcı Whisper işçi havuzunu kullanarak sesi metne dönüştürür.
+    Model her istekte yeniden yüklenmez; bkz. tasks.transcription.
+
+    audio bir dosya yolu ya da yüklenen dosya (UploadedFile) olabilir.
+    Aynı ses daha önce dönüştürüldüyse sonuç, ses çözülmeden önbellekten
+    döner. Ses özeti (audio_hash) verilmezse içerikten hesaplanır.
     """
     try:
-        # Whisper komutunu çalıştır
-        # Alternatif olarak çeşitli model boyutları kullanılabilir: tiny, base, small, medium, large
-        result = subprocess.run(
-            ['whisper', audio_file_path, '--language', language, '--model', 'small', '--output_format', 'json'],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        
-        # JSON dosyasını oku (Whisper, <dosya-adı>.json oluşturur)
-        json_file_path = os.path.splitext(audio_file_path)[0] + '.json'
-        
-        if os.path.exists(json_file_path):
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                transcription_data = json.load(f)
-                
-            # JSON dosyasını temizle
-            try:
-                os.remove(json_file_path)
-            except:
-                pass
-                
-            # Metni döndür
+        cache = get_cache()
+        cache_key = _audio_cache_key(audio, language, audio_hash)
+        text = cache.get(cache_key)
+        if text is not None:
             return {
                 'success': True,
-                'text': transcription_data.get('text', '')
+                'text': text,
+                'cached': True
             }
-        else:
-            return {
-                'success': False,
-                'error': 'Dönüştürme başarılı ancak JSON dosyası oluşturulamadı.'
-            }
-            
-    except subprocess.CalledProcessError as e:
+
+        text = get_engine().transcribe(_to_model_input(audio), language=language)
+        cache.set(cache_key, text)
+        return {
+            'success': True,
+            'text': text,
+            'cached': False
+        }
+    except TranscriptionTimeout as e:
         return {
             'success': False,
-            'error': f'Whisper API hatası: {e.stderr}'
+            'error': str(e)
         }
     except Exception as e:
         return {
             'success': False,
-            'error': f'Beklenmeyen hata: {str(e)}'
+            'error': f'Whisper hatası: {str(e)}'
         }
 
+def _sse_event(event, data):
+    """Server-sent events formatında tek bir olay üretir."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def stream_audio_to_text(audio, language='tr', audio_hash=None):
+    """
+    Sesi bölütlere ayırıp dönüştürür ve kısmi metinleri SSE olayları olarak
+    üretir. Ses çözüldükçe bölütler havuza gönderilir; ilk bölüt için
+    dosyanın tamamının çözülmesi beklenmez. Tam metin sonunda önbelleğe
+    yazılır.
+    """
+    config = get_transcription_settings()
+    try:
+        cache = get_cache()
+        cache_key = _audio_cache_key(audio, language, audio_hash)
+        text = cache.get(cache_key)
+        if text is not None:
+            yield _sse_event('done', {'success': True, 'text': text, 'cached': True})
+            return
+
+        bounds = []
+
+        def segments():
+            for start, end, pcm in split_stream(_stream_model_input(audio), config['STREAM_SEGMENT_SECONDS']):
+                bounds.append((start, end))
+                yield pcm
+
+        parts = []
+        # Sonuç yalnızca bölütü gönderildikten sonra geldiğinden sınırları bilinir
+        for index, part in enumerate(get_engine().transcribe_many(segments(), language=language)):
+            start, end = bounds[index]
+            parts.append(part)
+            yield _sse_event('partial', {
+                'index': index,
+                'start': round(start, 2),
+                'end': round(end, 2),
+                'text': part
+            })
+    except Exception as e:
+        yield _sse_event('error', {'success': False, 'error': f'Whisper hatası: {str(e)}'})
+        return
+
+    text = ' '.join(part for part in parts if part)
+    cache.set(cache_key, text)
+    yield _sse_event('done', {'success': True, 'text': text, 'cached': False})
+
+def audio_upload_handlers(view):
+    """
+    Ses yükleme handler'larını DRF görünümü çalışmadan önce kurar. Oturumla
+    gelen isteklerde SessionAuthentication CSRF kontrolü için gövdeyi kimlik
+    doğrulama sırasında ayrıştırır; handler'lar bundan önce ayarlanmalıdır.
+    CSRF kontrolü DRF'e bırakılır.
+    """
+    @csrf_exempt
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        request.upload_handlers = [
+            InMemoryAudioUploadHandler(
+                get_transcription_settings()['MAX_IN_MEMORY_BYTES'], request
+            ),
+            TemporaryFileUploadHandler(request),
+        ]
+        return view(request, *args, **kwargs)
+    return wrapper
+
+@audio_upload_handlers
 @api_view(['POST'])
 @parser_classes([MultiPartParser, FormParser])
 def voice_to_text(request):
     """
     Ses dosyasını alarak metne dönüştüren API endpoint'i
+
+    Eşik (TRANSCRIPTION['MAX_IN_MEMORY_BYTES']) altındaki yüklemeler diske
+    yazılmadan bellekte çözülür. ?stream=1 ile çağrılırsa ses bölütlere
+    ayrılır ve kısmi metinler text/event-stream olarak gönderilir.
     """
     if 'audio' not in request.FILES:
         return Response(
@@ -209,33 +717,62 @@ def voice_to_text(request):
         )
         
     audio_file = request.FILES['audio']
-    
-    # Geçici dosya oluştur
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-        # Gelen ses dosyasını geçici dosyaya yaz
-        for chunk in audio_file.chunks():
-            temp_file.write(chunk)
-        temp_file_path = temp_file.name
-    
-    try:
-        # Ses dosyasını metne dönüştür
-        result = convert_audio_to_text(temp_file_path)
-        
-        # Geçici dosyayı temizle
-        os.unlink(temp_file_path)
-        
-        if result['success']:
-            return Response(result, status=status.HTTP_200_OK)
-        else:
-            return Response(result, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    except Exception as e:
-        # Hata durumunda geçici dosyayı temizlemeyi dene
-        try:
-            os.unlink(temp_file_path)
-        except:
-            pass
-            
-        return Response(
-            {'success': False, 'error': f'Ses işleme hatası: {str(e)}'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    language = request.data.get('language', 'tr')
+
+    if request.query_params.get('stream') in ('1', 'true'):
+        response = StreamingHttpResponse(
+            stream_audio_to_text(audio_file, language),
+            content_type='text/event-stream'
         )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    # Ses dosyasını metne dönüştür
+    result = convert_audio_to_text(audio_file, language=language)
+    if result['success']:
+        return Response(result, status=status.HTTP_200_OK)
+    else:
+        return Response(result, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def transcription_cache_stats(request):
+    """
+    Transkript önbelleğinin isabet/ıska sayaçlarını döndürür.
+    """
+    return Response(get_cache().stats())
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def response_cache_stats(request):
+    """
+    Yanıt önbelleğinin (bu süreçteki) isabet oranını döndürür.
+    """
+    return Response(get_response_cache_stats().stats())
+
+@require_GET
+async def task_events(request):
+    """
+    Görev olaylarının (durum değişikliği, yeni yorum, tamamlanan alt görev)
+    Server-Sent Events akışı; ASGI sunucusu gerektirir. Kimlik Authorization
+    başlığı, ?token= veya oturumla doğrulanır.
+    """
+    user = await sync_to_async(authenticate_realtime)(request)
+    if user is None:
+        return JsonResponse(
+            {'detail': 'Kimlik doğrulama bilgileri verilmedi.'},
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+    response = StreamingHttpResponse(sse_stream(user.pk), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def realtime_stats(request):
+    """
+    Bu süreçteki anlık bağlantı ve yayın sayaçlarını döndürür.
+    """
+    return Response(get_broker().stats())
@@ -1,3 +1,155 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+import time
+from unittest import mock
 
-# Create your tests here.
+import jwt
+from asgiref.sync import async_to_sync
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from firebase_admin import auth
+from rest_framework import exceptions
+
+from backend.firebase_auth import FirebaseAuthentication, token_cache, user_cache
+from backend.token_verifiers import KeyStore, LocalKeyVerifier
+
+User = get_user_model()
+
+
+class FirebaseAuthenticationCacheTests(TestCase):
+    """Doğrulanmış token ve kullanıcı önbelleğinin testleri."""
+
+    def setUp(self):
+        token_cache.clear()
+        user_cache.clear()
+        self.addCleanup(token_cache.clear)
+        self.addCleanup(user_cache.clear)
+        self.user = User.objects.create_user(email='user@example.com', firebase_uid='uid-1')
+        self.request = RequestFactory().get('/', HTTP_AUTHORIZATION='Bearer token-1')
+        self.decoded = {'uid': 'uid-1', 'exp': time.time() + 3600}
+
+    def test_repeated_token_is_verified_once(self):
+        backend = FirebaseAuthentication()
+        with mock.patch('backend.token_verifiers.auth.verify_id_token',
+                        return_value=self.decoded) as verify:
+            backend.authenticate(self.request)
+            with self.assertNumQueries(0):
+                user, _ = backend.authenticate(self.request)
+
+        self.assertEqual(verify.call_count, 1)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_expired_token_is_verified_again(self):
+        self.decoded['exp'] = time.time() - 1
+        backend = FirebaseAuthentication()
+        with mock.patch('backend.token_verifiers.auth.verify_id_token',
+                        return_value=self.decoded) as verify:
+            backend.authenticate(self.request)
+            backend.authenticate(self.request)
+
+        self.assertEqual(verify.call_count, 2)
+
+    def test_user_update_invalidates_cached_user(self):
+        backend = FirebaseAuthentication()
+        with mock.patch('backend.token_verifiers.auth.verify_id_token',
+                        return_value=self.decoded):
+            backend.authenticate(self.request)
+            self.user.first_name = 'Ayşe'
+            self.user.save()
+            user, _ = backend.authenticate(self.request)
+
+        self.assertEqual(user.first_name, 'Ayşe')
+
+    def test_async_authentication_uses_the_same_caches(self):
+        backend = FirebaseAuthentication()
+        with mock.patch('backend.token_verifiers.auth.verify_id_token',
+                        return_value=self.decoded) as verify:
+            async_to_sync(backend.aauthenticate)(self.request)
+            with self.assertNumQueries(0):
+                user, _ = async_to_sync(backend.aauthenticate)(self.request)
+            backend.authenticate(self.request)
+
+        self.assertEqual(verify.call_count, 1)
+        self.assertEqual(user.pk, self.user.pk)
+        invalid = RequestFactory().get('/', HTTP_AUTHORIZATION='Bearer token-2')
+        with mock.patch('backend.token_verifiers.auth.verify_id_token',
+                        side_effect=auth.InvalidIdTokenError('geçersiz')):
+            with self.assertRaises(exceptions.AuthenticationFailed):
+                async_to_sync(backend.aauthenticate)(invalid)
+
+
+class LocalKeyVerifierTests(TestCase):
+    """Yerel anahtar çiftiyle süreç içi RS256 token doğrulama testleri."""
+
+    project_id = 'test-project'
+
+    def setUp(self):
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key()))
+        jwk.update({'kid': 'key-1', 'alg': 'RS256', 'use': 'sig'})
+        fd, self.jwks_path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'keys': [jwk]}, f)
+        self.addCleanup(os.remove, self.jwks_path)
+        self.verifier = LocalKeyVerifier(self.project_id, KeyStore(path=self.jwks_path))
+
+    def _token(self, kid='key-1', **claims):
+        now = int(time.time())
+        payload = {
+            'iss': f'https://securetoken.google.com/{self.project_id}',
+            'aud': self.project_id,
+            'sub': 'uid-1',
+            'iat': now,
+            'exp': now + 3600,
+            'auth_time': now,
+        }
+        payload.update(claims)
+        return jwt.encode(payload, self.private_key, algorithm='RS256', headers={'kid': kid})
+
+    def test_valid_token_is_verified_in_process(self):
+        claims = self.verifier.verify(self._token())
+        self.assertEqual(claims['uid'], 'uid-1')
+
+    def test_expired_token_is_rejected(self):
+        with self.assertRaises(auth.ExpiredIdTokenError):
+            self.verifier.verify(self._token(exp=int(time.time()) - 10))
+
+    def test_wrong_audience_and_unknown_key_are_rejected(self):
+        with self.assertRaises(auth.InvalidIdTokenError):
+            self.verifier.verify(self._token(aud='other-project'))
+        with self.assertRaises(auth.InvalidIdTokenError):
+            self.verifier.verify(self._token(kid='unknown'))
+
+    def test_rotated_key_is_fetched_once_for_unknown_kid(self):
+        store = self.verifier.key_store
+        store.get_key('key-1')
+        # Yeni imza anahtarı yayımlanır; zamanlanmış yenileme henüz gelmedi
+        rotated = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key()))
+        rotated.update({'kid': 'key-2', 'alg': 'RS256', 'use': 'sig'})
+        with open(self.jwks_path, 'w') as f:
+            json.dump({'keys': [rotated]}, f)
+        store._next_forced_attempt = 0
+
+        with mock.patch.object(store, '_fetch', wraps=store._fetch) as fetch:
+            self.assertEqual(self.verifier.verify(self._token(kid='key-2'))['uid'], 'uid-1')
+            # Bilinmeyen kid'ler retry_interval dolmadan yeniden yükleme yaptırmaz
+            for _ in range(3):
+                with self.assertRaises(auth.InvalidIdTokenError):
+                    self.verifier.verify(self._token(kid='bilinmeyen'))
+        fetch.assert_called_once()
+
+    def test_stale_keys_are_served_when_refresh_fails(self):
+        store = self.verifier.key_store
+        store.get_key('key-1')
+        os.remove(self.jwks_path)
+        open(self.jwks_path, 'w').close()
+        store._next_attempt = 0
+
+        with mock.patch('backend.token_verifiers.threading.Thread') as thread:
+            self.assertIsNotNone(store.get_key('key-1'))
+            thread.return_value.start.assert_called_once()
+        with self.assertRaises(Exception):
+            store.refresh()
+        self.assertIsNotNone(store.get_key('key-1'))